@@ -0,0 +1,116 @@
+"""Startup benchmark for VoiceDebate.
+
+Measures the cold import time of the entry point and of the modules that
+workers and tools import, each in fresh interpreters. Exits with status 1
+when a median exceeds the budget or an import loads a heavy dependency
+that should only be imported on first use.
+
+    python scripts/bench_startup.py --budget 0.5 --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+MODULES = [
+    "voicedebate.__main__",
+    "voicedebate.config",
+    "voicedebate.assistant",
+    "voicedebate.speech",
+    "voicedebate.conversation_logger",
+]
+# Loaded lazily by the services that need them
+HEAVY_MODULES = ["numpy", "anthropic", "openai", "deepgram", "aiohttp"]
+
+TIMER = (
+    "import json, sys, time; start = time.perf_counter(); "
+    "import {module}; "
+    "elapsed = time.perf_counter() - start; "
+    f"heavy = [name for name in {HEAVY_MODULES!r} if name in sys.modules]; "
+    "print(json.dumps([elapsed, heavy]))"
+)
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(SRC_DIR), env.get("PYTHONPATH")])
+    )
+    # Cold start: do not read or write bytecode caches
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def measure_once(module: str) -> tuple[float, list[str]]:
+    """Import time in seconds, measured in a fresh interpreter, and the
+    heavy modules the import loaded."""
+    result = subprocess.run(
+        [sys.executable, "-B", "-c", TIMER.format(module=module)],
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, heavy = json.loads(result.stdout.strip().splitlines()[-1])
+    return elapsed, heavy
+
+
+def slowest_imports(module: str, limit: int = 10) -> list[tuple[int, str]]:
+    """Modules with the largest cumulative import time, in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-B", "-X", "importtime", "-c", f"import {module}"],
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time: <self us> | <cumulative us> | <module>"
+        _, cumulative, name = line.split("|")
+        timings.append((int(cumulative), name.strip()))
+    return sorted(timings, reverse=True)[:limit]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--budget", type=float, default=0.5, help="median budget in seconds"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="number of runs")
+    args = parser.parse_args()
+
+    failed = False
+    for module in MODULES:
+        runs = [measure_once(module) for _ in range(args.runs)]
+        samples = [elapsed for elapsed, _ in runs]
+        median = statistics.median(samples)
+        print(
+            f"import {module}: median {median * 1000:.0f} ms, "
+            f"min {min(samples) * 1000:.0f} ms, max {max(samples) * 1000:.0f} ms "
+            f"over {args.runs} runs (budget {args.budget * 1000:.0f} ms)"
+        )
+
+        heavy = sorted({name for _, loaded in runs for name in loaded})
+        if heavy:
+            failed = True
+            print(f"  Loads {', '.join(heavy)}, which should be imported lazily")
+
+        if median > args.budget:
+            failed = True
+            print("  Over budget. Slowest imports (cumulative):")
+            for micros, name in slowest_imports(module):
+                print(f"    {micros / 1000:8.1f} ms  {name}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,20 +2,25 @@
 
 import asyncio
 import logging
-from kivy.config import Config
-
-# Configure Kivy before other imports
-Config.set("kivy", "exit_on_escape", "0")  # Disable escape key exit
-Config.set("graphics", "multisamples", "0")  # Fix potential OpenGL issues
-
-from .ui.app import VoiceDebateApp
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _configure_kivy():
+    """Configure Kivy; must run before any other Kivy module is imported."""
+    from kivy.config import Config
+
+    Config.set("kivy", "exit_on_escape", "0")  # Disable escape key exit
+    Config.set("graphics", "multisamples", "0")  # Fix potential OpenGL issues
+
+
 def main():
     """Run the application."""
+    _configure_kivy()
+    # The UI pulls in Kivy and every service, so import it only when running
+    from .ui.app import VoiceDebateApp
+
     try:
         # Set up asyncio event loop
         loop = asyncio.new_event_loop()
@@ -1,43 +1,78 @@
 """AI Assistant management for VoiceDebate."""
 
-import asyncio
 import logging
-from typing import Optional, Dict, Any
-import anthropic
-import openai
+from typing import AsyncIterator, Optional, Dict, Any
 from .config import config
 from .models import AssistantConfig
-from .character_loader import load_character_configs
+from .character_loader import character_registry
+from .debate import DebateOrchestrator, Player, Synthesizer
+from .history import ConversationHistory
+from .length_policy import LengthLimiter, ResponseLengthPolicy
+from .llm_clients import LLMClient, LLMRequest, llm_clients
+from .prompt_cache import (
+    CacheUsage,
+    build_claude_request,
+    log_cache_usage,
+    min_cacheable_tokens,
+)
+from .routing import ModelTarget, llm_router
+from .session import DEFAULT_SESSION, SessionState, SessionStore
 import random
-from pathlib import Path
-import json
 
 logger = logging.getLogger(__name__)
 
-# Configure API clients
-claude = anthropic.Anthropic(api_key=config.api.anthropic_api_key)
-openai.api_key = config.api.openai_api_key
+SUMMARY_PROMPT = (
+    "You maintain a running summary of a spoken debate. Keep the positions "
+    "each side has taken, questions still open and any agreements reached. "
+    "Write at most 150 words of plain prose."
+)
+SUMMARY_MAX_TOKENS = 300
 
+ERROR_MESSAGE = "I apologize, but I encountered an error while processing your input."
+# Marks a response the user cut off, so the model knows it was not heard
+INTERRUPTED_MARKER = "[interrupted by the user]"
 
-class Assistant:
-    """AI Assistant handler."""
-
-    def __init__(self, assistant_config: AssistantConfig):
-        self.config = assistant_config
-        self.conversation_history = []
-        self.character_data: Dict[str, Any] = {}  # Store the full character data
-        self._load_character_data()
 
-    def _load_character_data(self):
-        """Load the full character data from JSON."""
-        characters_dir = Path(__file__).parent / "data" / "characters"
-        character_file = characters_dir / f"{self.config.name.lower()}.json"
+class Character:
+    """Immutable character configuration shared by all sessions."""
 
+    def __init__(
+        self,
+        assistant_config: AssistantConfig,
+        character_data: Optional[Dict[str, Any]] = None,
+        content_hash: Optional[str] = None,
+    ):
+        self.config = assistant_config
+        self.character_data = character_data or {}  # The full character data
+        self.content_hash = content_hash  # None unless loaded from the registry
+        self.length_policy = ResponseLengthPolicy(
+            max_words=self.config.max_response_words,
+            max_sentences=self.config.max_response_sentences,
+        )
+        self.scripted_responses = self._load_scripted_responses()
+
+    @property
+    def client(self) -> LLMClient:
+        """Async client for this character's provider."""
+        return llm_clients.get(self.config.provider)
+
+    @property
+    def targets(self) -> list[ModelTarget]:
+        """Primary model followed by the configured fallbacks."""
+        return [ModelTarget(self.config.provider, self.config.model)] + [
+            ModelTarget(fallback["provider"], fallback["model"])
+            for fallback in self.config.fallback_models
+        ]
+
+    def _load_scripted_responses(self) -> list[str]:
+        """All scripted responses defined for this character."""
         try:
-            with open(character_file, "r", encoding="utf-8") as f:
-                self.character_data = json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading character data: {e}")
+            scripted_responses = self.character_data["character_definition"][
+                "speech_style"
+            ]["scripted_responses"]
+            return [line for lines in scripted_responses.values() for line in lines]
+        except KeyError:
+            return []
 
     def _should_use_scripted_response(self) -> bool:
         """Determine if we should use a scripted response (20% chance)."""
@@ -68,33 +103,157 @@ class Assistant:
         except (KeyError, IndexError):
             return None
 
+    def new_session_state(self) -> SessionState:
+        """Create empty conversation state for a new session."""
+        return SessionState(
+            ConversationHistory(
+                token_budget=self.config.history_token_budget,
+                summarizer=self.summarize,
+            )
+        )
+
+    async def summarize(self, summary: str, turns: list[dict]) -> str:
+        """Fold older turns into a running conversation summary."""
+        transcript = "\n".join(f"{msg['role']}: {msg['content']}" for msg in turns)
+        prompt = (
+            f"Current summary:\n{summary or '(none)'}\n\n"
+            f"New turns:\n{transcript}\n\n"
+            "Update the summary to include the new turns."
+        )
+
+        response = await self.client.complete(
+            LLMRequest(
+                model=self.config.model,
+                system=[{"type": "text", "text": SUMMARY_PROMPT}],
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.0,
+                max_tokens=SUMMARY_MAX_TOKENS,
+            )
+        )
+        return response.text
+
+
+class Assistant:
+    """AI Assistant handler for one character in one session."""
+
+    __slots__ = ("character", "session")
+
+    def __init__(self, character: Character, session: SessionState):
+        self.character = character
+        self.session = session
+
+    @property
+    def config(self) -> AssistantConfig:
+        return self.character.config
+
+    @property
+    def client(self) -> LLMClient:
+        return self.character.client
+
+    @property
+    def length_policy(self) -> ResponseLengthPolicy:
+        return self.character.length_policy
+
+    @property
+    def scripted_responses(self) -> list[str]:
+        return self.character.scripted_responses
+
+    @property
+    def history(self) -> ConversationHistory:
+        return self.session.history
+
+    @property
+    def cache_usage(self) -> CacheUsage:
+        return self.session.cache_usage
+
+    @property
+    def last_cache_usage(self) -> Optional[CacheUsage]:
+        return self.session.last_cache_usage
+
+    @property
+    def conversation_history(self) -> list[dict]:
+        """Messages currently kept verbatim in the request window."""
+        return self.history.messages
+
+    def pick_scripted_response(self) -> Optional[str]:
+        """Pick a scripted response for this turn if the policy allows one.
+
+        Scripted responses are never used to open a conversation, twice in a
+        row, or with the same line as the previous scripted turn.
+        """
+        last_response = self.history.messages[-1] if self.history.messages else None
+        if last_response is None or last_response["content"] in self.scripted_responses:
+            return None
+        if not self.character._should_use_scripted_response():
+            return None
+        return self.character._get_random_scripted_response()
+
     async def generate_response(self, user_input: str) -> str:
         """Generate a response from the AI assistant."""
         try:
             # Create message for current input
             current_message = {"role": "user", "content": user_input}
 
-            if self.config.provider == "claude":
-                # Get response before adding to history to avoid including it in the request
-                response = await self._generate_claude_response(current_message)
-            else:
-                response = await self._generate_gpt_response(current_message)
+            # Get response before adding to history to avoid including it in the request
+            response = await self._complete(current_message)
 
             # Add messages to history after getting response
-            self.conversation_history.append(current_message)
-            self.conversation_history.append({"role": "assistant", "content": response})
+            self.commit_turn(user_input, response)
 
             return response
 
         except Exception as e:
             logger.error(f"Error generating response: {e}")
-            error_msg = (
-                "I apologize, but I encountered an error while processing your input."
-            )
-            self.conversation_history.append(
-                {"role": "assistant", "content": error_msg}
-            )
-            return error_msg
+            self.history.append({"role": "assistant", "content": ERROR_MESSAGE})
+            return ERROR_MESSAGE
+
+    async def stream_response(self, user_input: str) -> AsyncIterator[str]:
+        """Stream a response from the AI assistant as text deltas."""
+        current_message = {"role": "user", "content": user_input}
+        chunks = []
+
+        try:
+            async for delta in self._stream(current_message):
+                chunks.append(delta)
+                yield delta
+
+        except Exception as e:
+            logger.error(f"Error streaming response: {e}")
+            if not chunks:
+                self.history.append({"role": "assistant", "content": ERROR_MESSAGE})
+                yield ERROR_MESSAGE
+                return
+
+        # Add messages to history once the stream has finished
+        self.commit_turn(user_input, "".join(chunks).strip())
+
+    async def speculate(self, user_input: str) -> str:
+        """Generate a response without recording the turn in history.
+
+        Errors are raised rather than turned into an apology, so a failed
+        speculation simply falls back to a normal request.
+        """
+        return await self._complete({"role": "user", "content": user_input})
+
+    def commit_turn(self, user_input: str, response: str):
+        """Record a completed user/assistant turn in history."""
+        self.history.add_turn(
+            {"role": "user", "content": user_input},
+            {"role": "assistant", "content": response},
+        )
+
+    def record_interruption(self, user_input: str, spoken: str, committed: bool):
+        """Record a turn the user cut off, keeping only what was spoken.
+
+        ``committed`` says whether the full response was already committed
+        to history, in which case it is replaced.
+        """
+        response = f"{spoken} {INTERRUPTED_MARKER}".strip()
+        messages = self.history.messages
+        if committed and messages and messages[-1]["role"] == "assistant":
+            messages[-1] = {"role": "assistant", "content": response}
+        else:
+            self.commit_turn(user_input, response)
 
     def get_conversation_history(self) -> list[dict]:
         """Get the full conversation history."""
@@ -106,89 +265,188 @@ class Assistant:
 
     def clear_history(self):
         """Clear conversation history."""
-        self.conversation_history = []
-
-    async def _generate_claude_response(self, current_message: dict) -> str:
-        """Generate response using Claude."""
+        self.history.clear()
+
+    def _build_request(self, current_message: dict) -> LLMRequest:
+        """Build the request for the current turn.
+
+        The Claude cache-friendly layout is used for every provider; other
+        providers benefit from the same stable prefix.
+        """
+        request = build_claude_request(
+            self.config.system_prompt,
+            self.conversation_history,
+            current_message,
+            summary=self.history.summary,
+            min_cache_tokens=min_cacheable_tokens(self.config.model),
+            cache_history=not self.history.trims_after(current_message),
+        )
+        return LLMRequest(
+            model=self.config.model,
+            system=request["system"],
+            messages=request["messages"],
+            temperature=self.config.temperature,
+            max_tokens=self.length_policy.max_tokens,
+            stop=self.length_policy.stop_sequences,
+        )
+
+    def _record_cache_usage(self, turn_usage: Optional[CacheUsage]):
+        """Record prompt cache usage reported for a turn."""
+        if turn_usage is None:
+            return
+        self.session.last_cache_usage = turn_usage
+        self.session.cache_usage.add(turn_usage)
+        log_cache_usage(self.config.name, turn_usage)
+
+    async def _complete(self, current_message: dict) -> str:
+        """Generate a full response from the provider."""
         try:
-            messages = self.conversation_history + [current_message]
-
-            # Add context about previous turns to help maintain conversation flow
-            context_prompt = "\nRECENT CONTEXT:\n"
-            for msg in self.conversation_history[-2:]:  # Last 2 messages
-                context_prompt += f"- {msg['role']}: {msg['content']}\n"
-
-            system_prompt = self.config.system_prompt + context_prompt
-
-            response = await asyncio.to_thread(
-                claude.messages.create,
-                model=self.config.model,
-                system=system_prompt,
-                messages=messages,
-                temperature=self.config.temperature,
-                max_tokens=1000,
+            response = await llm_router.complete(
+                self._build_request(current_message), self.character.targets
             )
-
-            return response.content[0].text.strip()
+            self._record_cache_usage(response.usage)
+            return self.length_policy.enforce(response.text)
 
         except Exception as e:
-            logger.error(f"Claude error: {e}")
+            logger.error(f"{self.client.provider} error: {e}")
             raise
 
-    async def _generate_gpt_response(self, current_message: dict) -> str:
-        """Generate response using GPT."""
+    async def _stream(self, current_message: dict) -> AsyncIterator[str]:
+        """Stream response text from the provider.
+
+        The stream is closed as soon as the response reaches the character's
+        sentence or word limit, which also ends the provider request.
+        """
+        limiter = LengthLimiter(self.length_policy)
+        stream = llm_router.stream(
+            self._build_request(current_message),
+            self.character.targets,
+            on_usage=self._record_cache_usage,
+        )
         try:
-            # Convert Anthropic format to OpenAI format
-            messages = [{"role": "system", "content": self.config.system_prompt}]
-
-            # Add conversation history and current message
-            for msg in self.conversation_history + [current_message]:
-                messages.append({"role": msg["role"], "content": msg["content"]})
+            async for delta in stream:
+                kept, done = limiter.feed(delta)
+                if kept:
+                    yield kept
+                if done:
+                    break
 
-            response = await openai.ChatCompletion.acreate(
-                model=self.config.model,
-                messages=messages,
-                temperature=self.config.temperature,
-                max_tokens=1000,
-            )
-
-            return response.choices[0].message.content
+            suffix = limiter.finish()
+            if suffix:
+                yield suffix
 
         except Exception as e:
-            logger.error(f"GPT error: {e}")
+            logger.error(f"{self.client.provider} error: {e}")
             raise
+        finally:
+            await stream.aclose()
 
 
 class AssistantManager:
     """Manager for multiple AI assistants."""
 
     def __init__(self):
-        self.assistants: dict[str, Assistant] = {}
-        self._load_default_assistants()
-
-    def _load_default_assistants(self):
-        """Load assistant configurations from JSON files."""
-        configs = load_character_configs()
-        for config in configs:
-            self.add_assistant(config)
-
-    def add_assistant(self, config: AssistantConfig):
+        self.registry = character_registry
+        self.characters: dict[str, Character] = {}  # Keyed by lowercase name
+        self._removed: set[str] = set()
+        self.sessions = SessionStore(
+            idle_timeout=config.session.idle_timeout,
+            max_sessions=config.session.max_sessions,
+        )
+
+    def add_assistant(self, assistant_config: AssistantConfig):
         """Add a new assistant."""
-        self.assistants[config.name] = Assistant(config)
+        key = assistant_config.name.lower()
+        self._removed.discard(key)
+        self.characters[key] = Character(assistant_config)
+
+    def get_character(self, name: str) -> Optional[Character]:
+        """Get a character, loading it from the registry on first use.
+
+        Characters backed by a file are rebuilt when the file changes; their
+        sessions carry on with the new configuration.
+        """
+        key = name.lower()
+        if key in self._removed:
+            return None
+        character = self.characters.get(key)
+        if character is not None and character.content_hash is None:
+            return character
 
-    def get_assistant(self, name: str) -> Optional[Assistant]:
-        """Get an assistant by name."""
-        return self.assistants.get(name)
+        compiled = self.registry.get(key)
+        if compiled is None:
+            self.characters.pop(key, None)
+            return None
+        if character is None or character.content_hash != compiled.content_hash:
+            character = self.characters[key] = Character(
+                compiled.config, compiled.data, compiled.content_hash
+            )
+        return character
+
+    def get_assistant(
+        self, name: str, session_id: str = DEFAULT_SESSION
+    ) -> Optional[Assistant]:
+        """Get an assistant by name, bound to a session's conversation state."""
+        character = self.get_character(name)
+        if character is None:
+            return None
+        state = self.sessions.get(
+            session_id, character.config.name, character.new_session_state
+        )
+        return Assistant(character, state)
 
     def list_assistants(self) -> list[str]:
         """List all available assistants."""
-        return list(self.assistants.keys())
+        names = {
+            key: character.config.name for key, character in self.characters.items()
+        }
+        for key in self.registry.names():
+            names.setdefault(key, key.title())
+        return [name for key, name in names.items() if key not in self._removed]
 
     def remove_assistant(self, name: str):
         """Remove an assistant."""
-        if name in self.assistants:
-            del self.assistants[name]
-
-
-# Create global instance
-assistant_manager = AssistantManager()
+        character = self.get_character(name)
+        if character is not None:
+            self.characters.pop(name.lower(), None)
+            self._removed.add(name.lower())
+            self.sessions.remove_character(character.config.name)
+
+    def end_session(self, session_id: str):
+        """Discard a session's conversation state for every assistant."""
+        self.sessions.end_session(session_id)
+
+    def create_debate(
+        self,
+        names: list[str],
+        synthesize: Synthesizer,
+        play: Player,
+        on_turn=None,
+        session_id: str = DEFAULT_SESSION,
+    ) -> DebateOrchestrator:
+        """Create a debate between the named assistants, in speaking order."""
+        assistants = []
+        for name in names:
+            assistant = self.get_assistant(name, session_id)
+            if assistant is None:
+                raise ValueError(f"Unknown assistant: {name}")
+            assistants.append(assistant)
+        return DebateOrchestrator(assistants, synthesize, play, on_turn=on_turn)
+
+
+_assistant_manager: Optional[AssistantManager] = None
+
+
+def get_assistant_manager() -> AssistantManager:
+    """Get the global assistant manager, creating it on first use."""
+    global _assistant_manager
+    if _assistant_manager is None:
+        _assistant_manager = AssistantManager()
+    return _assistant_manager
+
+
+def __getattr__(name: str):
+    # Keep ``from voicedebate.assistant import assistant_manager`` working
+    if name == "assistant_manager":
+        return get_assistant_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
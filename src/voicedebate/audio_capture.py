@@ -0,0 +1,270 @@
+"""Microphone capture with resampling for VoiceDebate."""
+
+import logging
+import math
+import threading
+from typing import TYPE_CHECKING, Callable, Optional, Union
+import numpy as np
+from .config import config
+
+if TYPE_CHECKING:
+    import sounddevice as sd
+
+logger = logging.getLogger(__name__)
+
+
+class RingBuffer:
+    """Preallocated 16-bit mono sample ring.
+
+    The audio callback writes and a consumer thread reads. When the
+    consumer falls behind, the oldest samples are overwritten so buffering
+    latency never exceeds the capacity; each such write counts as an
+    overrun.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._samples = np.zeros(capacity, dtype=np.int16)
+        self._lock = threading.Lock()
+        self._write = 0  # total samples written
+        self._read = 0  # total samples read
+        self.overruns = 0
+
+    @property
+    def available(self) -> int:
+        """Samples written but not yet read."""
+        return self._write - self._read
+
+    def write(self, samples: np.ndarray):
+        samples = samples[-self.capacity :]
+        count = len(samples)
+        with self._lock:
+            dropped = count - (self.capacity - (self._write - self._read))
+            if dropped > 0:
+                self._read += dropped
+                self.overruns += 1
+            start = self._write % self.capacity
+            first = min(count, self.capacity - start)
+            self._samples[start : start + first] = samples[:first]
+            self._samples[: count - first] = samples[first:]
+            self._write += count
+
+    def read(self, count: int) -> np.ndarray:
+        """Remove and return up to ``count`` of the oldest samples."""
+        with self._lock:
+            count = min(count, self._write - self._read)
+            start = self._read % self.capacity
+            first = min(count, self.capacity - start)
+            out = np.concatenate(
+                [
+                    self._samples[start : start + first],
+                    self._samples[: count - first],
+                ]
+            )
+            self._read += count
+        return out
+
+
+class PolyphaseResampler:
+    """Streaming rational-ratio resampler for mono audio.
+
+    A Kaiser-windowed sinc low-pass filter is split into ``up`` phases, so
+    each output sample costs one short dot product. Input history is carried
+    between calls, so chunk boundaries leave no clicks or gaps.
+    """
+
+    def __init__(self, from_rate: int, to_rate: int, half_width: int = 10):
+        divisor = math.gcd(from_rate, to_rate)
+        self.up = to_rate // divisor
+        self.down = from_rate // divisor
+
+        # Low-pass at the lower of the two Nyquist rates, designed at the
+        # upsampled rate
+        factor = max(self.up, self.down)
+        taps = 2 * half_width * factor + 1
+        n = np.arange(taps) - (taps - 1) / 2
+        kernel = np.sinc(n / factor) * np.kaiser(taps, 5.0) * self.up / factor
+
+        # Phase p uses taps p, p + up, p + 2*up, ...; reversed for dot products
+        self.phase_length = -(-taps // self.up)
+        padded = np.zeros(self.phase_length * self.up)
+        padded[:taps] = kernel
+        self._phases = padded.reshape(self.phase_length, self.up).T[:, ::-1].copy()
+
+        # Zero history stands in for the audio before the stream started
+        self._history = np.zeros(self.phase_length - 1)
+        self._start = 1 - self.phase_length  # input index of the history
+        self._produced = 0  # output samples so far
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample a chunk of 16-bit samples; returns 16-bit samples."""
+        data = np.concatenate([self._history, samples.astype(np.float64)])
+        end = self._start + len(data)  # input index after the chunk
+
+        # Output n needs input samples up to floor(n * down / up)
+        count = max(0, -(-end * self.up // self.down) - self._produced)
+        positions = (self._produced + np.arange(count)) * self.down
+        windows = positions // self.up - self._start - (self.phase_length - 1)
+        phases = positions % self.up
+
+        view = np.lib.stride_tricks.sliding_window_view(data, self.phase_length)
+        out = np.einsum("ij,ij->i", view[windows], self._phases[phases])
+        self._produced += count
+
+        # Keep the history the next output needs
+        keep_from = (
+            self._produced * self.down // self.up
+            - self._start
+            - (self.phase_length - 1)
+        )
+        self._history = data[keep_from:]
+        self._start += keep_from
+        return np.clip(np.round(out), -32768, 32767).astype(np.int16)
+
+
+class AudioCapture:
+    """Captures a microphone and delivers fixed-size 16-bit frames.
+
+    The sounddevice callback only copies samples into a ring buffer; a
+    worker thread takes ``frame_ms`` of audio at a time, resamples it from
+    the device rate to ``target_rate`` and passes the PCM bytes to
+    ``on_audio``. ``overruns`` counts times the buffer overflowed, either
+    in the device or because the consumer fell behind; ``underruns``
+    counts frames that arrived later than expected.
+    """
+
+    def __init__(
+        self,
+        on_audio: Callable[[bytes], None],
+        target_rate: int = 16000,
+        device: Optional[Union[int, str]] = None,
+        device_rate: Optional[int] = None,
+        frame_ms: int = 40,
+        buffer_seconds: float = 2.0,
+        latency: str = "low",
+    ):
+        self.on_audio = on_audio
+        self.target_rate = target_rate
+        self.device = device
+        self.device_rate = device_rate
+        self.frame_ms = frame_ms
+        self.buffer_seconds = buffer_seconds
+        self.latency = latency
+        self.overruns = 0
+        self.underruns = 0
+        self.frames = 0
+        self._buffer: Optional[RingBuffer] = None
+        self._ready = threading.Condition()
+        self._running = False
+        self._stream: Optional["sd.InputStream"] = None
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def buffered_seconds(self) -> float:
+        """Captured audio waiting to be delivered."""
+        if not self._buffer or not self.device_rate:
+            return 0.0
+        return self._buffer.available / self.device_rate
+
+    @property
+    def latency_seconds(self) -> float:
+        """The input stream's reported latency."""
+        return self._stream.latency if self._stream else 0.0
+
+    def start(self):
+        import sounddevice as sd
+
+        if self._running:
+            return
+        if self.device_rate is None:
+            info = sd.query_devices(self.device, "input")
+            self.device_rate = int(info["default_samplerate"])
+
+        self._buffer = RingBuffer(int(self.device_rate * self.buffer_seconds))
+        self._resampler = (
+            PolyphaseResampler(self.device_rate, self.target_rate)
+            if self.device_rate != self.target_rate
+            else None
+        )
+        self._stream = sd.InputStream(
+            samplerate=self.device_rate,
+            channels=1,
+            dtype="int16",
+            device=self.device,
+            latency=self.latency,
+            callback=self._callback,
+        )
+        self._running = True
+        self._worker = threading.Thread(
+            target=self._deliver, name="audio-capture", daemon=True
+        )
+        self._worker.start()
+        self._stream.start()
+        logger.info(
+            f"Capturing audio at {self.device_rate} Hz, "
+            f"delivering {self.frame_ms} ms frames at {self.target_rate} Hz"
+        )
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        with self._ready:
+            self._ready.notify()
+        if self._worker is not None:
+            self._worker.join(timeout=1.0)
+            self._worker = None
+        self.overruns += self._buffer.overruns
+        logger.info(
+            f"Audio capture stopped: {self.frames} frames, "
+            f"{self.overruns} overruns, {self.underruns} underruns"
+        )
+
+    def _callback(self, indata, frames, time_info, status):
+        if status.input_overflow:
+            self.overruns += 1
+        self._buffer.write(indata[:, 0])
+        with self._ready:
+            self._ready.notify()
+
+    def _deliver(self):
+        """Worker thread: pass on one frame whenever enough audio is buffered."""
+        frame_size = self.device_rate * self.frame_ms // 1000
+        # The device delivers in its own block sizes; allow for some jitter
+        deadline = 2 * self.frame_ms / 1000 + self.latency_seconds
+        while self._running:
+            with self._ready:
+                arrived = self._ready.wait_for(
+                    lambda: self._buffer.available >= frame_size or not self._running,
+                    timeout=deadline,
+                )
+            if not self._running:
+                break
+            if not arrived:
+                self.underruns += 1
+                continue
+
+            samples = self._buffer.read(frame_size)
+            if self._resampler is not None:
+                samples = self._resampler.process(samples)
+            self.frames += 1
+            try:
+                self.on_audio(samples.tobytes())
+            except Exception as e:
+                logger.error(f"Error handling captured audio: {e}")
+
+
+def create_capture(on_audio: Callable[[bytes], None], target_rate: int) -> AudioCapture:
+    """An ``AudioCapture`` configured from ``config.audio``."""
+    return AudioCapture(
+        on_audio,
+        target_rate=target_rate,
+        device=config.audio.capture_device,
+        device_rate=config.audio.capture_sample_rate,
+        frame_ms=config.audio.capture_chunk_ms,
+        buffer_seconds=config.audio.capture_buffer_seconds,
+    )
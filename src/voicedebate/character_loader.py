@@ -1,44 +1,142 @@
 """Character configuration loader for VoiceDebate."""
 
+import hashlib
 import json
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
+from .history import estimate_tokens
 from .models import AssistantConfig
 
 logger = logging.getLogger(__name__)
 
+# Response length rules every character prompt enforces
+MAX_RESPONSE_WORDS = 30
+MAX_RESPONSE_SENTENCES = 1
+
+
+CHARACTERS_DIR = Path(__file__).parent / "data" / "characters"
+
+
+@dataclass
+class CompiledCharacter:
+    """A parsed character file with its compiled system prompt."""
+
+    config: AssistantConfig
+    data: Dict[str, Any]
+    content_hash: str
+    prompt_tokens: int
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    compiled: CompiledCharacter
+
+
+class CharacterRegistry:
+    """Character files parsed on first use and reloaded when they change.
+
+    Each file is read and parsed once per change. Compiled characters are
+    keyed by a hash of the file contents, so touching a file without
+    changing it does not rebuild the prompt. Only the current version of
+    each file is kept.
+    """
+
+    def __init__(self, characters_dir: Path = CHARACTERS_DIR):
+        self.characters_dir = Path(characters_dir)
+        self._entries: Dict[str, _Entry] = {}
+        self._compiled: Dict[str, CompiledCharacter] = {}
+
+    def _path(self, name: str) -> Path:
+        return self.characters_dir / f"{name.lower()}.json"
+
+    def names(self) -> List[str]:
+        """Names of the available characters, without loading them."""
+        return sorted(path.stem for path in self.characters_dir.glob("*.json"))
+
+    def get(self, name: str) -> Optional[CompiledCharacter]:
+        """Get a character, loading or reloading its file if needed."""
+        key = name.lower()
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+
+        entry = self._entries.get(key)
+        if entry and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+            return entry.compiled
+
+        try:
+            compiled = self._load(path)
+        except Exception as e:
+            logger.error(f"Error loading character {path.name}: {e}")
+            # Keep serving the last good version of an edited file
+            return entry.compiled if entry else None
+
+        if entry and entry.compiled.content_hash != compiled.content_hash:
+            self._compiled.pop(entry.compiled.content_hash, None)
+            logger.info(f"Reloaded character configuration: {compiled.config.name}")
+        self._entries[key] = _Entry(stat.st_mtime_ns, stat.st_size, compiled)
+        return compiled
+
+    def _load(self, path: Path) -> CompiledCharacter:
+        raw = path.read_bytes()
+        content_hash = hashlib.sha256(raw).hexdigest()
+        compiled = self._compiled.get(content_hash)
+        if compiled is None:
+            data = json.loads(raw)
+            config = _build_config(data)
+            compiled = self._compiled[content_hash] = CompiledCharacter(
+                config=config,
+                data=data,
+                content_hash=content_hash,
+                prompt_tokens=estimate_tokens(config.system_prompt),
+            )
+            logger.info(
+                f"Loaded character configuration: {config.name} "
+                f"({compiled.prompt_tokens} prompt tokens)"
+            )
+        return compiled
+
+    def _forget(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._compiled.pop(entry.compiled.content_hash, None)
+
 
 def load_character_configs() -> List[AssistantConfig]:
     """Load all character configurations from JSON files."""
-    characters_dir = Path(__file__).parent / "data" / "characters"
     configs = []
+    for name in character_registry.names():
+        compiled = character_registry.get(name)
+        if compiled:
+            configs.append(compiled.config)
+    return configs
 
-    try:
-        for json_file in characters_dir.glob("*.json"):
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-                # Convert JSON data to AssistantConfig
-                config = AssistantConfig(
-                    name=data["name"],
-                    description=data["description"],
-                    system_prompt=_build_system_prompt(data),
-                    provider=data["model_config"]["provider"],
-                    model=data["model_config"]["model"],
-                    temperature=data["model_config"]["temperature"],
-                    voice_id=data["voice"]["id"],
-                    voice_stability=data["voice"]["stability"],
-                    voice_clarity=data["voice"]["clarity"],
-                    voice_style=data["voice"]["style"],
-                )
-                configs.append(config)
-                logger.info(f"Loaded character configuration: {config.name}")
-
-    except Exception as e:
-        logger.error(f"Error loading character configurations: {e}")
 
-    return configs
+def _build_config(data: Dict) -> AssistantConfig:
+    """Convert character JSON data to an AssistantConfig."""
+    return AssistantConfig(
+        name=data["name"],
+        description=data["description"],
+        system_prompt=_build_system_prompt(data),
+        provider=data["model_config"]["provider"],
+        model=data["model_config"]["model"],
+        temperature=data["model_config"]["temperature"],
+        voice_id=data["voice"]["id"],
+        voice_stability=data["voice"]["stability"],
+        voice_clarity=data["voice"]["clarity"],
+        voice_style=data["voice"]["style"],
+        history_token_budget=data["model_config"].get("history_token_budget", 2000),
+        fallback_models=data["model_config"].get("fallbacks", []),
+        max_response_words=MAX_RESPONSE_WORDS,
+        max_response_sentences=MAX_RESPONSE_SENTENCES,
+    )
 
 
 def _build_system_prompt(character_data: Dict) -> str:
@@ -46,7 +144,7 @@ def _build_system_prompt(character_data: Dict) -> str:
     prompt_parts = [
         "CORE RESPONSE RULES:",
         "- You MUST respond with EXACTLY ONE sentence or question.",
-        "- Your response MUST NOT be longer than 30 words.",
+        f"- Your response MUST NOT be longer than {MAX_RESPONSE_WORDS} words.",
         "- Your response MUST use basic punctuation (period or question mark).",
         "- Your response MUST NOT contain multiple sentences or compound sentences.",
         "- Your response MUST NOT use semicolons or conjunctions to combine thoughts.",
@@ -75,7 +173,12 @@ def _build_system_prompt(character_data: Dict) -> str:
         "- " + "\n- ".join(character_data["interaction_guidelines"]["must_rules"]),
         "\nMust Not Rules:",
         "- " + "\n- ".join(character_data["interaction_guidelines"]["must_not_rules"]),
-        "\nFINAL REMINDER: Respond with exactly one sentence or question, no more than 30 words.",
+        "\nFINAL REMINDER: Respond with exactly one sentence or question, "
+        f"no more than {MAX_RESPONSE_WORDS} words.",
     ]
 
     return "\n".join(prompt_parts)
+
+
+# Global instance
+character_registry = CharacterRegistry()
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 from pydantic import BaseModel
 
 
@@ -29,21 +29,216 @@ class ThemeConfig(BaseModel):
     }
 
 
+class LLMConfig(BaseModel):
+    """LLM client configuration."""
+
+    request_timeout: float = 30.0  # seconds
+    connect_timeout: float = 5.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+
+    # Start generating on interim transcripts before the user has finished
+    speculative: bool = False
+    speculative_min_words: int = 3
+
+    # Hedged requests to fallback models
+    hedge_default_deadline: float = 2.0  # seconds, until enough samples exist
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 5
+
+
+class ProviderLimits(BaseModel):
+    """Rate limit, retry and circuit breaker settings for one provider."""
+
+    requests_per_second: float = 5.0
+    burst: int = 10
+    max_attempts: int = 3
+    base_delay: float = 0.25  # seconds
+    max_delay: float = 4.0
+    deadline: float = 20.0
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+
+class ResilienceConfig(BaseModel):
+    """Per-provider resilience settings."""
+
+    anthropic: ProviderLimits = ProviderLimits()
+    openai: ProviderLimits = ProviderLimits()
+    elevenlabs: ProviderLimits = ProviderLimits(requests_per_second=3.0, burst=6)
+    deepgram: ProviderLimits = ProviderLimits(requests_per_second=1.0, burst=3)
+
+
+class SessionConfig(BaseModel):
+    """Conversation session settings."""
+
+    idle_timeout: float = 1800.0  # seconds before an idle session is dropped
+    max_sessions: int = 1000
+
+
+class AudioConfig(BaseModel):
+    """Audio capture and playback settings."""
+
+    # The live transcription connection is kept open across turns; Deepgram
+    # closes it after 10 s without audio or a KeepAlive
+    stt_keepalive_interval: float = 5.0
+    stt_finalize_timeout: float = 1.0  # wait for the last words of a turn
+    capture_device: Optional[Union[int, str]] = None  # sounddevice input
+    capture_sample_rate: Optional[int] = None  # device default if unset
+    capture_chunk_ms: int = 40  # audio per frame sent for transcription
+    capture_buffer_seconds: float = 2.0  # older audio is dropped beyond this
+    # Local voice activity detection ends the turn after vad_hangover_ms
+    # of silence
+    vad_hangover_ms: int = 800
+    vad_min_speech_ms: int = 60
+    vad_energy_margin_db: float = 12.0  # above the adaptive noise floor
+    vad_max_speech_ms: int = 30000  # a turn ends after this much speech
+    # Let the user interrupt the assistant by talking over it. Detection
+    # is stricter than for turn endings and is measured against the level
+    # being played, as the microphone also picks up the assistant's voice.
+    # Without echo cancellation this is only reliable with headphones
+    barge_in: bool = False
+    barge_in_min_speech_ms: int = 200
+    barge_in_margin_db: float = 18.0
+    # Stream audio for transcription only while the local VAD hears speech,
+    # starting with mic_gate_preroll_ms of audio from before it did
+    mic_gate: bool = True
+    mic_gate_preroll_ms: int = 500
+    tts_sample_rate: int = 22050  # ElevenLabs pcm_16000/22050/24000/44100
+    playback_buffer_seconds: float = 60.0  # preallocated, grows if exceeded
+    tts_parallelism: int = 3  # sentences synthesized at once
+    # Push response text to ElevenLabs over a websocket as it is generated,
+    # instead of one HTTP request per sentence
+    tts_streaming_input: bool = False
+    tts_max_connections: int = 8
+    tts_keepalive: float = 60.0  # seconds an idle connection is kept
+    tts_connect_timeout: float = 5.0
+    tts_read_timeout: float = 15.0
+    tts_cache: bool = True  # keep scripted and repeated lines on disk
+    tts_cache_max_mb: float = 200.0
+
+    @property
+    def tts_output_format(self) -> str:
+        return f"pcm_{self.tts_sample_rate}"
+
+
+class EndpointConfig(BaseModel):
+    """Provider API base URLs; unset values use each SDK's default."""
+
+    anthropic_base_url: Optional[str] = None
+    openai_base_url: Optional[str] = None
+    elevenlabs_base_url: str = "https://api.elevenlabs.io/v1"
+    deepgram_url: Optional[str] = None
+
+
+class FakeProfile(BaseModel):
+    """Behaviour of one local stand-in provider service."""
+
+    latency_ms: float = 50.0  # median delay before the first byte
+    latency_sigma: float = 0.0  # lognormal spread of the latency, 0 = fixed
+    error_rate: float = 0.0  # fraction of requests answered with an error
+    error_status: int = 503
+    chunk_interval_ms: float = 20.0  # delay between streamed chunks
+    chunk_size: int = 2  # words per LLM delta, or KiB per audio chunk
+
+
+class FakesConfig(BaseModel):
+    """Local stand-in provider services for offline testing."""
+
+    host: str = "127.0.0.1"
+    port: int = 8765
+    seed: Optional[int] = None
+    # Named profile (voicedebate.fakes.PROFILES) applied to every service
+    # when the fakes start; unset keeps the per-service profiles below
+    profile: Optional[str] = None
+    anthropic: FakeProfile = FakeProfile(latency_ms=400.0, latency_sigma=0.3)
+    openai: FakeProfile = FakeProfile(latency_ms=350.0, latency_sigma=0.3)
+    elevenlabs: FakeProfile = FakeProfile(
+        latency_ms=250.0, latency_sigma=0.3, chunk_size=4
+    )
+    deepgram: FakeProfile = FakeProfile(latency_ms=150.0, latency_sigma=0.2)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def endpoints(self) -> EndpointConfig:
+        """Endpoints that route every provider to these services."""
+        return EndpointConfig(
+            anthropic_base_url=self.base_url,
+            openai_base_url=f"{self.base_url}/v1",
+            elevenlabs_base_url=f"{self.base_url}/v1",
+            deepgram_url=self.base_url,
+        )
+
+
 class Config(BaseModel):
     """Main configuration."""
 
     api: APIConfig
     theme: ThemeConfig
+    llm: LLMConfig
+    resilience: ResilienceConfig
+    session: SessionConfig
+    audio: AudioConfig
+    endpoints: EndpointConfig
+    fakes: FakesConfig
     data_dir: Path = Path.home() / ".voicedebate" / "data"
 
 
+# Route all providers to the local fake services (python -m voicedebate.fakes)
+_use_fakes = os.getenv("USE_FAKE_SERVICES", "false").lower() == "true"
+_fakes = FakesConfig(
+    host=os.getenv("FAKES_HOST", "127.0.0.1"),
+    port=int(os.getenv("FAKES_PORT", "8765")),
+    profile=os.getenv("FAKES_PROFILE") or None,
+)
+_default_key = "fake-key" if _use_fakes else ""
+
+# Input device index or a substring of its name
+_capture_device: Optional[Union[int, str]] = os.getenv("CAPTURE_DEVICE") or None
+if _capture_device and _capture_device.isdigit():
+    _capture_device = int(_capture_device)
+
 # Load configuration
 config = Config(
     api=APIConfig(
-        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
-        openai_api_key=os.getenv("OPENAI_API_KEY", ""),
-        elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY", ""),
-        deepgram_api_key=os.getenv("DEEPGRAM_API_KEY", ""),
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", _default_key),
+        openai_api_key=os.getenv("OPENAI_API_KEY", _default_key),
+        elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY", _default_key),
+        deepgram_api_key=os.getenv("DEEPGRAM_API_KEY", _default_key),
     ),
     theme=ThemeConfig(),
+    llm=LLMConfig(
+        request_timeout=float(os.getenv("LLM_REQUEST_TIMEOUT", "30")),
+        max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "20")),
+        speculative=os.getenv("LLM_SPECULATIVE", "false").lower() == "true",
+    ),
+    resilience=ResilienceConfig(),
+    session=SessionConfig(),
+    audio=AudioConfig(
+        tts_streaming_input=os.getenv("TTS_STREAMING_INPUT", "false").lower() == "true",
+        barge_in=os.getenv("BARGE_IN", "false").lower() == "true",
+        mic_gate=os.getenv("MIC_GATE", "true").lower() == "true",
+        capture_device=_capture_device,
+        capture_sample_rate=(
+            int(os.getenv("CAPTURE_SAMPLE_RATE"))
+            if os.getenv("CAPTURE_SAMPLE_RATE")
+            else None
+        ),
+    ),
+    endpoints=(
+        _fakes.endpoints()
+        if _use_fakes
+        else EndpointConfig(
+            anthropic_base_url=os.getenv("ANTHROPIC_BASE_URL"),
+            openai_base_url=os.getenv("OPENAI_BASE_URL"),
+            elevenlabs_base_url=os.getenv(
+                "ELEVENLABS_BASE_URL", "https://api.elevenlabs.io/v1"
+            ),
+            deepgram_url=os.getenv("DEEPGRAM_URL"),
+        )
+    ),
+    fakes=_fakes,
 )
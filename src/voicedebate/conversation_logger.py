@@ -18,6 +18,9 @@ class ConversationTurn:
     timestamp: str
     speaker: str  # "User" or assistant name + model (e.g., "Socrates (Claude-3)")
     message: str
+    # Stage offsets and interval durations in ms (see metrics.TurnTimeline)
+    timings: Optional[Dict[str, Dict[str, float]]] = None
+    interrupted: bool = False  # message holds only what was spoken
 
 
 @dataclass
@@ -57,8 +60,15 @@ class ConversationLogger:
             logger.error(f"Error starting conversation: {e}")
             raise
 
-    def log_turn(self, speaker: str, message: str, model: Optional[str] = None):
-        """Log a single conversation turn."""
+    def log_turn(
+        self,
+        speaker: str,
+        message: str,
+        model: Optional[str] = None,
+        timings: Optional[Dict[str, Dict[str, float]]] = None,
+        interrupted: bool = False,
+    ):
+        """Log a single conversation turn, with its latency timings if given."""
         if not self.current_conversation:
             logger.warning("No active conversation to log turn")
             return
@@ -72,6 +82,8 @@ class ConversationLogger:
                 timestamp=datetime.now().strftime("%H:%M:%S"),
                 speaker=speaker,
                 message=message,
+                timings=timings,
+                interrupted=interrupted,
             )
             self.current_conversation.turns.append(turn)
             self._save_conversation()
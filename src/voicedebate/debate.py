@@ -0,0 +1,175 @@
+"""AI-vs-AI debate orchestration for VoiceDebate."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Synthesizer = Callable[[object, str], Awaitable[bytes]]
+Player = Callable[[bytes], Awaitable[None]]
+
+
+@dataclass
+class DebateTurnTiming:
+    """Monotonic timestamps for one debate turn."""
+
+    index: int
+    speaker: str
+    started: float = 0.0
+    text_ready: float = 0.0
+    audio_ready: float = 0.0
+    playback_start: float = 0.0
+    playback_end: float = 0.0
+    previous_playback_end: Optional[float] = None
+
+    @property
+    def generate_seconds(self) -> float:
+        return self.text_ready - self.started
+
+    @property
+    def synthesize_seconds(self) -> float:
+        return self.audio_ready - self.text_ready
+
+    @property
+    def lead_seconds(self) -> Optional[float]:
+        """How long the audio was ready before the previous turn finished.
+
+        Negative values mean playback had to wait for this turn.
+        """
+        if self.previous_playback_end is None:
+            return None
+        return self.previous_playback_end - self.audio_ready
+
+    @property
+    def gap_seconds(self) -> Optional[float]:
+        """Silence between the previous turn's audio and this one."""
+        if self.previous_playback_end is None:
+            return None
+        return self.playback_start - self.previous_playback_end
+
+
+@dataclass
+class DebateTurn:
+    """A prepared debate turn."""
+
+    speaker: str
+    text: str
+    audio: bytes
+    timing: DebateTurnTiming
+
+
+class DebateOrchestrator:
+    """Run a debate between assistants with the next turn prepared in advance.
+
+    As soon as one speaker's text is ready, the next speaker starts generating
+    a reply to it, overlapping with synthesis and playback of the current
+    turn. At most one turn is prepared ahead. Each speaker is told the topic
+    in its first turn; later turns only carry the previous speaker's text.
+    """
+
+    def __init__(
+        self,
+        assistants: List,
+        synthesize: Synthesizer,
+        play: Player,
+        on_turn: Optional[Callable[[str, str], None]] = None,
+    ):
+        if len(assistants) < 2:
+            raise ValueError("A debate needs at least two assistants")
+        self.assistants = assistants
+        self.synthesize = synthesize
+        self.play = play
+        self.on_turn = on_turn
+        self.topic = ""
+        self.timings: List[DebateTurnTiming] = []
+        self._tasks: List[asyncio.Task] = []
+
+    def _start_turn(
+        self, index: int, prompt: asyncio.Future
+    ) -> Tuple[asyncio.Task, asyncio.Future]:
+        text_ready = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(self._prepare(index, prompt, text_ready))
+        self._tasks.append(task)
+        return task, text_ready
+
+    async def _prepare(
+        self, index: int, prompt: asyncio.Future, text_ready: asyncio.Future
+    ) -> DebateTurn:
+        assistant = self.assistants[index % len(self.assistants)]
+        timing = DebateTurnTiming(index=index, speaker=assistant.config.name)
+
+        try:
+            prompt_text = await prompt
+            if 0 < index < len(self.assistants):
+                prompt_text = (
+                    f"The debate topic is: {self.topic}. "
+                    f"Respond to the previous speaker.\n\n{prompt_text}"
+                )
+            timing.started = time.monotonic()
+            text = await assistant.generate_response(prompt_text)
+            timing.text_ready = time.monotonic()
+            text_ready.set_result(f"{assistant.config.name}: {text}")
+        except BaseException:
+            # The next turn is cancelled with this one; the error itself is
+            # raised from this turn's task
+            text_ready.cancel()
+            raise
+
+        audio = await self.synthesize(assistant, text)
+        timing.audio_ready = time.monotonic()
+        return DebateTurn(assistant.config.name, text, audio, timing)
+
+    async def run(self, topic: str, turns: int) -> List[DebateTurnTiming]:
+        """Run the debate for a number of turns and return per-turn timings."""
+        self.topic = topic
+        opening = asyncio.get_running_loop().create_future()
+        opening.set_result(f"The debate topic is: {topic}. Give your opening position.")
+
+        pending = self._start_turn(0, opening)
+        previous_end: Optional[float] = None
+
+        try:
+            for index in range(turns):
+                task, text_ready = pending
+                if index + 1 < turns:
+                    pending = self._start_turn(index + 1, text_ready)
+
+                turn = await task
+                if self.on_turn:
+                    self.on_turn(turn.speaker, turn.text)
+
+                timing = turn.timing
+                timing.previous_playback_end = previous_end
+                timing.playback_start = time.monotonic()
+                if turn.audio:
+                    await self.play(turn.audio)
+                timing.playback_end = previous_end = time.monotonic()
+
+                self.timings.append(timing)
+                self._log_timing(timing)
+        finally:
+            self.stop()
+
+        return self.timings
+
+    def stop(self):
+        """Cancel any turns still being prepared."""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        self._tasks = []
+
+    def _log_timing(self, timing: DebateTurnTiming):
+        message = (
+            f"Debate turn {timing.index} ({timing.speaker}): "
+            f"generate {timing.generate_seconds:.2f}s, "
+            f"synthesize {timing.synthesize_seconds:.2f}s"
+        )
+        if timing.gap_seconds is not None:
+            message += (
+                f", lead {timing.lead_seconds:.2f}s, gap {timing.gap_seconds:.2f}s"
+            )
+        logger.info(message)
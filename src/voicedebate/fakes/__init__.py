@@ -0,0 +1,9 @@
+"""Local stand-ins for the Deepgram, ElevenLabs, Anthropic and OpenAI APIs.
+
+Run them with ``python -m voicedebate.fakes`` and start the app with
+``USE_FAKE_SERVICES=true`` to exercise the full turn loop offline.
+"""
+
+from .server import PROFILES, FakeServices, create_app, with_profile
+
+__all__ = ["PROFILES", "FakeServices", "create_app", "with_profile"]
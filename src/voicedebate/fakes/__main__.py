@@ -0,0 +1,31 @@
+"""Serve the fake provider services: python -m voicedebate.fakes."""
+
+import argparse
+import logging
+from aiohttp import web
+from ..config import config
+from .server import PROFILES, create_app, with_profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake VoiceDebate provider APIs")
+    parser.add_argument("--host", default=config.fakes.host)
+    parser.add_argument("--port", type=int, default=config.fakes.port)
+    parser.add_argument(
+        "--profile", choices=sorted(PROFILES), default=config.fakes.profile
+    )
+    parser.add_argument("--seed", type=int, default=config.fakes.seed)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    fakes_config = config.fakes
+    if args.profile:
+        fakes_config = with_profile(fakes_config, args.profile)
+    fakes_config = fakes_config.model_copy(
+        update={"host": args.host, "port": args.port, "seed": args.seed}
+    )
+    web.run_app(create_app(fakes_config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Shared behaviour for the fake provider services."""
+
+import asyncio
+import json
+import math
+import random
+from typing import Optional
+from aiohttp import web
+from ..config import FakeProfile
+
+
+class FakeBehaviour:
+    """Latency, error and chunk timing drawn from a profile."""
+
+    def __init__(self, profile: FakeProfile, rng: random.Random):
+        self.profile = profile
+        self.rng = rng
+
+    def latency(self) -> float:
+        """Draw a latency in seconds."""
+        median = self.profile.latency_ms / 1000
+        if self.profile.latency_sigma <= 0:
+            return median
+        return median * math.exp(self.rng.gauss(0.0, self.profile.latency_sigma))
+
+    async def wait_first_byte(self):
+        await asyncio.sleep(self.latency())
+
+    async def wait_chunk(self):
+        await asyncio.sleep(self.profile.chunk_interval_ms / 1000)
+
+    def should_fail(self) -> bool:
+        return self.rng.random() < self.profile.error_rate
+
+
+def error_response(status: int, body: dict) -> web.Response:
+    return web.json_response(body, status=status)
+
+
+def sse_event(data: dict, event: Optional[str] = None) -> bytes:
+    """Encode one server-sent event."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n".encode()
+
+
+async def start_sse(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse(
+        headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+    )
+    await response.prepare(request)
+    return response
@@ -0,0 +1,302 @@
+"""Fake Anthropic Messages and OpenAI Chat Completions endpoints."""
+
+import hashlib
+import time
+import uuid
+from typing import List, Set, Tuple
+from aiohttp import web
+from ..history import estimate_tokens
+from ..prompt_cache import min_cacheable_tokens
+from .common import FakeBehaviour, error_response, sse_event, start_sse
+
+RESPONSES = [
+    "But tell me, what do you mean when you call something just?",
+    "That view has merit, yet it ignores what happens in practice.",
+    "If that were true, would the wise man ever act against his interest?",
+    "Surely the answer depends on the purpose the thing is meant to serve.",
+    "Then we agree on the premise but not on where it leads us.",
+]
+
+
+def _text_of(content) -> str:
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content)
+
+
+class FakeLLM:
+    """Canned responses streamed in word-sized deltas.
+
+    The response is chosen from the conversation so repeated runs are
+    reproducible. Prompt caching is simulated per prompt prefix: the first
+    request writes the cache, later ones read it. Claude caches the prefixes
+    ending at cache breakpoints that reach the model's minimum length;
+    OpenAI caches long system prompts automatically.
+    """
+
+    def __init__(self, anthropic: FakeBehaviour, openai: FakeBehaviour):
+        self.anthropic = anthropic
+        self.openai = openai
+        self._cached_prefixes: Set[str] = set()
+
+    def routes(self) -> List[web.RouteDef]:
+        return [
+            web.post("/v1/messages", self.messages),
+            web.post("/v1/chat/completions", self.chat_completions),
+        ]
+
+    def _response(self, messages: List[dict]) -> str:
+        digest = hashlib.sha256(
+            "".join(_text_of(msg["content"]) for msg in messages).encode()
+        ).digest()
+        return RESPONSES[digest[0] % len(RESPONSES)]
+
+    def _deltas(self, text: str, chunk_size: int, max_tokens: int) -> Tuple[list, bool]:
+        """Split a response into deltas; True if cut off by max_tokens."""
+        words = text.split(" ")
+        truncated = len(words) > max_tokens
+        words = words[:max_tokens]
+        deltas = [
+            " ".join(words[i : i + chunk_size])
+            for i in range(0, len(words), chunk_size)
+        ]
+        return [deltas[0]] + [" " + delta for delta in deltas[1:]], truncated
+
+    def _cache(self, provider: str, system: str, cacheable: bool) -> Tuple[int, int]:
+        """(cache read, cache write) tokens for a system prompt."""
+        if not cacheable:
+            return 0, 0
+        tokens = estimate_tokens(system)
+        key = provider + hashlib.sha256(system.encode()).hexdigest()
+        if key in self._cached_prefixes:
+            return tokens, 0
+        self._cached_prefixes.add(key)
+        return 0, tokens
+
+    def _claude_cache(
+        self, model: str, system_blocks: List[dict], messages: List[dict]
+    ) -> Tuple[int, int, int]:
+        """(prompt, cache read, cache write) tokens for a Messages request."""
+        minimum = min_cacheable_tokens(model)
+        blocks = list(system_blocks)
+        for message in messages:
+            content = message["content"]
+            blocks += content if isinstance(content, list) else [{"text": content}]
+
+        # Like the service, look for earlier cache entries at every block
+        # boundary, but write entries only at breakpoints
+        prefix = hashlib.sha256(b"anthropic")
+        tokens = 0
+        cache_read = 0
+        breakpoints = []  # (prefix key, tokens) per cacheable breakpoint
+        for block in blocks:
+            text = block.get("text", "")
+            prefix.update(text.encode())
+            tokens += estimate_tokens(text)
+            if tokens < minimum:
+                continue
+            key = prefix.hexdigest()
+            if key in self._cached_prefixes:
+                cache_read = tokens
+            if "cache_control" in block:
+                breakpoints.append((key, tokens))
+
+        cache_write = 0
+        if breakpoints and breakpoints[-1][0] not in self._cached_prefixes:
+            cache_write = breakpoints[-1][1] - cache_read
+        self._cached_prefixes.update(key for key, _ in breakpoints)
+        return tokens, cache_read, cache_write
+
+    async def messages(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        behaviour = self.anthropic
+        await behaviour.wait_first_byte()
+        if behaviour.should_fail():
+            return error_response(
+                behaviour.profile.error_status,
+                {
+                    "type": "error",
+                    "error": {"type": "overloaded_error", "message": "Overloaded"},
+                },
+            )
+
+        system_blocks = body.get("system") or []
+        if isinstance(system_blocks, str):
+            system_blocks = [{"type": "text", "text": system_blocks}]
+        prompt_tokens, cache_read, cache_write = self._claude_cache(
+            body["model"], system_blocks, body["messages"]
+        )
+        usage = {
+            "input_tokens": prompt_tokens - cache_read - cache_write,
+            "output_tokens": 0,
+            "cache_read_input_tokens": cache_read,
+            "cache_creation_input_tokens": cache_write,
+        }
+        text = self._response(body["messages"])
+        deltas, truncated = self._deltas(
+            text, behaviour.profile.chunk_size, body["max_tokens"]
+        )
+        stop_reason = "max_tokens" if truncated else "end_turn"
+        usage["output_tokens"] = estimate_tokens("".join(deltas))
+        message = {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": body["model"],
+            "stop_sequence": None,
+        }
+
+        if not body.get("stream"):
+            return web.json_response(
+                {
+                    **message,
+                    "content": [{"type": "text", "text": "".join(deltas)}],
+                    "stop_reason": stop_reason,
+                    "usage": usage,
+                }
+            )
+
+        response = await start_sse(request)
+        start = {**message, "content": [], "stop_reason": None}
+        start["usage"] = {**usage, "output_tokens": 1}
+        await response.write(
+            sse_event({"type": "message_start", "message": start}, "message_start")
+        )
+        await response.write(
+            sse_event(
+                {
+                    "type": "content_block_start",
+                    "index": 0,
+                    "content_block": {"type": "text", "text": ""},
+                },
+                "content_block_start",
+            )
+        )
+        for i, delta in enumerate(deltas):
+            if i:
+                await behaviour.wait_chunk()
+            await response.write(
+                sse_event(
+                    {
+                        "type": "content_block_delta",
+                        "index": 0,
+                        "delta": {"type": "text_delta", "text": delta},
+                    },
+                    "content_block_delta",
+                )
+            )
+        await response.write(
+            sse_event({"type": "content_block_stop", "index": 0}, "content_block_stop")
+        )
+        await response.write(
+            sse_event(
+                {
+                    "type": "message_delta",
+                    "delta": {"stop_reason": stop_reason, "stop_sequence": None},
+                    "usage": {"output_tokens": usage["output_tokens"]},
+                },
+                "message_delta",
+            )
+        )
+        await response.write(sse_event({"type": "message_stop"}, "message_stop"))
+        await response.write_eof()
+        return response
+
+    async def chat_completions(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        behaviour = self.openai
+        await behaviour.wait_first_byte()
+        if behaviour.should_fail():
+            return error_response(
+                behaviour.profile.error_status,
+                {
+                    "error": {
+                        "message": "The server is overloaded",
+                        "type": "server_error",
+                        "code": None,
+                    }
+                },
+            )
+
+        messages = body["messages"]
+        system = "".join(
+            _text_of(m["content"]) for m in messages if m["role"] == "system"
+        )
+        # OpenAI caches long prompt prefixes automatically
+        cache_read, _ = self._cache("openai", system, estimate_tokens(system) >= 1024)
+        conversation = [m for m in messages if m["role"] != "system"]
+        text = self._response(conversation)
+        max_tokens = body.get("max_tokens") or body.get("max_completion_tokens") or 4096
+        deltas, truncated = self._deltas(text, behaviour.profile.chunk_size, max_tokens)
+        finish_reason = "length" if truncated else "stop"
+        prompt_tokens = sum(estimate_tokens(_text_of(m["content"])) for m in messages)
+        completion_tokens = estimate_tokens("".join(deltas))
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": cache_read},
+        }
+        completion = {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "created": int(time.time()),
+            "model": body["model"],
+        }
+
+        if not body.get("stream"):
+            return web.json_response(
+                {
+                    **completion,
+                    "object": "chat.completion",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {
+                                "role": "assistant",
+                                "content": "".join(deltas),
+                            },
+                            "finish_reason": finish_reason,
+                        }
+                    ],
+                    "usage": usage,
+                }
+            )
+
+        def chunk(choices: list, **extra) -> bytes:
+            return sse_event(
+                {
+                    **completion,
+                    "object": "chat.completion.chunk",
+                    "choices": choices,
+                    **extra,
+                }
+            )
+
+        response = await start_sse(request)
+        await response.write(
+            chunk(
+                [
+                    {
+                        "index": 0,
+                        "delta": {"role": "assistant", "content": ""},
+                        "finish_reason": None,
+                    }
+                ]
+            )
+        )
+        for i, delta in enumerate(deltas):
+            if i:
+                await behaviour.wait_chunk()
+            await response.write(
+                chunk(
+                    [{"index": 0, "delta": {"content": delta}, "finish_reason": None}]
+                )
+            )
+        await response.write(
+            chunk([{"index": 0, "delta": {}, "finish_reason": finish_reason}])
+        )
+        if (body.get("stream_options") or {}).get("include_usage"):
+            await response.write(chunk([], usage=usage))
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
@@ -0,0 +1,113 @@
+"""Run the fake provider services on one local port."""
+
+import logging
+import random
+from typing import Dict, Optional
+from aiohttp import web
+from ..config import EndpointConfig, FakeProfile, FakesConfig, config
+from .common import FakeBehaviour
+from .llm import FakeLLM
+from .stt import FakeSTT
+from .tts import FakeTTS
+
+logger = logging.getLogger(__name__)
+
+SERVICES = ("anthropic", "openai", "elevenlabs", "deepgram")
+
+# Named service profiles; "typical" is the FakesConfig default
+PROFILES: Dict[str, Dict[str, FakeProfile]] = {
+    "instant": {
+        service: FakeProfile(latency_ms=0.0, chunk_interval_ms=0.0)
+        for service in SERVICES
+    },
+    "typical": {service: getattr(FakesConfig(), service) for service in SERVICES},
+    "slow": {
+        "anthropic": FakeProfile(latency_ms=1500.0, latency_sigma=0.5),
+        "openai": FakeProfile(latency_ms=1200.0, latency_sigma=0.5),
+        "elevenlabs": FakeProfile(
+            latency_ms=800.0, latency_sigma=0.5, chunk_interval_ms=60.0, chunk_size=4
+        ),
+        "deepgram": FakeProfile(latency_ms=400.0, latency_sigma=0.4),
+    },
+    "flaky": {
+        "anthropic": FakeProfile(
+            latency_ms=400.0, latency_sigma=0.6, error_rate=0.2, error_status=529
+        ),
+        "openai": FakeProfile(latency_ms=350.0, latency_sigma=0.6, error_rate=0.2),
+        "elevenlabs": FakeProfile(
+            latency_ms=250.0, latency_sigma=0.6, error_rate=0.2, chunk_size=4
+        ),
+        "deepgram": FakeProfile(latency_ms=150.0, latency_sigma=0.4, error_rate=0.1),
+    },
+}
+
+
+def with_profile(fakes_config: FakesConfig, name: str) -> FakesConfig:
+    """Copy of a fakes config using a named profile for every service."""
+    if name not in PROFILES:
+        raise ValueError(f"Unknown fake profile: {name}")
+    return fakes_config.model_copy(update={**PROFILES[name], "profile": name})
+
+
+def _configured() -> FakesConfig:
+    """The configured fakes, with their named profile (FAKES_PROFILE)
+    applied over the per-service settings if one was chosen."""
+    if config.fakes.profile is None:
+        return config.fakes
+    return with_profile(config.fakes, config.fakes.profile)
+
+
+def create_app(fakes_config: Optional[FakesConfig] = None) -> web.Application:
+    """Build an aiohttp app serving every fake provider endpoint."""
+    fakes_config = fakes_config or _configured()
+    rng = random.Random(fakes_config.seed)
+
+    def behaviour(service: str) -> FakeBehaviour:
+        return FakeBehaviour(getattr(fakes_config, service), rng)
+
+    app = web.Application()
+    app.add_routes(
+        FakeLLM(behaviour("anthropic"), behaviour("openai")).routes()
+        + FakeTTS(behaviour("elevenlabs")).routes()
+        + FakeSTT(behaviour("deepgram")).routes()
+    )
+    return app
+
+
+class FakeServices:
+    """Fake providers running in the current event loop.
+
+        async with FakeServices() as fakes:
+            config.endpoints = fakes.endpoints()
+
+    Port 0 picks a free port.
+    """
+
+    def __init__(self, fakes_config: Optional[FakesConfig] = None):
+        self.config = fakes_config or _configured()
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self):
+        self._runner = web.AppRunner(create_app(self.config))
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.config.host, self.config.port)
+        await site.start()
+        # Resolve the actual port when 0 was requested
+        port = self._runner.addresses[0][1]
+        self.config = self.config.model_copy(update={"port": port})
+        logger.info(f"Fake provider services listening on {self.config.base_url}")
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def endpoints(self) -> EndpointConfig:
+        return self.config.endpoints()
+
+    async def __aenter__(self) -> "FakeServices":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
@@ -0,0 +1,249 @@
+"""Fake Deepgram live transcription websocket."""
+
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional
+from aiohttp import WSMsgType, web
+from .common import FakeBehaviour, error_response
+
+UTTERANCES = [
+    "I think justice is simply obeying the law.",
+    "Surely a good person would never lie to a friend.",
+    "Courage means having no fear at all.",
+    "Happiness comes from getting what you want.",
+]
+WORDS_PER_SECOND = 2.5
+PAUSE_SECONDS = 2.0  # simulated silence between utterances
+MAX_SEGMENT_WORDS = 8  # words before an interim segment is finalized
+
+
+class _ListenSession:
+    """Transcribes a scripted speaker in step with the audio received.
+
+    The speaker says each utterance in turn with a pause in between; words
+    are reported once enough audio has arrived to cover them, so results
+    follow the client's real-time audio pacing.
+    """
+
+    def __init__(
+        self,
+        ws: web.WebSocketResponse,
+        behaviour: FakeBehaviour,
+        utterances: List[str],
+        sample_rate: int,
+        channels: int,
+        interim_results: bool,
+        utterance_end_ms: Optional[int],
+        vad_events: bool,
+    ):
+        self.ws = ws
+        self.behaviour = behaviour
+        self.utterances = utterances
+        self.bytes_per_second = 2 * channels * sample_rate
+        self.interim_results = interim_results
+        self.utterance_end = utterance_end_ms / 1000 if utterance_end_ms else None
+        self.vad_events = vad_events
+        self.request_id = str(uuid.uuid4())
+
+        self.audio_bytes = 0
+        self._timeline = self._schedule()
+        self._next_word = next(self._timeline)
+        self._segment: List[dict] = []
+        self._utterance_end_at: Optional[float] = None
+        self._last_word_end = 0.0
+
+        self._outbox: asyncio.Queue = asyncio.Queue()
+        self._last_due = 0.0
+        self._sender = asyncio.create_task(self._send_loop())
+
+    @property
+    def audio_seconds(self) -> float:
+        return self.audio_bytes / self.bytes_per_second
+
+    def _schedule(self):
+        """Yield (word, start, end, first of utterance, last of utterance)."""
+        offset = PAUSE_SECONDS / 2
+        index = 0
+        while True:
+            words = self.utterances[index % len(self.utterances)].split()
+            for i, word in enumerate(words):
+                start = offset + i / WORDS_PER_SECOND
+                yield word, start, start + 0.8 / WORDS_PER_SECOND, i == 0, (
+                    i == len(words) - 1
+                )
+            offset += len(words) / WORDS_PER_SECOND + PAUSE_SECONDS
+            index += 1
+
+    def feed(self, size: int):
+        """Account for received audio and emit the results it completes."""
+        self.audio_bytes += size
+        now = self.audio_seconds
+
+        if self._utterance_end_at is not None and now >= self._utterance_end_at:
+            self._utterance_end_at = None
+            self._emit(
+                {
+                    "type": "UtteranceEnd",
+                    "channel": [0, 1],
+                    "last_word_end": self._last_word_end,
+                }
+            )
+
+        while self._next_word[2] <= now:
+            word, start, end, first, last = self._next_word
+            self._next_word = next(self._timeline)
+            if first and self.vad_events:
+                self._emit(
+                    {"type": "SpeechStarted", "channel": [0, 1], "timestamp": start}
+                )
+            self._segment.append(
+                {
+                    "word": word.strip(".,?!").lower(),
+                    "start": round(start, 3),
+                    "end": round(end, 3),
+                    "confidence": round(self.behaviour.rng.uniform(0.85, 0.99), 3),
+                    "punctuated_word": word,
+                }
+            )
+            self._last_word_end = end
+
+            if last:
+                self._result(is_final=True, speech_final=True)
+                if self.utterance_end:
+                    self._utterance_end_at = end + self.utterance_end
+            elif len(self._segment) >= MAX_SEGMENT_WORDS:
+                self._result(is_final=True, speech_final=False)
+            elif self.interim_results:
+                self._result(is_final=False, speech_final=False)
+
+    def finalize(self):
+        """Finalize the words heard so far, as for a Finalize message.
+
+        Like Deepgram, a Finalize is always answered, with an empty result if
+        there was nothing left to finalize.
+        """
+        self._result(is_final=True, speech_final=False, from_finalize=True)
+
+    def _result(self, is_final: bool, speech_final: bool, from_finalize=False):
+        words = list(self._segment)
+        if is_final:
+            self._segment = []
+        start = words[0]["start"] if words else self._last_word_end
+        end = words[-1]["end"] if words else start
+        self._emit(
+            {
+                "type": "Results",
+                "channel_index": [0, 1],
+                "duration": round(end - start, 3),
+                "start": start,
+                "is_final": is_final,
+                "speech_final": speech_final,
+                "from_finalize": from_finalize,
+                "channel": {
+                    "alternatives": [
+                        {
+                            "transcript": " ".join(w["punctuated_word"] for w in words),
+                            "confidence": min(
+                                (w["confidence"] for w in words), default=0.0
+                            ),
+                            "words": words,
+                        }
+                    ]
+                },
+                "metadata": {
+                    "request_id": self.request_id,
+                    "model_info": {"name": "fake", "version": "0", "arch": "fake"},
+                    "model_uuid": "fake",
+                },
+            }
+        )
+
+    def _emit(self, message: dict):
+        # Keep messages in order while each one is delayed by the latency
+        due = max(time.monotonic() + self.behaviour.latency(), self._last_due)
+        self._last_due = due
+        self._outbox.put_nowait((due, message))
+
+    async def _send_loop(self):
+        while True:
+            due, message = await self._outbox.get()
+            if message is None:
+                return
+            await asyncio.sleep(max(0.0, due - time.monotonic()))
+            if self.ws.closed:
+                return
+            await self.ws.send_str(json.dumps(message))
+
+    async def close(self):
+        """Flush pending results and send the closing metadata."""
+        if self._segment:
+            self.finalize()
+        self._emit(
+            {
+                "type": "Metadata",
+                "transaction_key": "deprecated",
+                "request_id": self.request_id,
+                "sha256": "",
+                "created": datetime.now(timezone.utc).isoformat(),
+                "duration": self.audio_seconds,
+                "channels": 1,
+                "models": ["fake"],
+                "model_info": {},
+            }
+        )
+        self._outbox.put_nowait((0.0, None))
+        await self._sender
+
+
+class FakeSTT:
+    """Live transcription of a scripted speaker over a websocket."""
+
+    def __init__(self, behaviour: FakeBehaviour, utterances: List[str] = UTTERANCES):
+        self.behaviour = behaviour
+        self.utterances = utterances
+
+    def routes(self) -> List[web.RouteDef]:
+        return [web.get("/v1/listen", self.listen)]
+
+    async def listen(self, request: web.Request) -> web.StreamResponse:
+        if self.behaviour.should_fail():
+            return error_response(
+                self.behaviour.profile.error_status,
+                {"err_code": "SERVICE_UNAVAILABLE", "err_msg": "Unavailable"},
+            )
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        query = request.query
+        utterance_end_ms = query.get("utterance_end_ms")
+        session = _ListenSession(
+            ws,
+            self.behaviour,
+            self.utterances,
+            sample_rate=int(query.get("sample_rate", "16000")),
+            channels=int(query.get("channels", "1")),
+            interim_results=query.get("interim_results", "false") == "true",
+            utterance_end_ms=int(utterance_end_ms) if utterance_end_ms else None,
+            vad_events=query.get("vad_events", "false") == "true",
+        )
+
+        async for message in ws:
+            if message.type == WSMsgType.BINARY:
+                session.feed(len(message.data))
+            elif message.type == WSMsgType.TEXT:
+                control = json.loads(message.data).get("type")
+                if control == "Finalize":
+                    session.finalize()
+                elif control == "CloseStream":
+                    break
+                # KeepAlive needs no reply
+            else:
+                break
+
+        await session.close()
+        await ws.close()
+        return ws
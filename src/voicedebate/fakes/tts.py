@@ -0,0 +1,181 @@
+"""Fake ElevenLabs streaming text-to-speech endpoint."""
+
+import base64
+import hashlib
+import io
+import json
+import re
+import wave
+from typing import List
+import numpy as np
+from aiohttp import WSMsgType, web
+from .common import FakeBehaviour, error_response
+
+WORDS_PER_SECOND = 2.5
+DEFAULT_SAMPLE_RATE = 22050
+MODELS = [{"model_id": "eleven_monolingual_v1", "name": "Fake English v1"}]
+
+# Text up to the last sentence break is ready to synthesize
+_SENTENCE_BREAK = re.compile(r".*[.!?]\s", re.DOTALL)
+
+
+def synthetic_speech(text: str, voice_id: str, sample_rate: int) -> np.ndarray:
+    """A quiet tone per word, timed like speech, as 16-bit mono samples."""
+    words = max(1, len(text.split()))
+    word_samples = int(sample_rate / WORDS_PER_SECOND)
+    # Each voice gets its own pitch
+    pitch = 140 + hashlib.sha256(voice_id.encode()).digest()[0] % 120
+
+    t = np.arange(word_samples) / sample_rate
+    envelope = np.minimum(1.0, np.minimum(t, t[::-1]) * 20)  # 50 ms fades
+    word = 0.2 * np.sin(2 * np.pi * pitch * t) * envelope
+    silence = np.zeros(word_samples // 4)
+    samples = np.concatenate([np.concatenate([word, silence])] * words)
+    return (samples * 32767).astype(np.int16)
+
+
+def encode(samples: np.ndarray, sample_rate: int, output_format: str) -> bytes:
+    """Raw PCM for ``pcm_*`` formats, otherwise a WAV file."""
+    if output_format.startswith("pcm_"):
+        return samples.tobytes()
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def alignment(text: str, start: int, end: int, total: int, seconds: float) -> dict:
+    """The characters spoken in bytes ``start:end`` of ``total``, spread
+    evenly over the audio, in the service's alignment format."""
+    first = len(text) * start // total
+    last = len(text) * end // total
+    char_ms = int(seconds * 1000 / max(1, len(text)))
+    return {
+        "chars": list(text[first:last]),
+        "charStartTimesMs": [i * char_ms for i in range(last - first)],
+        "charDurationsMs": [char_ms] * (last - first),
+    }
+
+
+def sample_rate_of(output_format: str) -> int:
+    """Sample rate named in an ElevenLabs output format, e.g. pcm_16000."""
+    parts = output_format.split("_")
+    if len(parts) >= 2 and parts[1].isdigit():
+        return int(parts[1])
+    return DEFAULT_SAMPLE_RATE
+
+
+class FakeTTS:
+    """Streams synthetic audio whose length follows the text."""
+
+    def __init__(self, behaviour: FakeBehaviour):
+        self.behaviour = behaviour
+
+    def routes(self) -> List[web.RouteDef]:
+        return [
+            web.get("/v1/models", self.models),
+            web.post("/v1/text-to-speech/{voice_id}/stream", self.stream),
+            web.get("/v1/text-to-speech/{voice_id}/stream-input", self.stream_input),
+        ]
+
+    async def models(self, request: web.Request) -> web.Response:
+        return web.json_response(MODELS)
+
+    async def stream(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        behaviour = self.behaviour
+        await behaviour.wait_first_byte()
+        if behaviour.should_fail():
+            return error_response(
+                behaviour.profile.error_status,
+                {"detail": {"status": "system_busy", "message": "Busy"}},
+            )
+
+        output_format = request.query.get("output_format", "wav_22050")
+        sample_rate = sample_rate_of(output_format)
+        samples = synthetic_speech(
+            body["text"], request.match_info["voice_id"], sample_rate
+        )
+        audio = encode(samples, sample_rate, output_format)
+
+        content_type = "audio/pcm" if output_format.startswith("pcm_") else "audio/wav"
+        response = web.StreamResponse(headers={"Content-Type": content_type})
+        await response.prepare(request)
+        chunk_bytes = behaviour.profile.chunk_size * 1024
+        for offset in range(0, len(audio), chunk_bytes):
+            if offset:
+                await behaviour.wait_chunk()
+            await response.write(audio[offset : offset + chunk_bytes])
+        await response.write_eof()
+        return response
+
+    async def stream_input(self, request: web.Request) -> web.WebSocketResponse:
+        """Websocket synthesis of text sent in pieces.
+
+        Complete sentences are synthesized as they arrive; the rest waits for
+        a flush or the empty end-of-input message.
+        """
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        behaviour = self.behaviour
+        voice_id = request.match_info["voice_id"]
+        output_format = request.query.get("output_format", "pcm_22050")
+        sample_rate = sample_rate_of(output_format)
+        chunk_bytes = behaviour.profile.chunk_size * 1024
+        pending = ""
+        first = True
+
+        async def synthesize(text: str):
+            nonlocal first
+            if not text.strip():
+                return
+            if first:
+                first = False
+                await behaviour.wait_first_byte()
+            samples = synthetic_speech(text, voice_id, sample_rate)
+            audio = encode(samples, sample_rate, output_format)
+            seconds = len(samples) / sample_rate
+            for offset in range(0, len(audio), chunk_bytes):
+                await behaviour.wait_chunk()
+                chunk = audio[offset : offset + chunk_bytes]
+                aligned = alignment(
+                    text, offset, offset + len(chunk), len(audio), seconds
+                )
+                await ws.send_str(
+                    json.dumps(
+                        {
+                            "audio": base64.b64encode(chunk).decode(),
+                            "isFinal": False,
+                            "alignment": aligned,
+                            "normalizedAlignment": aligned,
+                        }
+                    )
+                )
+
+        async for message in ws:
+            if message.type != WSMsgType.TEXT:
+                break
+            data = json.loads(message.data)
+            text = data.get("text", "")
+            if text == "":
+                await synthesize(pending)
+                break
+            if behaviour.should_fail():
+                await ws.send_str(json.dumps({"error": "system_busy"}))
+                break
+            pending += text
+            if data.get("flush"):
+                ready, pending = pending, ""
+            else:
+                match = _SENTENCE_BREAK.match(pending)
+                ready = match.group(0) if match else ""
+                pending = pending[len(ready) :]
+            await synthesize(ready)
+
+        if not ws.closed:
+            await ws.send_str(json.dumps({"isFinal": True}))
+            await ws.close()
+        return ws
@@ -0,0 +1,122 @@
+"""Token-budgeted conversation history for VoiceDebate."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Summarizer signature: (current summary, turns to fold in) -> new summary
+Summarizer = Callable[[str, List[dict]], Awaitable[str]]
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a text (about 4 chars per token)."""
+    return len(text) // 4 + 1 if text else 0
+
+
+class ConversationHistory:
+    """Rolling conversation history kept within a token budget.
+
+    Recent messages are kept verbatim. Once they exceed the budget the oldest
+    turns are moved out of the request window right away and folded into a
+    running summary by a background task, so request size stays bounded.
+
+    Turns are moved out in batches, down to ``trim_to`` of the budget, rather
+    than one per turn; the start of the window then stays the same for many
+    turns, so its cached prompt prefix keeps being reused.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 2000,
+        summarizer: Optional[Summarizer] = None,
+        min_recent_messages: int = 2,
+        trim_to: float = 0.5,
+    ):
+        self.token_budget = token_budget
+        self.summarizer = summarizer
+        self.min_recent_messages = min_recent_messages
+        self.trim_to = trim_to
+        self.messages: List[dict] = []
+        self.summary = ""
+        self._pending: List[dict] = []
+        self._compaction: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def append(self, message: dict):
+        """Append a single message to the verbatim window."""
+        self.messages.append(message)
+
+    def add_turn(self, user_message: dict, assistant_message: dict):
+        """Record a completed turn and compact the window if needed."""
+        self.messages.append(user_message)
+        self.messages.append(assistant_message)
+        self.trim()
+        self.schedule_compaction()
+
+    def token_count(self) -> int:
+        """Estimate the tokens the history adds to a request."""
+        return estimate_tokens(self.summary) + sum(
+            estimate_tokens(msg["content"]) for msg in self.messages
+        )
+
+    def trims_after(self, user_message: dict) -> bool:
+        """Whether recording a turn that starts with ``user_message`` will
+        trim the window, changing its start."""
+        tokens = self.token_count() + estimate_tokens(user_message["content"])
+        return tokens > self.token_budget
+
+    def trim(self):
+        """If the window is over budget, move the oldest turns out of it until
+        it is within ``trim_to`` of the budget."""
+        if self.token_count() <= self.token_budget:
+            return
+        target = self.token_budget * self.trim_to
+        while (
+            self.token_count() > target
+            and len(self.messages) > self.min_recent_messages
+        ):
+            self._pending.append(self.messages.pop(0))
+
+            # Requests must start with a user message
+            while self.messages and self.messages[0]["role"] != "user":
+                self._pending.append(self.messages.pop(0))
+
+    def schedule_compaction(self):
+        """Fold evicted turns into the summary without blocking the caller."""
+        if not self._pending or self.summarizer is None:
+            return
+        if self._compaction and not self._compaction.done():
+            return
+
+        try:
+            self._compaction = asyncio.get_running_loop().create_task(self.compact())
+        except RuntimeError:
+            logger.debug("No running event loop, deferring history compaction")
+
+    async def compact(self):
+        """Summarize all pending turns into the running summary."""
+        while self._pending and self.summarizer is not None:
+            turns, self._pending = self._pending, []
+            try:
+                self.summary = (await self.summarizer(self.summary, turns)).strip()
+                logger.debug(
+                    f"Compacted {len(turns)} messages into summary "
+                    f"({estimate_tokens(self.summary)} tokens)"
+                )
+            except Exception as e:
+                logger.error(f"Error compacting conversation history: {e}")
+                self._pending = turns + self._pending
+                return
+
+    def clear(self):
+        """Clear history and summary."""
+        if self._compaction and not self._compaction.done():
+            self._compaction.cancel()
+        self._compaction = None
+        self.messages = []
+        self._pending = []
+        self.summary = ""
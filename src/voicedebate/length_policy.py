@@ -0,0 +1,100 @@
+"""Response length limits for assistant generation."""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import List, Tuple
+from .sentences import _ABBREVIATIONS
+
+# End of a sentence: terminal punctuation, optional closing quote or bracket,
+# then whitespace. A bare "." at the end of the text is not enough since the
+# next delta may turn it into "3.14".
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*(?=\s)")
+_TERMINAL = (".", "!", "?", '."', '?"', '!"')
+# Trailing characters that cannot end a response; held back until more
+# text follows them
+_DANGLING = ",;:- \t\n"
+
+
+def _sentence_ends(text: str) -> List[int]:
+    """Offsets just past each complete sentence, skipping abbreviations."""
+    ends = []
+    for match in _SENTENCE_END.finditer(text):
+        last_word = text[: match.end()].rsplit(None, 1)[-1].lower()
+        if last_word.rstrip("\"')]") not in _ABBREVIATIONS:
+            ends.append(match.end())
+    return ends
+
+
+@dataclass
+class ResponseLengthPolicy:
+    """Length limits taken from a character's response rules.
+
+    Generation stops at a paragraph break or where the model starts writing
+    the user's next line. Claude rejects whitespace-only stop sequences, so
+    it only gets the latter.
+    """
+
+    max_words: int = 30
+    max_sentences: int = 1
+    tokens_per_word: float = 1.5
+    margin_tokens: int = 16
+    stop_sequences: List[str] = field(
+        default_factory=lambda: ["\n\n", "\nUser:", "\nHuman:"]
+    )
+
+    @property
+    def max_tokens(self) -> int:
+        """Token budget that fits the word limit with some headroom."""
+        return math.ceil(self.max_words * self.tokens_per_word) + self.margin_tokens
+
+    def enforce(self, text: str) -> str:
+        """Trim a full response to the allowed sentences and words."""
+        limiter = LengthLimiter(self)
+        kept, _ = limiter.feed(text + " ")
+        return (kept + limiter.finish()).strip()
+
+
+class LengthLimiter:
+    """Cut a streamed response off at the sentence and word limits.
+
+    Trailing commas, dashes and the like are held back until the text
+    continues, so a response cut off after them can still be closed cleanly.
+    """
+
+    def __init__(self, policy: ResponseLengthPolicy):
+        self.policy = policy
+        self.text = ""
+        self._emitted = 0
+        self.done = False
+
+    def feed(self, delta: str) -> Tuple[str, bool]:
+        """Add a delta; return the part to keep and whether to stop."""
+        if self.done:
+            return "", True
+        self.text += delta
+        end = len(self.text)
+
+        sentence_ends = _sentence_ends(self.text)
+        if len(sentence_ends) >= self.policy.max_sentences:
+            end = sentence_ends[self.policy.max_sentences - 1]
+            self.done = True
+
+        words = list(re.finditer(r"\S+", self.text[:end]))
+        if len(words) > self.policy.max_words:
+            end = words[self.policy.max_words - 1].end()
+            self.done = True
+
+        self.text = self.text[:end] if self.done else self.text
+        end = max(len(self.text[:end].rstrip(_DANGLING)), self._emitted)
+        kept = self.text[self._emitted : end]
+        self._emitted = end
+        return kept, self.done
+
+    def finish(self) -> str:
+        """Rest of the response, closed with terminal punctuation."""
+        stripped = self.text.rstrip()
+        if not stripped or stripped.endswith(_TERMINAL):
+            return ""
+        self.text = self.text.rstrip(_DANGLING) + "."
+        return self.text[self._emitted :]
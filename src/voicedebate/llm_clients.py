@@ -0,0 +1,252 @@
+"""LLM provider clients for VoiceDebate."""
+
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional
+from .config import config
+from .prompt_cache import CacheUsage
+from .resilience import ProviderGuard, guards
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LLMRequest:
+    """Provider-neutral chat request.
+
+    ``system`` uses the Claude block layout (a list of text blocks, optionally
+    carrying cache breakpoints); clients for other providers flatten it.
+    """
+
+    model: str
+    system: List[dict]
+    messages: List[dict]
+    temperature: float
+    max_tokens: int
+    stop: List[str] = field(default_factory=list)
+
+
+@dataclass
+class LLMResponse:
+    """Completed chat response."""
+
+    text: str
+    usage: Optional[CacheUsage] = None
+
+
+UsageCallback = Callable[[CacheUsage], None]
+
+
+def _block_text(content) -> str:
+    """Flatten message content that may be a list of text blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content)
+
+
+class LLMClient:
+    """Base class for async LLM provider clients.
+
+    Subclasses implement ``_complete`` and ``_stream``; the public methods add
+    rate limiting, retries and circuit breaking around them.
+    """
+
+    provider = ""
+    guard_name = ""  # Provider section in config.resilience
+    api_key = ""
+
+    @property
+    def guard(self) -> ProviderGuard:
+        return guards.get(self.guard_name, self.api_key)
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """Run a request and return the full response."""
+        return await self.guard.call(self._complete, request)
+
+    def stream(
+        self, request: LLMRequest, on_usage: Optional[UsageCallback] = None
+    ) -> AsyncIterator[str]:
+        """Run a request and yield text deltas as they arrive."""
+        return self.guard.stream(lambda: self._stream(request, on_usage))
+
+    async def _complete(self, request: LLMRequest) -> LLMResponse:
+        raise NotImplementedError
+
+    def _stream(
+        self, request: LLMRequest, on_usage: Optional[UsageCallback] = None
+    ) -> AsyncIterator[str]:
+        raise NotImplementedError
+
+    async def close(self):
+        """Release provider resources."""
+        await self._client.close()
+
+
+def _pool_options() -> dict:
+    """Connection pool settings shared by every provider's HTTP client."""
+    import httpx
+
+    return {
+        "timeout": httpx.Timeout(
+            config.llm.request_timeout, connect=config.llm.connect_timeout
+        ),
+        "limits": httpx.Limits(
+            max_connections=config.llm.max_connections,
+            max_keepalive_connections=config.llm.max_keepalive_connections,
+            keepalive_expiry=config.llm.keepalive_expiry,
+        ),
+    }
+
+
+class ClaudeClient(LLMClient):
+    """Anthropic Claude client."""
+
+    provider = "claude"
+    guard_name = "anthropic"
+
+    def __init__(self):
+        # The SDKs are slow to import, so load them with the first client
+        import anthropic
+
+        self.api_key = config.api.anthropic_api_key
+        # Retries are handled by the provider guard
+        self._client = anthropic.AsyncAnthropic(
+            api_key=self.api_key,
+            base_url=config.endpoints.anthropic_base_url,
+            http_client=anthropic.DefaultAsyncHttpxClient(**_pool_options()),
+            timeout=config.llm.request_timeout,
+            max_retries=0,
+        )
+
+    def _params(self, request: LLMRequest) -> dict:
+        params = {
+            "model": request.model,
+            "system": request.system,
+            "messages": request.messages,
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens,
+        }
+        # Claude rejects whitespace-only stop sequences
+        stop = [sequence for sequence in request.stop if sequence.strip()]
+        if stop:
+            params["stop_sequences"] = stop
+        return params
+
+    async def _complete(self, request: LLMRequest) -> LLMResponse:
+        response = await self._client.messages.create(**self._params(request))
+        return LLMResponse(
+            text=response.content[0].text.strip(),
+            usage=CacheUsage.from_usage(response.usage),
+        )
+
+    async def _stream(
+        self, request: LLMRequest, on_usage: Optional[UsageCallback] = None
+    ) -> AsyncIterator[str]:
+        async with self._client.messages.stream(**self._params(request)) as stream:
+            async for text in stream.text_stream:
+                yield text
+            if on_usage:
+                message = await stream.get_final_message()
+                on_usage(CacheUsage.from_usage(message.usage))
+
+
+class OpenAIClient(LLMClient):
+    """OpenAI GPT client."""
+
+    provider = "gpt"
+    guard_name = "openai"
+
+    def __init__(self):
+        import openai
+
+        self.api_key = config.api.openai_api_key
+        # Retries are handled by the provider guard
+        self._client = openai.AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=config.endpoints.openai_base_url,
+            http_client=openai.DefaultAsyncHttpxClient(**_pool_options()),
+            timeout=config.llm.request_timeout,
+            max_retries=0,
+        )
+
+    def _params(self, request: LLMRequest) -> dict:
+        system = "\n\n".join(block["text"] for block in request.system)
+        messages = [{"role": "system", "content": system}]
+        for msg in request.messages:
+            messages.append(
+                {"role": msg["role"], "content": _block_text(msg["content"])}
+            )
+
+        params = {
+            "model": request.model,
+            "messages": messages,
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens,
+        }
+        if request.stop:
+            params["stop"] = request.stop[:4]  # OpenAI accepts at most 4
+        return params
+
+    @staticmethod
+    def _usage(usage) -> Optional[CacheUsage]:
+        if usage is None:
+            return None
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", 0) or 0
+        return CacheUsage(
+            input_tokens=usage.prompt_tokens - cached, cache_read_tokens=cached
+        )
+
+    async def _complete(self, request: LLMRequest) -> LLMResponse:
+        response = await self._client.chat.completions.create(**self._params(request))
+        return LLMResponse(
+            text=(response.choices[0].message.content or "").strip(),
+            usage=self._usage(response.usage),
+        )
+
+    async def _stream(
+        self, request: LLMRequest, on_usage: Optional[UsageCallback] = None
+    ) -> AsyncIterator[str]:
+        response = await self._client.chat.completions.create(
+            **self._params(request),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        try:
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                elif chunk.usage and on_usage:
+                    on_usage(self._usage(chunk.usage))
+        finally:
+            await response.close()
+
+
+class LLMClientPool:
+    """One client per provider, each holding a keep-alive connection pool.
+
+    Every assistant and session talking to a provider goes through the same
+    client, so connections and TLS sessions are reused across turns.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, LLMClient] = {}
+
+    def get(self, provider: str) -> LLMClient:
+        """Get the client for a provider ("claude", anything else is GPT)."""
+        key = "claude" if provider == "claude" else "gpt"
+        if key not in self._clients:
+            client_cls = ClaudeClient if key == "claude" else OpenAIClient
+            self._clients[key] = client_cls()
+            logger.info(f"Created {key} LLM client")
+        return self._clients[key]
+
+    async def close(self):
+        """Close all clients and their connection pools."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.close()
+
+
+# Global instance
+llm_clients = LLMClientPool()
@@ -0,0 +1,191 @@
+"""Per-turn latency instrumentation for VoiceDebate."""
+
+import bisect
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Turn stages in the order they normally happen
+SPEECH_END = "speech_end"
+FINAL_TRANSCRIPT = "final_transcript"
+LLM_REQUEST = "llm_request"
+FIRST_TOKEN = "first_token"
+LAST_TOKEN = "last_token"
+TTS_FIRST_BYTE = "tts_first_byte"
+TTS_LAST_BYTE = "tts_last_byte"
+PLAYBACK_START = "playback_start"
+PLAYBACK_END = "playback_end"
+
+STAGES = (
+    SPEECH_END,
+    FINAL_TRANSCRIPT,
+    LLM_REQUEST,
+    FIRST_TOKEN,
+    LAST_TOKEN,
+    TTS_FIRST_BYTE,
+    TTS_LAST_BYTE,
+    PLAYBACK_START,
+    PLAYBACK_END,
+)
+
+# Stages that happen once per sentence; the last occurrence is kept
+_LATEST_WINS = {LAST_TOKEN, TTS_LAST_BYTE, PLAYBACK_END}
+
+# Named intervals between stages: (name, from stage, to stage)
+INTERVALS: Tuple[Tuple[str, str, str], ...] = (
+    ("stt_finalize", SPEECH_END, FINAL_TRANSCRIPT),
+    ("llm_first_token", LLM_REQUEST, FIRST_TOKEN),
+    ("llm_total", LLM_REQUEST, LAST_TOKEN),
+    ("tts_first_byte", FIRST_TOKEN, TTS_FIRST_BYTE),
+    ("tts_total", TTS_FIRST_BYTE, TTS_LAST_BYTE),
+    ("playback", PLAYBACK_START, PLAYBACK_END),
+    ("response_latency", SPEECH_END, PLAYBACK_START),
+    ("turn_total", SPEECH_END, PLAYBACK_END),
+)
+
+
+class TurnTimeline:
+    """Monotonic timestamps of one conversation turn's stages."""
+
+    def __init__(self):
+        self.stamps: Dict[str, float] = {}
+
+    def mark(self, stage: str, at: Optional[float] = None):
+        """Record a stage; repeated marks keep the first time, except for
+        per-sentence end stages which keep the last."""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown turn stage: {stage}")
+        at = time.monotonic() if at is None else at
+        if stage in _LATEST_WINS or stage not in self.stamps:
+            self.stamps[stage] = at
+
+    def interval(self, start: str, end: str) -> Optional[float]:
+        """Seconds between two stages, if both were recorded."""
+        if start in self.stamps and end in self.stamps:
+            return self.stamps[end] - self.stamps[start]
+        return None
+
+    def intervals(self) -> Dict[str, float]:
+        """Durations of the named intervals that were recorded, in seconds."""
+        durations = {}
+        for name, start, end in INTERVALS:
+            duration = self.interval(start, end)
+            if duration is not None:
+                durations[name] = duration
+        return durations
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Stage offsets from the first stage and interval durations, in ms."""
+        if not self.stamps:
+            return {"stages": {}, "intervals": {}}
+        origin = min(self.stamps.values())
+        return {
+            "stages": {
+                stage: round((self.stamps[stage] - origin) * 1000, 1)
+                for stage in STAGES
+                if stage in self.stamps
+            },
+            "intervals": {
+                name: round(duration * 1000, 1)
+                for name, duration in self.intervals().items()
+            },
+        }
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations in milliseconds."""
+
+    BOUNDS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value_ms: float):
+        self.counts[bisect.bisect_left(self.BOUNDS, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Estimate a percentile by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.BOUNDS[i - 1] if i else 0.0
+                upper = self.BOUNDS[i] if i < len(self.BOUNDS) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+
+class TurnMetrics:
+    """In-process histograms of turn interval durations, plus how much
+    microphone audio was streamed for transcription."""
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self.transcription_audio: Dict[str, float] = {}
+
+    def record(self, timeline: TurnTimeline):
+        """Add a finished turn's intervals to the histograms."""
+        for name, duration in timeline.intervals().items():
+            self.histograms.setdefault(name, Histogram()).observe(duration * 1000)
+
+    def record_transcription_audio(self, stats: Dict[str, float]):
+        """Keep the latest totals from ``MicGate.summary``."""
+        self.transcription_audio = dict(stats)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean, p50, p95 and max per interval, in ms.
+
+        Transcription audio totals are included as ``transcription_audio``
+        once recorded.
+        """
+        summary = {
+            name: {
+                "count": histogram.count,
+                "mean": round(histogram.mean, 1),
+                "p50": round(histogram.percentile(50), 1),
+                "p95": round(histogram.percentile(95), 1),
+                "max": round(histogram.max, 1),
+            }
+            for name, histogram in self.histograms.items()
+        }
+        if self.transcription_audio:
+            summary["transcription_audio"] = self.transcription_audio
+        return summary
+
+    def log_summary(self):
+        lines: List[str] = [
+            f"  {name}: n={stats['count']} mean={stats['mean']}ms "
+            f"p50={stats['p50']}ms p95={stats['p95']}ms max={stats['max']}ms"
+            for name, stats in self.summary().items()
+            if name != "transcription_audio"
+        ]
+        audio = self.transcription_audio
+        if audio:
+            lines.append(
+                f"  transcription audio: sent={audio['sent_seconds']}s "
+                f"held back={audio['saved_seconds']}s ({audio['saved_ratio']:.0%})"
+            )
+        if lines:
+            logger.info("Turn latency summary:\n" + "\n".join(lines))
+
+
+# Global instance
+turn_metrics = TurnMetrics()
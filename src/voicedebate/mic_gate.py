@@ -0,0 +1,118 @@
+"""Gate between microphone capture and the transcription connection."""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque
+
+logger = logging.getLogger(__name__)
+
+
+class MicGate:
+    """Decides which captured frames are streamed to the transcriber.
+
+    The gate is closed while no turn is being captured, which includes
+    the assistant's playback, and during a turn until the local VAD hears
+    speech. Closed, it keeps the last ``preroll_ms`` of audio so the start
+    of an utterance is not clipped when it opens; older frames are dropped
+    and counted as saved. With ``enabled`` False the gate opens for the
+    whole turn.
+
+    ``feed`` runs on the capture thread; the other methods may be called
+    from any thread.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes], None],
+        sample_rate: int = 16000,
+        preroll_ms: int = 500,
+        enabled: bool = True,
+    ):
+        self.send = send
+        self.bytes_per_second = sample_rate * 2  # 16-bit mono
+        self.preroll_bytes = self.bytes_per_second * preroll_ms // 1000
+        self.enabled = enabled
+        self.sent_seconds = 0.0
+        self.saved_seconds = 0.0
+        self.last_sent = time.monotonic()
+        self._preroll: Deque[bytes] = deque()
+        self._preroll_size = 0
+        self._open = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    def start_turn(self, keep_preroll: bool = False):
+        """A turn is being captured; open now if the gate is disabled.
+
+        ``keep_preroll`` keeps audio heard just before the turn, as when the
+        user started talking over the assistant.
+        """
+        with self._lock:
+            if not keep_preroll:
+                self._drop(len(self._preroll))
+        if not self.enabled:
+            self.open()
+
+    def open(self):
+        """Start streaming, beginning with the held pre-roll."""
+        with self._lock:
+            if self._open:
+                return
+            self._open = True
+            frames = list(self._preroll)
+            self._preroll.clear()
+            self._preroll_size = 0
+        for frame in frames:
+            self._send(frame)
+
+    def close(self):
+        """Stop streaming; frames are held as pre-roll again."""
+        with self._lock:
+            self._open = False
+
+    def feed(self, frame: bytes):
+        """Stream a captured frame or hold it back."""
+        if self._open:
+            self._send(frame)
+            return
+        with self._lock:
+            self._preroll.append(frame)
+            self._preroll_size += len(frame)
+            # Drop the oldest frames the pre-roll can do without
+            while (
+                self._preroll
+                and self._preroll_size - len(self._preroll[0]) >= self.preroll_bytes
+            ):
+                self._drop(1)
+
+    def _drop(self, count: int):
+        for _ in range(count):
+            frame = self._preroll.popleft()
+            self._preroll_size -= len(frame)
+            self.saved_seconds += len(frame) / self.bytes_per_second
+
+    def _send(self, frame: bytes):
+        self.send(frame)
+        self.sent_seconds += len(frame) / self.bytes_per_second
+        self.last_sent = time.monotonic()
+
+    def summary(self) -> dict:
+        """Seconds of audio streamed and held back, and the share saved."""
+        total = self.sent_seconds + self.saved_seconds
+        return {
+            "sent_seconds": round(self.sent_seconds, 1),
+            "saved_seconds": round(self.saved_seconds, 1),
+            "saved_ratio": round(self.saved_seconds / total, 3) if total else 0.0,
+        }
+
+    def log_summary(self):
+        stats = self.summary()
+        logger.info(
+            f"Transcription audio: {stats['sent_seconds']}s sent, "
+            f"{stats['saved_seconds']}s held back ({stats['saved_ratio']:.0%})"
+        )
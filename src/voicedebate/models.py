@@ -126,6 +126,16 @@ class AssistantConfig(BaseModel):
     voice_clarity: float = Field(ge=0.0, le=1.0)
     voice_style: float = Field(default=0.0, ge=0.0, le=1.0)
 
+    # Token budget for the verbatim history sent with each request
+    history_token_budget: int = Field(default=2000, gt=0)
+
+    # Alternate {"provider": ..., "model": ...} targets for hedged requests
+    fallback_models: List[Dict[str, str]] = Field(default_factory=list)
+
+    # Response length rules, used to bound generation
+    max_response_words: int = Field(default=30, gt=0)
+    max_response_sentences: int = Field(default=1, gt=0)
+
     class Config:
         arbitrary_types_allowed = True
         extra = "allow"
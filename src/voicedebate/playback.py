@@ -0,0 +1,261 @@
+"""Streaming PCM audio playback for VoiceDebate."""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+import numpy as np
+from .config import config
+
+if TYPE_CHECKING:
+    import sounddevice as sd
+
+logger = logging.getLogger(__name__)
+
+SILENCE_DB = -100.0  # level reported when nothing is playing
+
+
+class PCMBuffer:
+    """Preallocated 16-bit mono sample buffer.
+
+    The network side appends raw little-endian PCM bytes while the audio
+    callback drains samples from the front. The buffer only grows (by
+    doubling) if a clip outlasts its capacity.
+    """
+
+    def __init__(self, capacity: int):
+        self._samples = np.zeros(capacity, dtype=np.int16)
+        self._lock = threading.Lock()
+        self._write = 0
+        self._read = 0
+        self._odd_byte = b""
+
+    @property
+    def available(self) -> int:
+        """Samples written but not yet read."""
+        return self._write - self._read
+
+    @property
+    def read_position(self) -> int:
+        """Samples read since the last reset."""
+        return self._read
+
+    def reset(self):
+        with self._lock:
+            self._write = self._read = 0
+            self._odd_byte = b""
+
+    def write(self, data: bytes):
+        """Append PCM bytes; a trailing odd byte waits for the next chunk."""
+        if self._odd_byte:
+            data = self._odd_byte + data
+        usable = len(data) - len(data) % 2
+        self._odd_byte = data[usable:]
+        chunk = np.frombuffer(data, dtype=np.int16, count=usable // 2)
+
+        with self._lock:
+            end = self._write + len(chunk)
+            if end > len(self._samples):
+                grown = np.zeros(max(end, 2 * len(self._samples)), dtype=np.int16)
+                grown[: self._write] = self._samples[: self._write]
+                self._samples = grown
+            self._samples[self._write : end] = chunk
+            self._write = end
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Copy up to ``len(out)`` samples into ``out``; return the count."""
+        with self._lock:
+            count = min(len(out), self._write - self._read)
+            out[:count] = self._samples[self._read : self._read + count]
+            self._read += count
+        return count
+
+
+class Playback:
+    """One clip being played; written to while it plays."""
+
+    def __init__(self, player: "AudioPlayer", loop: asyncio.AbstractEventLoop):
+        self.player = player
+        self._loop = loop
+        self._done = loop.create_future()
+        self._writing = True
+        self._stopped = False
+        self.started_at: Optional[float] = None
+        self.ended_at: Optional[float] = None
+        self.underruns = 0
+        self._played: Optional[int] = None
+
+    @property
+    def done(self) -> bool:
+        return self._done.done()
+
+    def write(self, chunk: bytes):
+        """Queue PCM bytes for playback."""
+        if not self._stopped:
+            self.player.buffer.write(chunk)
+
+    def finish(self):
+        """No more audio will be written; complete once the buffer drains."""
+        self._writing = False
+
+    @property
+    def played_samples(self) -> int:
+        """Samples that have reached the speaker so far.
+
+        Samples handed to the device but still in its output latency when
+        the clip was stopped are not counted.
+        """
+        if self._played is not None:
+            return self._played
+        return self.player.buffer.read_position
+
+    def stop(self):
+        """Stop immediately, dropping any audio not yet played."""
+        if not self._stopped and self.ended_at is None:
+            in_flight = int(self.player.output_latency * self.player.sample_rate)
+            self._played = max(0, self.player.buffer.read_position - in_flight)
+        self._stopped = True
+        self._writing = False
+        self._complete()
+
+    async def wait(self):
+        """Wait until the clip has finished or been stopped."""
+        await asyncio.shield(self._done)
+
+    def _fill(self, out: np.ndarray):
+        """Fill an output block; runs on the audio thread."""
+        count = 0 if self._stopped else self.player.buffer.read_into(out)
+        out[count:] = 0
+
+        if count and self.started_at is None:
+            self.started_at = time.monotonic() + self.player.output_latency
+        if count < len(out) and not self._stopped:
+            if self._writing:
+                if self.started_at is not None:
+                    self.underruns += 1
+            else:
+                self._complete()
+
+    def _complete(self):
+        if self.ended_at is not None:
+            return
+        if self._played is None:
+            self._played = self.player.buffer.read_position
+        self.ended_at = time.monotonic() + (
+            0.0 if self._stopped else self.player.output_latency
+        )
+        self._loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self._done.done():
+            self._done.set_result(None)
+        if self.underruns:
+            logger.debug(f"Playback had {self.underruns} buffer underruns")
+
+
+class AudioPlayer:
+    """Plays PCM clips through one long-lived sounddevice output stream.
+
+    Keeping the stream open avoids reopening the device for every clip; it
+    outputs silence between clips. Only one clip plays at a time.
+
+    ``level_db`` follows the level of the audio sent to the speaker, held
+    at its peaks and released at ``level_release_db`` per second, as an
+    echo reference for detecting speech over playback.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 22050,
+        buffer_seconds: float = 60.0,
+        latency: str = "low",
+        level_release_db: float = 30.0,
+    ):
+        self.sample_rate = sample_rate
+        self.latency = latency
+        self.level_release_db = level_release_db
+        self.level_db = SILENCE_DB
+        self.buffer = PCMBuffer(int(sample_rate * buffer_seconds))
+        self._stream: Optional["sd.OutputStream"] = None
+        self._current: Optional[Playback] = None
+
+    @property
+    def output_latency(self) -> float:
+        """Seconds between filling a block and hearing it."""
+        return self._stream.latency if self._stream else 0.0
+
+    def _ensure_stream(self):
+        if self._stream is not None:
+            return
+        import sounddevice as sd
+
+        self._stream = sd.OutputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype="int16",
+            latency=self.latency,
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def _callback(self, outdata, frames, time_info, status):
+        if status:
+            logger.debug(f"Audio output status: {status}")
+        out = outdata[:, 0]
+        playback = self._current
+        if playback is None or playback.ended_at is not None:
+            out.fill(0)
+        else:
+            playback._fill(out)
+
+        samples = out.astype(np.float32) / 32768.0
+        block_db = 10 * np.log10(np.mean(samples * samples) + 1e-10)
+        release = self.level_release_db * frames / self.sample_rate
+        self.level_db = max(float(block_db), self.level_db - release, SILENCE_DB)
+
+    def open(self) -> Playback:
+        """Start a new clip, stopping the current one; write to it as audio arrives."""
+        self.stop()
+        self.buffer.reset()
+        playback = Playback(self, asyncio.get_running_loop())
+        self._current = playback
+        self._ensure_stream()
+        return playback
+
+    async def play(self, audio: bytes) -> Playback:
+        """Play a complete clip and wait for it to finish."""
+        playback = self.open()
+        playback.write(audio)
+        playback.finish()
+        await playback.wait()
+        return playback
+
+    def stop(self):
+        """Stop the current clip, if any."""
+        if self._current and not self._current.done:
+            self._current.stop()
+        self._current = None
+
+    def close(self):
+        """Stop playback and release the output device."""
+        self.stop()
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        self.level_db = SILENCE_DB
+
+
+_audio_player: Optional[AudioPlayer] = None
+
+
+def get_audio_player() -> AudioPlayer:
+    """Get the global audio player, creating it on first use."""
+    global _audio_player
+    if _audio_player is None:
+        _audio_player = AudioPlayer(
+            sample_rate=config.audio.tts_sample_rate,
+            buffer_seconds=config.audio.playback_buffer_seconds,
+        )
+    return _audio_player
@@ -0,0 +1,107 @@
+"""Prompt-cache-friendly request layout for Claude."""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, List, Optional
+from .history import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Shortest prefix Claude will cache, by model family. A breakpoint on a
+# shorter prefix is accepted but never cached.
+_MIN_CACHEABLE_TOKENS = {"haiku": 2048}
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
+
+def min_cacheable_tokens(model: str) -> int:
+    """Shortest cacheable prompt prefix for a Claude model, in tokens."""
+    for family, tokens in _MIN_CACHEABLE_TOKENS.items():
+        if family in model:
+            return tokens
+    return DEFAULT_MIN_CACHEABLE_TOKENS
+
+
+@dataclass
+class CacheUsage:
+    """Prompt cache token usage for a single request."""
+
+    input_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+
+    @classmethod
+    def from_usage(cls, usage: Any) -> "CacheUsage":
+        """Build from the usage block of a Claude response."""
+        return cls(
+            input_tokens=getattr(usage, "input_tokens", 0) or 0,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", 0) or 0,
+            cache_creation_tokens=getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        )
+
+    @property
+    def hit(self) -> bool:
+        """Whether any part of the prompt was served from cache."""
+        return self.cache_read_tokens > 0
+
+    def add(self, other: "CacheUsage"):
+        """Accumulate another request's usage into this one."""
+        self.input_tokens += other.input_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_creation_tokens += other.cache_creation_tokens
+
+
+def build_claude_request(
+    system_prompt: str,
+    history: List[dict],
+    current_message: dict,
+    summary: Optional[str] = None,
+    min_cache_tokens: int = DEFAULT_MIN_CACHEABLE_TOKENS,
+    cache_history: bool = True,
+    **params,
+) -> dict:
+    """Build Claude request arguments with a byte-stable cacheable prefix.
+
+    The character prompt is sent unchanged as the first system block, so it
+    is shared by every turn. Anything that changes between turns comes after
+    it: the running summary, then the conversation, whose last prior message
+    carries a breakpoint so the history prefix is reused by the next turn.
+
+    Claude only caches prefixes of at least ``min_cache_tokens`` (see
+    ``min_cacheable_tokens``). The character prompts are shorter than that
+    on their own, so the character prompt is a breakpoint only when it is
+    long enough; until the conversation grows past the minimum, requests are
+    not cached at all. Pass ``cache_history`` False when the history will be
+    trimmed after this turn: the next request would not share its prefix, so
+    writing it to the cache would only cost more.
+    """
+    system = [{"type": "text", "text": system_prompt}]
+    prefix_tokens = estimate_tokens(system_prompt)
+    if prefix_tokens >= min_cache_tokens:
+        system[0]["cache_control"] = CACHE_CONTROL
+    if summary:
+        system.append({"type": "text", "text": f"CONVERSATION SO FAR:\n{summary}"})
+        prefix_tokens += estimate_tokens(system[-1]["text"])
+
+    messages = [{"role": msg["role"], "content": msg["content"]} for msg in history]
+    prefix_tokens += sum(estimate_tokens(msg["content"]) for msg in messages)
+    if cache_history and messages and prefix_tokens >= min_cache_tokens:
+        last = messages[-1]
+        last["content"] = [
+            {"type": "text", "text": last["content"], "cache_control": CACHE_CONTROL}
+        ]
+    messages.append(
+        {"role": current_message["role"], "content": current_message["content"]}
+    )
+
+    return {"system": system, "messages": messages, **params}
+
+
+def log_cache_usage(name: str, usage: CacheUsage):
+    """Log prompt cache hit/miss tokens for a turn."""
+    logger.info(
+        f"{name} prompt cache {'hit' if usage.hit else 'miss'}: "
+        f"read={usage.cache_read_tokens} created={usage.cache_creation_tokens} "
+        f"uncached={usage.input_tokens}"
+    )
@@ -0,0 +1,250 @@
+"""Rate limiting, retries and circuit breaking for provider API calls."""
+
+import asyncio
+import hashlib
+import logging
+import random
+import sys
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+from .config import ProviderLimits, config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling the provider while its circuit is open."""
+
+
+class ProviderHTTPError(RuntimeError):
+    """HTTP error returned by a provider API."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"HTTP {status_code}: {message}")
+        self.status_code = status_code
+
+
+# Transport errors of the client libraries, by module and class name. They
+# are looked up only in modules already imported, since an error can only
+# come from a library that has been loaded.
+_NETWORK_ERRORS = (
+    ("aiohttp", "ClientError"),
+    ("httpx", "TransportError"),
+    ("anthropic", "APIConnectionError"),
+    ("openai", "APIConnectionError"),
+    ("websockets", "WebSocketException"),
+)
+
+
+def _network_error_types() -> Tuple[type, ...]:
+    types = [OSError, asyncio.TimeoutError]
+    for module_name, class_name in _NETWORK_ERRORS:
+        error_type = getattr(sys.modules.get(module_name), class_name, None)
+        if isinstance(error_type, type):
+            types.append(error_type)
+    return tuple(types)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an error is worth retrying.
+
+    Network errors and timeouts are retried, as are throttling and server-side
+    HTTP errors. Other client errors would fail the same way again, and any
+    other exception is a bug rather than a provider problem.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    if isinstance(status, int):
+        return status in (408, 409, 429) or status >= 500
+    return isinstance(error, _network_error_types())
+
+
+class TokenBucket:
+    """Token bucket rate limiter."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until enough tokens are available, then take them."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """Fail fast while a provider keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are rejected for ``reset_timeout`` seconds. One trial call is then
+    let through; success closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted now."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            return True
+        # Only one trial call at a time while half open
+        return self.state == self.CLOSED
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self._failures = 0
+
+    def release_trial(self):
+        """Give up a trial call without a verdict, as when it was cancelled.
+
+        The circuit stays open but lets the next call through as a new trial.
+        """
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
+
+    def record_failure(self):
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+class ProviderGuard:
+    """Rate limiter, retry policy and circuit breaker for one provider key."""
+
+    def __init__(self, name: str, limits: ProviderLimits):
+        self.name = name
+        self.limits = limits
+        self.bucket = TokenBucket(limits.requests_per_second, limits.burst)
+        self.breaker = CircuitBreaker(limits.failure_threshold, limits.reset_timeout)
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for a retry attempt."""
+        ceiling = min(self.limits.max_delay, self.limits.base_delay * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    async def _attempts(self, attempt_call: Callable[[], Awaitable[T]]) -> T:
+        deadline = time.monotonic() + self.limits.deadline
+        attempt = 0
+
+        while True:
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"{self.name} circuit is open")
+
+            remaining = deadline - time.monotonic()
+            try:
+                await asyncio.wait_for(self.bucket.acquire(), remaining)
+                result = await asyncio.wait_for(
+                    attempt_call(), deadline - time.monotonic()
+                )
+            except Exception as e:
+                # Client errors and bugs say nothing about the provider's health
+                if is_retryable(e):
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.release_trial()
+                attempt += 1
+                delay = self.backoff(attempt)
+                if (
+                    not is_retryable(e)
+                    or attempt >= self.limits.max_attempts
+                    or time.monotonic() + delay >= deadline
+                ):
+                    raise
+                logger.warning(
+                    f"{self.name} call failed ({e}), retry {attempt} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled, e.g. a hedge that lost or a barge-in
+                self.breaker.release_trial()
+                raise
+
+            self.breaker.record_success()
+            return result
+
+    async def call(self, fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """Call ``fn`` with rate limiting, retries and circuit breaking."""
+        return await self._attempts(lambda: fn(*args, **kwargs))
+
+    async def stream(
+        self, open_stream: Callable[[], AsyncIterator[T]]
+    ) -> AsyncIterator[T]:
+        """Guard a stream.
+
+        Opening the stream and receiving its first item are retried; once
+        output has started a failure is raised, since replaying it would
+        repeat what the caller has already consumed.
+        """
+
+        async def first_item() -> Tuple[AsyncIterator[T], Optional[T], bool]:
+            stream = open_stream()
+            try:
+                return stream, await stream.__anext__(), False
+            except StopAsyncIteration:
+                return stream, None, True
+            except BaseException:
+                await stream.aclose()
+                raise
+
+        stream, first, exhausted = await self._attempts(first_item)
+        if exhausted:
+            return
+        try:
+            yield first
+            async for item in stream:
+                yield item
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        finally:
+            await stream.aclose()
+
+
+class GuardRegistry:
+    """One guard per provider and API key."""
+
+    def __init__(self):
+        self._guards: Dict[Tuple[str, str], ProviderGuard] = {}
+
+    def get(self, provider: str, api_key: str = "") -> ProviderGuard:
+        """Get the guard for a provider ("anthropic", "openai", ...)."""
+        key_id = hashlib.sha256(api_key.encode()).hexdigest()[:12]
+        if (provider, key_id) not in self._guards:
+            limits = getattr(config.resilience, provider)
+            self._guards[(provider, key_id)] = ProviderGuard(provider, limits)
+        return self._guards[(provider, key_id)]
+
+
+# Global instance
+guards = GuardRegistry()
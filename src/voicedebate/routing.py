@@ -0,0 +1,205 @@
+"""Latency-aware, hedged routing of LLM requests across providers."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
+from .config import config
+from .llm_clients import LLMRequest, LLMResponse, UsageCallback, llm_clients
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelTarget:
+    """A provider/model pair a request can be sent to."""
+
+    provider: str
+    model: str
+
+    def __str__(self) -> str:
+        return f"{self.provider}:{self.model}"
+
+
+class LatencyTracker:
+    """Rolling latency samples per model target."""
+
+    def __init__(self, window: int = 100):
+        self.window = window
+        self._samples: Dict[ModelTarget, Deque[float]] = {}
+
+    def record(self, target: ModelTarget, seconds: float):
+        """Record one latency sample."""
+        samples = self._samples.setdefault(target, deque(maxlen=self.window))
+        samples.append(seconds)
+
+    def count(self, target: ModelTarget) -> int:
+        """Number of samples held for a target."""
+        return len(self._samples.get(target, ()))
+
+    def percentile(self, target: ModelTarget, pct: float) -> Optional[float]:
+        """Nearest-rank percentile of the recorded samples, if any."""
+        samples = self._samples.get(target)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+
+class HedgedRouter:
+    """Send a request to its primary model and hedge slow ones.
+
+    If the primary has not answered by its p95-based deadline, the same
+    request goes to the next configured target. Whichever answers first wins
+    and the others are cancelled. A failed request moves on to the next target
+    immediately.
+    """
+
+    def __init__(
+        self,
+        default_deadline: float = 2.0,
+        percentile: float = 95.0,
+        min_samples: int = 5,
+        window: int = 100,
+    ):
+        self.default_deadline = default_deadline
+        self.percentile = percentile
+        self.min_samples = min_samples
+        # Full completions and time-to-first-token have different
+        # distributions, so they are tracked separately
+        self.completion_latency = LatencyTracker(window)
+        self.first_token_latency = LatencyTracker(window)
+
+    def hedge_deadline(self, tracker: LatencyTracker, target: ModelTarget) -> float:
+        """Seconds to wait on a target before sending a hedged request."""
+        if tracker.count(target) < self.min_samples:
+            return self.default_deadline
+        return tracker.percentile(target, self.percentile)
+
+    async def _race(
+        self,
+        targets: List[ModelTarget],
+        tracker: LatencyTracker,
+        start: Callable[[ModelTarget], Awaitable],
+        discard: Optional[Callable[[object], Awaitable]] = None,
+    ):
+        """Run ``start`` on targets with hedging; return (result, target).
+
+        ``discard`` releases the result of a request that finished but lost.
+        ``start`` records the latency of requests that finish; requests still
+        running when another wins are recorded here with the time they had
+        taken, a lower bound, so slow targets keep their hedge deadline up.
+        """
+        remaining = list(targets)
+        first = remaining.pop(0)
+        tasks = {asyncio.ensure_future(start(first)): first}
+        started = {target: time.monotonic() for target in tasks.values()}
+        deadline = self.hedge_deadline(tracker, first)
+        error: Optional[BaseException] = None
+        won = False
+
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(
+                    tasks,
+                    timeout=deadline if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not done:
+                    target = remaining.pop(0)
+                    logger.info(f"Hedging slow request with {target}")
+                    tasks[asyncio.ensure_future(start(target))] = target
+                    started[target] = time.monotonic()
+                    deadline = self.hedge_deadline(tracker, target)
+                    continue
+
+                for task in done:
+                    target = tasks.pop(task)
+                    if task.exception() is None:
+                        won = True
+                        return task.result(), target
+                    error = task.exception()
+                    logger.warning(f"Request to {target} failed: {error}")
+
+                if not tasks and remaining:
+                    target = remaining.pop(0)
+                    tasks[asyncio.ensure_future(start(target))] = target
+                    started[target] = time.monotonic()
+                    deadline = self.hedge_deadline(tracker, target)
+
+            raise error
+        finally:
+            for task, target in tasks.items():
+                if not task.done():
+                    task.cancel()
+                    if won:
+                        tracker.record(target, time.monotonic() - started[target])
+                elif discard and not task.cancelled() and task.exception() is None:
+                    await discard(task.result())
+
+    async def complete(
+        self, request: LLMRequest, targets: List[ModelTarget]
+    ) -> LLMResponse:
+        """Run a request, hedging across targets."""
+
+        async def start(target: ModelTarget) -> LLMResponse:
+            started = time.monotonic()
+            response = await llm_clients.get(target.provider).complete(
+                replace(request, model=target.model)
+            )
+            self.completion_latency.record(target, time.monotonic() - started)
+            return response
+
+        response, _ = await self._race(targets, self.completion_latency, start)
+        return response
+
+    async def stream(
+        self,
+        request: LLMRequest,
+        targets: List[ModelTarget],
+        on_usage: Optional[UsageCallback] = None,
+    ) -> AsyncIterator[str]:
+        """Stream a request, hedging on time to first token."""
+
+        async def start(target: ModelTarget):
+            started = time.monotonic()
+            stream = llm_clients.get(target.provider).stream(
+                replace(request, model=target.model), on_usage=on_usage
+            )
+            try:
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                first = ""
+            except asyncio.CancelledError:
+                await stream.aclose()
+                raise
+            self.first_token_latency.record(target, time.monotonic() - started)
+            return stream, first
+
+        async def discard(result):
+            await result[0].aclose()
+
+        (stream, first), target = await self._race(
+            targets, self.first_token_latency, start, discard
+        )
+        logger.debug(f"Streaming response from {target}")
+
+        try:
+            if first:
+                yield first
+            async for delta in stream:
+                yield delta
+        finally:
+            await stream.aclose()
+
+
+# Global instance
+llm_router = HedgedRouter(
+    default_deadline=config.llm.hedge_default_deadline,
+    percentile=config.llm.hedge_percentile,
+    min_samples=config.llm.hedge_min_samples,
+)
@@ -0,0 +1,51 @@
+"""Sentence boundary detection for streamed text."""
+
+import re
+from typing import List, Optional
+
+# A terminator only counts once we have seen the whitespace that follows it,
+# so "3." followed later by "14" in the next delta is not split.
+_BOUNDARY = re.compile(r"[.!?;:]+[\"')\]]*\s+")
+
+_ABBREVIATIONS = {"mr.", "mrs.", "ms.", "dr.", "st.", "vs.", "e.g.", "i.e.", "etc."}
+
+
+class SentenceSplitter:
+    """Accumulate streamed text deltas and emit finished sentences."""
+
+    def __init__(self, min_chars: int = 2):
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, delta: str) -> List[str]:
+        """Add a text delta and return any sentences it completed."""
+        self._buffer += delta
+        sentences = []
+        start = 0
+
+        for match in _BOUNDARY.finditer(self._buffer):
+            candidate = self._buffer[start : match.end()].strip()
+            last_word = candidate.rsplit(None, 1)[-1].lower() if candidate else ""
+            if len(candidate) < self.min_chars or last_word in _ABBREVIATIONS:
+                continue
+            sentences.append(candidate)
+            start = match.end()
+
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> Optional[str]:
+        """Return whatever text is left once the stream has ended."""
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        return remainder or None
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split a complete text into sentences."""
+    splitter = SentenceSplitter()
+    sentences = splitter.feed(text)
+    remainder = splitter.flush()
+    if remainder:
+        sentences.append(remainder)
+    return sentences
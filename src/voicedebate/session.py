@@ -0,0 +1,89 @@
+"""Per-session conversation state for VoiceDebate."""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from .history import ConversationHistory
+from .prompt_cache import CacheUsage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION = "default"
+
+
+class SessionState:
+    """Mutable state of one conversation with one character."""
+
+    __slots__ = ("history", "cache_usage", "last_cache_usage", "last_active")
+
+    def __init__(self, history: ConversationHistory):
+        self.history = history
+        self.cache_usage = CacheUsage()  # Cumulative prompt cache usage
+        self.last_cache_usage: Optional[CacheUsage] = None
+        self.last_active = time.monotonic()
+
+
+class SessionStore:
+    """Session states keyed by (session id, character name).
+
+    Entries are kept in least-recently-used order, so idle sessions are
+    evicted from the front in time proportional to the number evicted.
+    """
+
+    def __init__(self, idle_timeout: float = 1800.0, max_sessions: int = 1000):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[Tuple[str, str], SessionState]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(
+        self,
+        session_id: str,
+        character_name: str,
+        factory: Callable[[], SessionState],
+    ) -> SessionState:
+        """Get a session's state, creating it with ``factory`` if needed."""
+        self.evict_idle()
+        key = (session_id, character_name)
+
+        state = self._sessions.get(key)
+        if state is None:
+            state = self._sessions[key] = factory()
+            while len(self._sessions) > self.max_sessions:
+                self._drop(next(iter(self._sessions)))
+        else:
+            self._sessions.move_to_end(key)
+            state.last_active = time.monotonic()
+        return state
+
+    def evict_idle(self) -> int:
+        """Drop sessions idle for longer than the timeout."""
+        cutoff = time.monotonic() - self.idle_timeout
+        evicted = 0
+        while self._sessions:
+            key, state = next(iter(self._sessions.items()))
+            if state.last_active > cutoff:
+                break
+            self._drop(key)
+            evicted += 1
+        if evicted:
+            logger.info(f"Evicted {evicted} idle sessions")
+        return evicted
+
+    def end_session(self, session_id: str):
+        """Drop all state of a session."""
+        for key in [key for key in self._sessions if key[0] == session_id]:
+            self._drop(key)
+
+    def remove_character(self, character_name: str):
+        """Drop every session's state for a character."""
+        for key in [key for key in self._sessions if key[1] == character_name]:
+            self._drop(key)
+
+    def _drop(self, key: Tuple[str, str]):
+        # Only the reference is dropped; a view still holding the state, such
+        # as a response in progress, keeps its history intact
+        del self._sessions[key]
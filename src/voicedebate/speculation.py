@@ -0,0 +1,79 @@
+"""Speculative response generation on interim transcripts."""
+
+import asyncio
+import logging
+import re
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_PUNCTUATION = re.compile(r"[^\w\s']")
+
+
+def normalize_transcript(text: str) -> str:
+    """Reduce a transcript to the words that matter for comparison."""
+    return " ".join(_PUNCTUATION.sub(" ", text.lower()).split())
+
+
+class SpeculativeResponder:
+    """Start generating a response while the user is still finishing.
+
+    Generation starts on the transcript seen when the speaker looks to be
+    done, and is only used if the final transcript says the same thing.
+    Speculative responses never touch conversation history until resolved.
+    """
+
+    def __init__(self, assistant, min_words: int = 3):
+        self.assistant = assistant
+        self.min_words = min_words
+        self._task: Optional[asyncio.Task] = None
+        self._text = ""
+
+    def on_finishing(self, transcript: str):
+        """Start (or restart) speculation on the latest stable transcript."""
+        normalized = normalize_transcript(transcript)
+        if len(normalized.split()) < self.min_words or normalized == self._text:
+            return
+
+        self.cancel()
+        self._text = normalized
+        self._task = asyncio.get_event_loop().create_task(
+            self.assistant.speculate(transcript)
+        )
+        logger.info(f"Speculating on: {transcript}")
+
+    async def resolve(self, final_transcript: str) -> Optional[str]:
+        """Return the speculative response if it matches the final transcript.
+
+        On a match the turn is committed to the assistant's history. Otherwise
+        the speculation is cancelled and None is returned so the caller runs a
+        normal request.
+        """
+        task, text = self._task, self._text
+        self._task, self._text = None, ""
+
+        if task is None:
+            return None
+        if normalize_transcript(final_transcript) != text:
+            logger.info("Final transcript differs from speculation, discarding")
+            task.cancel()
+            return None
+
+        try:
+            response = await task
+        except asyncio.CancelledError:
+            return None
+        except Exception as e:
+            logger.error(f"Speculative generation failed: {e}")
+            return None
+
+        self.assistant.commit_turn(final_transcript, response)
+        logger.info("Using speculative response")
+        return response
+
+    def cancel(self):
+        """Cancel any in-flight speculation."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._text = ""
@@ -2,35 +2,70 @@
 
 import asyncio
 import logging
-import numpy as np
-import sounddevice as sd
-import requests
-import io
-import wave
-from scipy import signal
-from deepgram import (
-    DeepgramClient,
-    DeepgramClientOptions,
-    LiveTranscriptionEvents,
-    LiveOptions,
-    Microphone,
-)
+from collections import deque
+from voicedebate import metrics
 from voicedebate.config import config
+from voicedebate.mic_gate import MicGate
+from voicedebate.resilience import CircuitOpenError, guards
+from voicedebate.sentences import split_sentences
+from voicedebate.transcript import TranscriptAssembler
+from voicedebate.tts_cache import cache_key, get_tts_cache
+from voicedebate.tts_client import ElevenLabsClient, TextToSpeechStream
+from voicedebate.tts_scheduler import SpokenText, SynthesisScheduler
+from typing import TYPE_CHECKING, AsyncIterator, Deque, Optional
 import time
 
+if TYPE_CHECKING:
+    import numpy as np
+    from deepgram import DeepgramClient, LiveOptions
+    from voicedebate.audio_capture import AudioCapture
+    from voicedebate.playback import AudioPlayer
+    from voicedebate.tts_cache import TTSCache
+    from voicedebate.vad import VADEvent
+
 logger = logging.getLogger(__name__)
 
-# Configure API keys with options
-dg = DeepgramClient(
-    api_key=config.api.deepgram_api_key,
-)
+# Service clients are created on first use; the Deepgram SDK and the audio
+# libraries take seconds to import and are not needed to read logs or configs.
+_deepgram_client: Optional["DeepgramClient"] = None
+_speech_processor: Optional["SpeechProcessor"] = None
+
+
+def get_deepgram_client() -> "DeepgramClient":
+    """Get the shared Deepgram client, creating it on first use."""
+    global _deepgram_client
+    if _deepgram_client is None:
+        from deepgram import DeepgramClient, DeepgramClientOptions
+
+        options = None
+        if config.endpoints.deepgram_url:
+            options = DeepgramClientOptions(url=config.endpoints.deepgram_url)
+        _deepgram_client = DeepgramClient(
+            api_key=config.api.deepgram_api_key, config=options
+        )
+    return _deepgram_client
+
+
+def get_speech_processor() -> "SpeechProcessor":
+    """Get the global speech processor, creating it on first use."""
+    global _speech_processor
+    if _speech_processor is None:
+        _speech_processor = SpeechProcessor()
+    return _speech_processor
+
+
+def __getattr__(name: str):
+    # Keep the old module-level globals importable
+    if name == "speech_processor":
+        return get_speech_processor()
+    if name == "dg":
+        return get_deepgram_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SpeechProcessor:
     """Speech processing handler."""
 
-    API_BASE = "https://api.elevenlabs.io/v1"
-    CHUNK_SIZE = 1024
     TARGET_SAMPLE_RATE = 16000
 
     def __init__(self):
@@ -39,32 +74,81 @@ class SpeechProcessor:
         self.synthesizer = None
         self._setup_services()
         self._vad_callback = None
-        self._last_speech_time = None
-        self._is_speaking = False
+        self._presynthesized: dict[tuple[str, str], bytes] = {}
 
     def _setup_services(self):
         self._api_key = config.api.elevenlabs_api_key
-        if not self._api_key:
-            raise ValueError("ElevenLabs API key not found in config")
-
         self._model_id = "eleven_monolingual_v1"
+        self._tts_client: Optional[ElevenLabsClient] = None
         self.dg_connection = None
-        self.microphone = None
-        self.current_transcript = ""
+        # The detectors need numpy, which is only imported once a speech
+        # processor is created
+        from voicedebate.vad import VoiceActivityDetector
+
+        self.microphone: Optional["AudioCapture"] = None
+        self.vad = VoiceActivityDetector(
+            sample_rate=self.TARGET_SAMPLE_RATE,
+            energy_margin_db=config.audio.vad_energy_margin_db,
+            min_speech_ms=config.audio.vad_min_speech_ms,
+            hangover_ms=config.audio.vad_hangover_ms,
+            max_speech_ms=config.audio.vad_max_speech_ms,
+            on_event=self._on_vad_event,
+        )
+        self.barge_in_vad = VoiceActivityDetector(
+            sample_rate=self.TARGET_SAMPLE_RATE,
+            energy_margin_db=config.audio.barge_in_margin_db,
+            min_speech_ms=config.audio.barge_in_min_speech_ms,
+            on_event=self._on_barge_in_event,
+        )
+        self._monitoring = False
+        self._barge_in_callback = None
+        self._player: Optional["AudioPlayer"] = None
+        self.mic_gate = MicGate(
+            self._send_to_transcriber,
+            sample_rate=self.TARGET_SAMPLE_RATE,
+            preroll_ms=config.audio.mic_gate_preroll_ms,
+            enabled=config.audio.mic_gate,
+        )
+        self._connected = False
+        self._capturing = False  # a turn's audio is being captured
+        self._mic_held = False  # a capture is about to take over the microphone
+        self._turn_open = False  # transcripts belong to the current turn
+        self._session_lock = asyncio.Lock()
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._finalized = asyncio.Event()
+        # Finalize requests sent and answered on the current connection;
+        # results count for a turn only once the finalizes sent before it
+        # have been answered
+        self._finalize_sent = 0
+        self._finalize_answered = 0
+        self._turn_finalizes = 0  # finalizes sent before the current turn
+        # Turn audio held while a dropped connection is re-established
+        self._held_audio: Deque[bytes] = deque(
+            maxlen=10000 // config.audio.capture_chunk_ms
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.transcript = TranscriptAssembler()
         self._transcript_callback = None
-
-    async def start_capture(self, transcript_callback=None, vad_callback=None):
-        """Start audio capture with live transcription."""
-        try:
-            # Clear the transcript when starting new recording
-            self.current_transcript = ""
-
-            self._transcript_callback = transcript_callback
-            self._vad_callback = vad_callback
-            self._last_speech_time = None
-            self._is_speaking = False
-
-            self.dg_connection = dg.listen.live.v("1")
+        self._publish_trigger = None
+        self._published_version = -1
+        self._finishing_callback = None
+        self._finishing_trigger = None
+        self._finishing_text = ""
+
+    async def open_session(self):
+        """Open the live transcription connection if it is not open yet.
+
+        The connection is reused for every turn and kept alive between
+        them, so a turn starts streaming audio without a new handshake.
+        """
+        from deepgram import LiveTranscriptionEvents
+
+        async with self._session_lock:
+            if self._connected:
+                return
+            self._loop = asyncio.get_running_loop()
+            self.dg_connection = get_deepgram_client().listen.live.v("1")
+            self._finalize_sent = self._finalize_answered = self._turn_finalizes = 0
 
             # Set up event handlers
             self.dg_connection.on(LiveTranscriptionEvents.Open, self._on_open)
@@ -74,52 +158,249 @@ class SpeechProcessor:
             self.dg_connection.on(LiveTranscriptionEvents.Error, self._on_error)
             self.dg_connection.on(LiveTranscriptionEvents.Close, self._on_close)
 
-            # Configure transcription options with VAD
-            options = LiveOptions(
-                model="nova-2",
-                punctuate=True,
-                language="en-US",
-                encoding="linear16",
-                channels=1,
-                sample_rate=16000,
-                interim_results=True,
-                utterance_end_ms="1000",
-                vad_events=True,
+            # Open the websocket off the event loop, with retries
+            await guards.get("deepgram", config.api.deepgram_api_key).call(
+                self._start_connection, self._live_options()
             )
-
-            # Start the connection without awaiting
-            self.dg_connection.start(options)
+            self._connected = True
             logger.info("Deepgram connection started")
 
-            # Start the microphone with the correct send method
-            self.microphone = Microphone(self.dg_connection.send)
-            self.microphone.start()
-            logger.info("Microphone started")
+            if self._keepalive_task is None or self._keepalive_task.done():
+                self._keepalive_task = asyncio.create_task(self._keep_alive())
+
+    async def close_session(self):
+        """Close the live transcription connection."""
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        self._capturing = self._turn_open = self._monitoring = False
+        self._mic_held = False
+        self.mic_gate.close()
+        self._release_microphone()
+        self.mic_gate.log_summary()
+        metrics.turn_metrics.record_transcription_audio(self.mic_gate.summary())
+        if self.dg_connection:
+            connection, self.dg_connection = self.dg_connection, None
+            self._connected = False
+            await asyncio.to_thread(connection.finish)
+
+    def _live_options(self) -> "LiveOptions":
+        from deepgram import LiveOptions
+
+        # Configure transcription options with VAD
+        return LiveOptions(
+            model="nova-2",
+            punctuate=True,
+            language="en-US",
+            encoding="linear16",
+            channels=1,
+            sample_rate=16000,
+            interim_results=True,
+            utterance_end_ms="1000",
+            vad_events=True,
+        )
+
+    async def _keep_alive(self):
+        """Send KeepAlive messages while no audio is being streamed."""
+        interval = config.audio.stt_keepalive_interval
+        while True:
+            await asyncio.sleep(interval)
+            idle = time.monotonic() - self.mic_gate.last_sent
+            if self._connected and idle >= interval and self.dg_connection:
+                try:
+                    await asyncio.to_thread(self.dg_connection.keep_alive)
+                except Exception as e:
+                    logger.warning(f"Deepgram keep-alive failed: {e}")
+
+    async def start_capture(
+        self, transcript_callback=None, vad_callback=None, finishing_callback=None
+    ):
+        """Start capturing a turn on the live transcription connection.
+
+        ``vad_callback`` receives the local voice activity detector's
+        ``VADEvent``s; ``finishing_callback`` receives the transcript so far whenever the
+        speaker looks to be finishing their utterance.
+        """
+        try:
+            await self.open_session()
+
+            # Each turn gets its own transcript
+            self.transcript.reset()
+            self._published_version = -1
+            if self._publish_trigger is None:
+                from kivy.clock import Clock
+
+                # Coalesces transcript updates to at most one per frame
+                self._publish_trigger = Clock.create_trigger(self._publish_transcript)
+                self._finishing_trigger = Clock.create_trigger(self._publish_finishing)
+
+            self._transcript_callback = transcript_callback
+            self._vad_callback = vad_callback
+            self._finishing_callback = finishing_callback
+            self.vad.reset()
+            self._finalized = asyncio.Event()
+            self._turn_finalizes = self._finalize_sent
+            self._held_audio.clear()
+            self._turn_open = True
+            # Audio from just before the turn belongs to it only if the user
+            # started talking over the assistant
+            self.mic_gate.start_turn(keep_preroll=self.barge_in_vad.speaking)
+            self._capturing = True
+            self._mic_held = False
+
+            self._ensure_microphone()
 
         except Exception as e:
+            self._capturing = self._turn_open = self._mic_held = False
+            self._release_microphone()
             logger.error(f"Error starting capture: {e}")
             raise
 
-    async def stop_capture(self) -> tuple[np.ndarray, dict]:
-        """Stop audio capture and return final transcription."""
-        try:
-            if self.microphone:
-                self.microphone.finish()
+    async def stop_capture(self) -> tuple["np.ndarray", dict]:
+        """Stop capturing the turn and return its final transcription.
 
-            if self.dg_connection:
-                # Don't await the finish call
-                self.dg_connection.finish()
+        The connection stays open; Deepgram is asked to finalize the audio
+        it has so the last words land in this turn.
+        """
+        import numpy as np
+
+        try:
+            self._capturing = False
+            self.mic_gate.close()
+            self._release_microphone()
+
+            if self._turn_open and self._connected:
+                self._finalize_sent += 1
+                await asyncio.to_thread(self.dg_connection.finalize)
+                try:
+                    await asyncio.wait_for(
+                        self._finalized.wait(), config.audio.stt_finalize_timeout
+                    )
+                except asyncio.TimeoutError:
+                    logger.debug("No finalize response before the timeout")
 
             # Return the final transcript
-            return np.array([]), {
-                "text": self.current_transcript,
-                "confidence": 1.0,
-                "words": [],
-            }
+            return np.array([]), self.transcript.result()
 
         except Exception as e:
             logger.error(f"Error stopping capture: {e}")
             return np.array([]), {"text": "", "confidence": 0.0, "words": []}
+        finally:
+            self._capturing = self._turn_open = False
+            self._held_audio.clear()
+            self.transcript.reset()
+            metrics.turn_metrics.record_transcription_audio(self.mic_gate.summary())
+
+    def start_monitoring(self, barge_in_callback):
+        """Listen for the user talking over the assistant.
+
+        The microphone runs but its audio stays local; ``barge_in_callback``
+        receives the ``VADEvent`` when speech starts.
+        """
+        from voicedebate.playback import get_audio_player
+
+        self._player = get_audio_player()
+        self._barge_in_callback = barge_in_callback
+        self.barge_in_vad.reset()
+        self._monitoring = True
+        self._mic_held = False
+        try:
+            self._ensure_microphone()
+        except Exception as e:
+            self._monitoring = False
+            logger.error(f"Error starting barge-in detection: {e}")
+
+    def stop_monitoring(self):
+        """Stop listening for barge-in."""
+        self._monitoring = False
+        self._barge_in_callback = None
+        self._release_microphone()
+
+    def hold_microphone(self, hold: bool = True):
+        """Keep the microphone running for the capture or monitoring that
+        follows.
+
+        Ending a capture or barge-in detection then leaves the device open,
+        so audio spoken while the next one starts is not lost. The hold ends
+        when capture or monitoring starts, the session closes, or it is
+        released with ``hold`` False.
+        """
+        self._mic_held = hold
+        if not hold:
+            self._release_microphone()
+
+    def _ensure_microphone(self):
+        if self.microphone:
+            return
+        from voicedebate.audio_capture import create_capture
+
+        # Small frames keep voice activity decisions prompt
+        self.microphone = create_capture(self._on_audio, self.TARGET_SAMPLE_RATE)
+        self.microphone.start()
+        logger.info("Microphone started")
+
+    def _release_microphone(self):
+        """Stop the microphone unless a turn or barge-in detection needs it."""
+        if self.microphone and not (
+            self._capturing or self._monitoring or self._mic_held
+        ):
+            self.microphone.stop()
+            self.microphone = None
+
+    def _on_audio(self, data: bytes):
+        """Run voice activity detection on a microphone frame and pass it
+        through the mic gate.
+
+        Called on the capture thread.
+        """
+        try:
+            if self._capturing:
+                self.vad.process(data)
+            elif self._monitoring:
+                # The assistant's own voice reaches the microphone too, so
+                # the level being played serves as an echo reference
+                self.barge_in_vad.process(data, echo_db=self._player.level_db)
+        except Exception as e:
+            logger.error(f"Voice activity detection error: {e}")
+        self.mic_gate.feed(data)
+
+    def _send_to_transcriber(self, data: bytes):
+        if self._connected and self.dg_connection:
+            while self._held_audio:
+                self.dg_connection.send(self._held_audio.popleft())
+            self.dg_connection.send(data)
+        elif self._turn_open:
+            self._held_audio.append(data)
+
+    def _on_vad_event(self, event: "VADEvent"):
+        from voicedebate.vad import SPEECH_START
+
+        if not self._capturing:
+            return
+        # Stream only while the user is speaking
+        if event.kind == SPEECH_START:
+            self.mic_gate.open()
+        else:
+            self.mic_gate.close()
+        if self._vad_callback:
+            from kivy.clock import Clock
+
+            Clock.schedule_once(lambda dt: self._vad_callback(event), 0)
+
+    def _on_barge_in_event(self, event: "VADEvent"):
+        from voicedebate.vad import SPEECH_START
+
+        callback = self._barge_in_callback
+        if event.kind == SPEECH_START and self._monitoring and callback:
+            from kivy.clock import Clock
+
+            Clock.schedule_once(lambda dt: callback(event), 0)
+
+    async def _start_connection(self, options: "LiveOptions"):
+        """Open the Deepgram live connection."""
+        started = await asyncio.to_thread(self.dg_connection.start, options)
+        if started is False:
+            raise ConnectionError("Failed to open Deepgram connection")
 
     def _on_open(self, *args, **kwargs):
         """Handle websocket open event."""
@@ -129,54 +410,83 @@ class SpeechProcessor:
         """Handle transcript event."""
         try:
             result = kwargs.get("result")
-            if not result:
+            if not result or (args and args[0] is not self.dg_connection):
+                return
+            if result.from_finalize:
+                self._finalize_answered += 1
+                # Answers a finalize sent during this turn
+                current = self._finalize_answered > self._turn_finalizes
+            else:
+                current = self._finalize_answered >= self._turn_finalizes
+            if not self._turn_open or not current:
+                # Late results of a finished turn
                 return
 
-            # Update speech detection
-            self._is_speaking = result.speech_final
-            current_time = time.time()
-
-            if self._is_speaking:
-                self._last_speech_time = current_time
-            elif self._last_speech_time is not None:
-                silence_duration = current_time - self._last_speech_time
-                if self._vad_callback:
-                    # Use Kivy's Clock instead of asyncio for the callback
-                    from kivy.clock import Clock
-
-                    Clock.schedule_once(
-                        lambda dt: self._vad_callback(
-                            self._is_speaking, silence_duration
-                        ),
-                        0,
-                    )
+            alternative = result.channel.alternatives[0]
+            transcript = alternative.transcript
+            if transcript or result.is_final:
+                self.transcript.add(
+                    transcript,
+                    is_final=result.is_final,
+                    confidence=alternative.confidence or 0.0,
+                    words=alternative.words,
+                )
 
-            # Get the transcript from the result
-            transcript = result.channel.alternatives[0].transcript
             if transcript:
-                logger.info(f"Got transcript: {transcript}")
-
-                # Only append if this is a final result
-                if result.is_final:
-                    self.current_transcript += " " + transcript.strip()
-                    self.current_transcript = self.current_transcript.strip()
-
-                if self._transcript_callback:
-                    # Use Kivy's Clock for transcript updates
-                    from kivy.clock import Clock
-
-                    display_text = self.current_transcript
-                    if not result.is_final:
-                        display_text += " " + transcript.strip()
-                    Clock.schedule_once(
-                        lambda dt: self._transcript_callback(display_text.strip()), 0
+                logger.debug(f"Got transcript: {transcript}")
+
+                # A finalized segment that ends the utterance or a sentence is
+                # a good sign the speaker is wrapping up
+                if (
+                    self._finishing_callback
+                    and self._finishing_trigger
+                    and result.is_final
+                    and (
+                        result.speech_final
+                        or transcript.rstrip().endswith((".", "?", "!"))
                     )
+                ):
+                    self._finishing_text = self.transcript.final_text
+                    self._finishing_trigger()
+
+                if self._transcript_callback and self._publish_trigger:
+                    self._publish_trigger()
+
+            # The turn's last words are in once its finalize is answered
+            if (
+                result.from_finalize
+                and self._finalize_answered == self._finalize_sent
+                and self._loop
+            ):
+                self._loop.call_soon_threadsafe(self._finalized.set)
 
         except Exception as e:
             logger.error(f"Error handling transcript: {e}", exc_info=True)
             logger.error(f"Args: {args}")
             logger.error(f"Kwargs: {kwargs}")
 
+    def _publish_transcript(self, dt=None):
+        """Show the latest transcript; runs on the UI thread once per frame."""
+        version = self.transcript.version
+        if (
+            self._turn_open
+            and self._transcript_callback
+            and version != self._published_version
+        ):
+            self._published_version = version
+            self._transcript_callback(self.transcript.display_text)
+
+    def _publish_finishing(self, dt=None):
+        """Pass the transcript so far to the finishing callback; runs on the
+        UI thread."""
+        if self._turn_open and self._finishing_callback:
+            self._finishing_callback(self._finishing_text)
+
+    @property
+    def current_transcript(self) -> str:
+        """The finalized transcript of the current turn."""
+        return self.transcript.final_text
+
     def _on_error(self, *args, **kwargs):
         """Handle error event."""
         error = kwargs.get("data", {})
@@ -184,55 +494,298 @@ class SpeechProcessor:
 
     def _on_close(self, *args, **kwargs):
         """Handle websocket close event."""
+        if args and args[0] is not self.dg_connection:
+            # A connection that was closed on purpose or replaced
+            return
+        self._connected = False
         logger.info("Deepgram connection closed")
+        # Between turns the next turn reopens the connection; during one it
+        # is reopened at once and the audio held meanwhile is sent on
+        if self._turn_open and self._loop:
+            logger.warning("Deepgram connection dropped during a turn")
+            self._loop.call_soon_threadsafe(
+                lambda: asyncio.ensure_future(self._reconnect())
+            )
 
-    async def synthesize_speech(
+    async def _reconnect(self):
+        """Reopen the connection for the turn in progress."""
+        try:
+            await self.open_session()
+            logger.info("Deepgram connection re-established")
+        except Exception as e:
+            logger.error(f"Could not reconnect to Deepgram: {e}")
+            if self._turn_open and self._transcript_callback:
+                from kivy.clock import Clock
+
+                Clock.schedule_once(
+                    lambda dt: self._transcript_callback(
+                        "Transcription connection lost"
+                    ),
+                    0,
+                )
+
+    async def stream_speech(
         self,
         text: str,
         voice_id: str,
         stability: float = 0.5,
         clarity: float = 0.75,
         style: float = 0.0,
-    ) -> bytes:
-        """Synthesize speech using ElevenLabs."""
+        timeline: Optional[metrics.TurnTimeline] = None,
+        reusable: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Stream synthesized speech as raw PCM chunks.
+
+        Audio is 16-bit mono PCM at ``config.audio.tts_sample_rate``. Lines
+        synthesized before are streamed from the TTS cache; new ones come
+        from ElevenLabs. They are cached once complete if they are
+        ``reusable``, such as scripted lines, or have been asked for before;
+        most generated sentences are never spoken twice. When a turn
+        ``timeline`` is given, the first and last audio bytes are marked on it.
+        """
+        voice_settings = {
+            "stability": stability,
+            "similarity_boost": clarity,
+            "style": style,
+            "use_speaker_boost": True,
+        }
+        cache = get_tts_cache() if config.audio.tts_cache else None
+        key = cache_key(
+            text,
+            voice_id,
+            self._model_id,
+            config.audio.tts_output_format,
+            **voice_settings,
+        )
+
+        source = self._cached_or_synthesized(cache, key, text, voice_id, voice_settings)
+        chunks = []
         try:
-            # Set up request
-            url = f"{self.API_BASE}/text-to-speech/{voice_id}/stream"
-            headers = {"Accept": "application/json", "xi-api-key": self._api_key}
-            data = {
-                "text": text,
-                "model_id": self._model_id,
-                "voice_settings": {
-                    "stability": stability,
-                    "similarity_boost": clarity,
-                    "style": style,
-                    "use_speaker_boost": True,
-                },
-            }
-
-            # Make request in thread pool since it's blocking
-            def make_request():
-                response = requests.post(url, headers=headers, json=data, stream=True)
-                if not response.ok:
-                    raise RuntimeError(f"ElevenLabs API error: {response.text}")
-
-                # Read all chunks into bytes
-                audio_data = b""
-                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
-                    audio_data += chunk
-                return audio_data
-
-            # Run in thread pool
-            audio_data = await asyncio.get_event_loop().run_in_executor(
-                None, make_request
+            async for chunk in source:
+                if timeline:
+                    timeline.mark(metrics.TTS_FIRST_BYTE)
+                chunks.append(chunk)
+                yield chunk
+            if timeline:
+                timeline.mark(metrics.TTS_LAST_BYTE)
+        finally:
+            await source.aclose()
+
+        if cache is not None and key not in cache and (reusable or cache.repeated(key)):
+            await cache.put(key, b"".join(chunks))
+
+    async def _cached_or_synthesized(
+        self,
+        cache: Optional["TTSCache"],
+        key: str,
+        text: str,
+        voice_id: str,
+        voice_settings: dict,
+    ) -> AsyncIterator[bytes]:
+        """Stream a line from the cache, or synthesize it if it is not there."""
+        if cache is not None and cache.lookup(key):
+            cached = cache.stream(key)
+            found = False
+            try:
+                async for chunk in cached:
+                    found = True
+                    yield chunk
+            finally:
+                await cached.aclose()
+            if found:
+                return
+            # The clip went missing from disk after the lookup
+            logger.warning("TTS cache entry disappeared, synthesizing again")
+
+        source = self._synthesize(text, voice_id, voice_settings)
+        try:
+            async for chunk in source:
+                yield chunk
+        finally:
+            await source.aclose()
+
+    @property
+    def tts_client(self) -> ElevenLabsClient:
+        """The pooled ElevenLabs client."""
+        if not self._api_key:
+            raise ValueError("ElevenLabs API key not found in config")
+        if self._tts_client is None:
+            self._tts_client = ElevenLabsClient(
+                self._api_key, config.endpoints.elevenlabs_base_url, self._model_id
+            )
+        return self._tts_client
+
+    async def warm_up(self):
+        """Open the ElevenLabs connection before the first turn needs it."""
+        if self._api_key:
+            await self.tts_client.warm_up()
+
+    async def _synthesize(
+        self, text: str, voice_id: str, voice_settings: dict
+    ) -> AsyncIterator[bytes]:
+        """Stream speech from the ElevenLabs streaming endpoint."""
+        client = self.tts_client
+        # Opening the stream is rate limited and retried
+        chunks = guards.get("elevenlabs", self._api_key).stream(
+            lambda: client.stream(
+                text, voice_id, voice_settings, config.audio.tts_output_format
             )
+        )
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
 
-            return audio_data
+    async def stream_input(
+        self,
+        voice_id: str,
+        stability: float = 0.5,
+        clarity: float = 0.75,
+        style: float = 0.0,
+    ) -> TextToSpeechStream:
+        """Open a websocket synthesis session to push text into as it arrives.
+
+        Audio from this mode bypasses the TTS cache.
+        """
+        client = self.tts_client
+        return await guards.get("elevenlabs", self._api_key).call(
+            client.stream_input,
+            voice_id,
+            {
+                "stability": stability,
+                "similarity_boost": clarity,
+                "style": style,
+                "use_speaker_boost": True,
+            },
+            config.audio.tts_output_format,
+        )
+
+    async def close(self):
+        """Release the ElevenLabs connection pool."""
+        if self._tts_client is not None:
+            await self._tts_client.close()
+
+    def scheduler(
+        self,
+        voice_id: str,
+        stability: float = 0.5,
+        clarity: float = 0.75,
+        style: float = 0.0,
+        timeline: Optional[metrics.TurnTimeline] = None,
+        spoken: Optional[SpokenText] = None,
+        skip_failed: bool = True,
+        reusable: bool = False,
+    ) -> SynthesisScheduler:
+        """A scheduler that synthesizes segments in one voice concurrently.
+
+        Live playback skips sentences that fail; with ``skip_failed`` False
+        a failure is raised instead.
+        """
+        return SynthesisScheduler(
+            lambda text: self.stream_speech(
+                text, voice_id, stability, clarity, style, timeline, reusable
+            ),
+            max_parallel=config.audio.tts_parallelism,
+            spoken=spoken,
+            skip_failed=skip_failed,
+        )
+
+    async def stream_segmented(
+        self,
+        text: str,
+        voice_id: str,
+        stability: float = 0.5,
+        clarity: float = 0.75,
+        style: float = 0.0,
+        timeline: Optional[metrics.TurnTimeline] = None,
+        skip_failed: bool = True,
+        reusable: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Stream speech for a text, synthesizing its sentences in parallel."""
+        scheduler = self.scheduler(
+            voice_id,
+            stability,
+            clarity,
+            style,
+            timeline,
+            skip_failed=skip_failed,
+            reusable=reusable,
+        )
+        for sentence in split_sentences(text) or [text]:
+            scheduler.submit(sentence)
+        scheduler.close()
+        async for chunk in scheduler:
+            yield chunk
 
+    async def synthesize_speech(
+        self,
+        text: str,
+        voice_id: str,
+        stability: float = 0.5,
+        clarity: float = 0.75,
+        style: float = 0.0,
+        timeline: Optional[metrics.TurnTimeline] = None,
+        reusable: bool = False,
+    ) -> bytes:
+        """Synthesize a whole clip of PCM speech; empty on failure.
+
+        Sentences are synthesized in parallel, so a long text takes about as
+        long as its slowest sentence. A sentence that fails fails the whole
+        clip rather than leaving a gap in it. ``reusable`` clips are cached
+        (see ``stream_speech``).
+        """
+        try:
+            chunks = [
+                chunk
+                async for chunk in self.stream_segmented(
+                    text,
+                    voice_id,
+                    stability,
+                    clarity,
+                    style,
+                    timeline,
+                    skip_failed=False,
+                    reusable=reusable,
+                )
+            ]
+            return b"".join(chunks)
+
+        except CircuitOpenError as e:
+            logger.warning(f"Speech synthesis skipped: {e}")
+            return bytes()
         except Exception as e:
             logger.error(f"Speech synthesis error: {e}")
             return bytes()
 
-
-# Create global instance AFTER class definition
-speech_processor = SpeechProcessor()
+    async def presynthesize(
+        self,
+        texts: list[str],
+        voice_id: str,
+        stability: float = 0.5,
+        clarity: float = 0.75,
+        style: float = 0.0,
+    ):
+        """Synthesize lines ahead of time and keep their audio in memory.
+
+        Lines already in the TTS cache are read from disk instead.
+        """
+        missing = [
+            text for text in texts if (voice_id, text) not in self._presynthesized
+        ]
+        results = await asyncio.gather(
+            *(
+                self.synthesize_speech(
+                    text, voice_id, stability, clarity, style, reusable=True
+                )
+                for text in missing
+            )
+        )
+        for text, audio in zip(missing, results):
+            if audio:
+                self._presynthesized[(voice_id, text)] = audio
+        logger.info(f"Pre-synthesized {len(missing)} lines for voice {voice_id}")
+
+    def get_presynthesized(self, text: str, voice_id: str) -> Optional[bytes]:
+        """Get pre-synthesized audio for a line, if available."""
+        return self._presynthesized.get((voice_id, text))
@@ -0,0 +1,141 @@
+"""Assembly of live transcription results into a turn's transcript."""
+
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+
+@dataclass
+class Word:
+    """A transcribed word with its timing in seconds from the stream start."""
+
+    word: str
+    start: float
+    end: float
+    confidence: float
+    punctuated_word: Optional[str] = None
+
+    @classmethod
+    def from_result(cls, word: Any) -> "Word":
+        """Build from a Deepgram word, either an SDK object or a dict."""
+        get = (
+            word.get if isinstance(word, dict) else lambda key: getattr(word, key, None)
+        )
+        return cls(
+            word=get("word") or "",
+            start=float(get("start") or 0.0),
+            end=float(get("end") or 0.0),
+            confidence=float(get("confidence") or 0.0),
+            punctuated_word=get("punctuated_word"),
+        )
+
+
+@dataclass
+class Segment:
+    """One transcription result: finalized, or the current hypothesis."""
+
+    text: str
+    confidence: float
+    words: List[Word] = field(default_factory=list)
+
+
+class TranscriptAssembler:
+    """Finalized segments of a turn plus the current interim hypothesis.
+
+    Deepgram sends interim results that are revised until a final result
+    replaces them. Finals are appended once and the interim is simply
+    swapped, so no result rebuilds the transcript; the joined text is only
+    produced when asked for. ``version`` changes with every update, so a
+    reader can skip redundant work.
+
+    Results arrive on the transcription thread and are read from the UI
+    thread, so access is locked.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.segments: List[Segment] = []
+            self.interim: Optional[Segment] = None
+            self.version = 0
+            self._final_text: Optional[str] = ""
+
+    def add(
+        self,
+        text: str,
+        is_final: bool,
+        confidence: float = 0.0,
+        words: Sequence[Any] = (),
+    ):
+        """Add a transcription result."""
+        segment = Segment(
+            text=text.strip(),
+            confidence=confidence,
+            words=[Word.from_result(word) for word in words or ()],
+        )
+        with self._lock:
+            if is_final:
+                self.interim = None
+                if segment.text:
+                    self.segments.append(segment)
+                    self._final_text = None
+            else:
+                self.interim = segment if segment.text else None
+            self.version += 1
+
+    @property
+    def final_text(self) -> str:
+        """The finalized text so far."""
+        with self._lock:
+            return self._joined_final()
+
+    @property
+    def display_text(self) -> str:
+        """The finalized text followed by the current hypothesis."""
+        with self._lock:
+            final = self._joined_final()
+            if self.interim is None:
+                return final
+            return f"{final} {self.interim.text}".strip()
+
+    def _joined_final(self) -> str:
+        if self._final_text is None:
+            self._final_text = " ".join(segment.text for segment in self.segments)
+        return self._final_text
+
+    @property
+    def words(self) -> List[Word]:
+        """Words of the finalized segments, in order."""
+        with self._lock:
+            return [word for segment in self.segments for word in segment.words]
+
+    @property
+    def confidence(self) -> float:
+        """Mean word confidence of the finalized text.
+
+        Falls back to the segment confidences, weighted by length, when no
+        word-level results were received.
+        """
+        words = self.words
+        if words:
+            return sum(word.confidence for word in words) / len(words)
+        with self._lock:
+            weights = [len(segment.text) for segment in self.segments]
+            if not sum(weights):
+                return 0.0
+            total = sum(
+                segment.confidence * weight
+                for segment, weight in zip(self.segments, weights)
+            )
+            return total / sum(weights)
+
+    def result(self) -> Dict[str, Any]:
+        """The finalized transcript as text, confidence and words."""
+        return {
+            "text": self.final_text,
+            "confidence": self.confidence,
+            "words": [asdict(word) for word in self.words],
+        }
@@ -0,0 +1,188 @@
+"""Content-addressed on-disk cache of synthesized speech."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, Optional
+from .config import config
+
+logger = logging.getLogger(__name__)
+
+SUFFIX = ".pcm"
+
+
+def cache_key(
+    text: str, voice_id: str, model_id: str, output_format: str, **voice_settings
+) -> str:
+    """Hash of everything that determines the synthesized audio."""
+    payload = json.dumps(
+        {
+            "text": text,
+            "voice_id": voice_id,
+            "model_id": model_id,
+            "output_format": output_format,
+            "voice_settings": voice_settings,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class TTSCache:
+    """Size-bounded LRU of audio clips stored one file per key.
+
+    The LRU order and sizes are kept in memory and rebuilt from file
+    modification times on startup; hits refresh the mtime so the order
+    survives restarts. The last ``MISS_HISTORY`` missed keys are remembered,
+    so callers can store only lines that are asked for more than once.
+    """
+
+    CHUNK_SIZE = 16384
+    MISS_HISTORY = 1024
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._missed: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._load_index()
+
+    @property
+    def size(self) -> int:
+        """Total bytes of cached audio."""
+        return self._size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{SUFFIX}"
+
+    def _load_index(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+        self._evict()
+        logger.info(f"TTS cache: {len(self._index)} clips, {self._size / 1e6:.1f} MB")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def lookup(self, key: str) -> bool:
+        """Whether a key is cached, counted as a hit or miss.
+
+        The clip's file is checked, so entries removed from disk are misses.
+        """
+        if self._touch(key):
+            self.hits += 1
+            return True
+        self.misses += 1
+        self._missed[key] = self._missed.pop(key, 0) + 1
+        if len(self._missed) > self.MISS_HISTORY:
+            self._missed.popitem(last=False)
+        return False
+
+    def repeated(self, key: str) -> bool:
+        """Whether a key has been looked up and missed more than once."""
+        return self._missed.get(key, 0) > 1
+
+    def _touch(self, key: str) -> bool:
+        """Mark a key as recently used; False if it is not cached."""
+        if key not in self._index:
+            return False
+        self._index.move_to_end(key)
+        try:
+            os.utime(self._path(key))
+        except FileNotFoundError:
+            self._forget(key)
+            return False
+        return True
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached audio for a key, if any."""
+        if not self._touch(key):
+            return None
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+
+    async def stream(self, key: str) -> AsyncIterator[bytes]:
+        """Yield cached audio in chunks; yields nothing on a miss."""
+        if not self._touch(key):
+            return
+        try:
+            with open(self._path(key), "rb") as f:
+                while True:
+                    chunk = await asyncio.to_thread(f.read, self.CHUNK_SIZE)
+                    if not chunk:
+                        return
+                    yield chunk
+        except FileNotFoundError:
+            self._forget(key)
+
+    async def put(self, key: str, audio: bytes):
+        """Store audio under a key, evicting the least recently used clips.
+
+        The file is written off the event loop thread.
+        """
+        if not audio or len(audio) > self.max_bytes:
+            return
+        try:
+            await asyncio.to_thread(self._write, self._path(key), audio)
+        except OSError as e:
+            logger.error(f"Error writing TTS cache entry: {e}")
+            return
+
+        self._missed.pop(key, None)
+        self._size += len(audio) - self._index.pop(key, 0)
+        self._index[key] = len(audio)
+        self._evict()
+
+    @staticmethod
+    def _write(path: Path, audio: bytes):
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(audio)
+        os.replace(temp_path, path)
+
+    def _evict(self):
+        while self._size > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            self._forget(key)
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _forget(self, key: str):
+        self._size -= self._index.pop(key, 0)
+
+    def clear(self):
+        """Remove every cached clip."""
+        for key in list(self._index):
+            self._forget(key)
+            self._path(key).unlink(missing_ok=True)
+
+
+_tts_cache: Optional[TTSCache] = None
+
+
+def get_tts_cache() -> TTSCache:
+    """Get the global TTS cache under ``config.data_dir``."""
+    global _tts_cache
+    if _tts_cache is None:
+        _tts_cache = TTSCache(
+            Path(config.data_dir) / "tts_cache",
+            max_bytes=int(config.audio.tts_cache_max_mb * 1024 * 1024),
+        )
+    return _tts_cache
@@ -0,0 +1,157 @@
+"""ElevenLabs text-to-speech client over a pooled aiohttp session."""
+
+import asyncio
+import base64
+import json
+import logging
+from typing import TYPE_CHECKING, AsyncIterator, Optional, Tuple
+from .config import config
+from .resilience import ProviderHTTPError
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class TextToSpeechStream:
+    """A websocket synthesis session fed with text as it is produced.
+
+    Text pushed with ``send`` is synthesized as soon as the service has
+    enough of it; iterate the stream for the audio chunks, or ``aligned``
+    for the chunks with the text they speak. ``end`` signals that no more
+    text will follow.
+    """
+
+    def __init__(self, ws: "aiohttp.ClientWebSocketResponse"):
+        self._ws = ws
+        self._ended = False
+
+    async def send(self, text: str, flush: bool = False):
+        """Push more text; ``flush`` forces synthesis of what is buffered."""
+        if not text.strip() or self._ended:
+            return
+        # The service expects every text chunk to end with a space
+        message = {"text": text if text.endswith(" ") else text + " "}
+        if flush:
+            message["flush"] = True
+        await self._ws.send_str(json.dumps(message))
+
+    async def end(self):
+        """No more text; the service finishes synthesis and closes."""
+        if not self._ended:
+            self._ended = True
+            await self._ws.send_str(json.dumps({"text": ""}))
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for audio, _ in self.aligned():
+            yield audio
+
+    async def aligned(self) -> AsyncIterator[Tuple[bytes, Optional[str]]]:
+        """Audio chunks with the input text each one speaks.
+
+        The text is None when the service sent no alignment for a chunk.
+        """
+        import aiohttp
+
+        async for message in self._ws:
+            if message.type != aiohttp.WSMsgType.TEXT:
+                break
+            data = json.loads(message.data)
+            if data.get("error"):
+                raise ProviderHTTPError(500, f"ElevenLabs error: {data['error']}")
+            if data.get("audio"):
+                alignment = data.get("alignment")
+                text = "".join(alignment["chars"]) if alignment else None
+                yield base64.b64decode(data["audio"]), text
+            if data.get("isFinal"):
+                break
+
+    async def aclose(self):
+        await self._ws.close()
+
+
+class ElevenLabsClient:
+    """Streaming ElevenLabs client that keeps its connections warm.
+
+    One aiohttp session is shared by every request, so DNS, TCP and TLS setup
+    are paid once rather than per sentence.
+    """
+
+    CHUNK_SIZE = 4096
+
+    def __init__(self, api_key: str, base_url: str, model_id: str):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.model_id = model_id
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """The shared session, created on first use in the running loop."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                headers={"xi-api-key": self.api_key},
+                connector=aiohttp.TCPConnector(
+                    limit=config.audio.tts_max_connections,
+                    keepalive_timeout=config.audio.tts_keepalive,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    connect=config.audio.tts_connect_timeout,
+                    sock_read=config.audio.tts_read_timeout,
+                ),
+            )
+        return self._session
+
+    async def warm_up(self):
+        """Open a connection ahead of the first synthesis request."""
+        try:
+            async with self.session.get(f"{self.base_url}/models") as response:
+                await response.read()
+        except Exception as e:
+            logger.warning(f"ElevenLabs warm-up failed: {e}")
+
+    async def stream(
+        self, text: str, voice_id: str, voice_settings: dict, output_format: str
+    ) -> AsyncIterator[bytes]:
+        """Stream audio for a complete text from the HTTP streaming endpoint."""
+        async with self.session.post(
+            f"{self.base_url}/text-to-speech/{voice_id}/stream",
+            params={"output_format": output_format},
+            json={
+                "text": text,
+                "model_id": self.model_id,
+                "voice_settings": voice_settings,
+            },
+        ) as response:
+            if response.status >= 400:
+                raise ProviderHTTPError(
+                    response.status, f"ElevenLabs API error: {await response.text()}"
+                )
+            async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                yield chunk
+
+    async def stream_input(
+        self, voice_id: str, voice_settings: dict, output_format: str
+    ) -> TextToSpeechStream:
+        """Open a websocket session that takes text incrementally."""
+        ws_url = self.base_url.replace("https://", "wss://", 1).replace(
+            "http://", "ws://", 1
+        )
+        ws = await self.session.ws_connect(
+            f"{ws_url}/text-to-speech/{voice_id}/stream-input",
+            params={"model_id": self.model_id, "output_format": output_format},
+        )
+        # The first message configures the session
+        await ws.send_str(json.dumps({"text": " ", "voice_settings": voice_settings}))
+        return TextToSpeechStream(ws)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            # Give the connector a moment to close its transports
+            await asyncio.sleep(0)
@@ -0,0 +1,180 @@
+"""Concurrent synthesis of speech segments with in-order output."""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Streams the audio for one text segment
+SegmentSynthesizer = Callable[[str], AsyncIterator[bytes]]
+
+
+class SpokenText:
+    """Maps positions in a stream of synthesized audio back to its text.
+
+    Used to tell how much of a response was actually heard when playback
+    is cut short. Segments are either whole texts, such as sentences, or
+    the exact pieces of text reported for each chunk of streamed audio.
+    """
+
+    def __init__(self):
+        # [text, first audio byte, end audio byte] per segment, in order
+        self.segments: List[list] = []
+        self.played = 0  # audio bytes that reached the speaker
+        self._aligned = False  # segments are pieces of one text
+
+    def start(self, text: str):
+        """Audio for a new segment follows."""
+        end = self.segments[-1][2] if self.segments else 0
+        self.segments.append([text, end, end])
+
+    def add_audio(self, size: int):
+        """Audio bytes for the current segment arrived."""
+        if not self.segments:
+            self.start("")
+        self.segments[-1][2] += size
+
+    def add_aligned(self, size: int, text: Optional[str]):
+        """Streamed audio that speaks exactly ``text``, a piece of the input.
+
+        Without alignment (``text`` None) the audio continues the current
+        piece.
+        """
+        self._aligned = True
+        if text is None:
+            self.add_audio(size)
+            return
+        self.start(text)
+        self.segments[-1][2] += size
+
+    @property
+    def text(self) -> str:
+        if self._aligned:
+            return " ".join("".join(text for text, _, _ in self.segments).split())
+        return " ".join(text for text, _, _ in self.segments).strip()
+
+    def heard(self) -> str:
+        """The text spoken in the ``played`` bytes of audio.
+
+        Within a partly played segment, words (or for aligned pieces,
+        characters) are assumed to be spread evenly over its audio. Segments
+        without audio, such as failed sentences, were not heard.
+        """
+        parts = []
+        for text, start, end in self.segments:
+            if end == start:
+                continue
+            if self.played >= end:
+                parts.append(text)
+                continue
+            if self.played > start:
+                fraction = (self.played - start) / (end - start)
+                if self._aligned:
+                    parts.append(text[: int(len(text) * fraction)])
+                else:
+                    words = text.split()
+                    parts.append(" ".join(words[: int(len(words) * fraction)]))
+            break
+        if not self._aligned:
+            return " ".join(part for part in parts if part).strip()
+
+        heard = "".join(parts)
+        full = "".join(text for text, _, _ in self.segments)
+        # Leave out a word that was cut off part way
+        if len(heard) < len(full) and not full[len(heard)].isspace():
+            heard = heard[: max(heard.rfind(" "), 0)]
+        return " ".join(heard.split())
+
+
+class SynthesisScheduler:
+    """Synthesize segments concurrently and yield their audio in order.
+
+    Up to ``max_parallel`` segments are synthesized at once. The segment
+    being played streams straight through; later ones buffer their chunks
+    until it is their turn, so playback of the first segment starts while
+    the rest are still being produced.
+
+        scheduler = SynthesisScheduler(synthesize, max_parallel=3)
+        scheduler.submit("First sentence.")
+        scheduler.submit("Second one.")
+        scheduler.close()
+        async for chunk in scheduler:
+            playback.write(chunk)
+
+    ``spoken`` maps the audio yielded so far back to the segments' text.
+    A segment whose synthesis fails is skipped, or with ``skip_failed``
+    False its error is raised from the iteration.
+    """
+
+    def __init__(
+        self,
+        synthesize: SegmentSynthesizer,
+        max_parallel: int = 3,
+        spoken: Optional[SpokenText] = None,
+        skip_failed: bool = True,
+    ):
+        self.synthesize = synthesize
+        self.skip_failed = skip_failed
+        self._slots = asyncio.Semaphore(max_parallel)
+        self._segments: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+        self._closed = False
+        self.spoken = spoken or SpokenText()
+
+    def submit(self, text: str):
+        """Queue a segment for synthesis."""
+        if self._closed:
+            raise RuntimeError("Scheduler is closed")
+        chunks: asyncio.Queue = asyncio.Queue()
+        self._tasks.append(asyncio.create_task(self._run(text, chunks)))
+        self._segments.put_nowait((text, chunks))
+
+    def close(self):
+        """No more segments will be submitted."""
+        if not self._closed:
+            self._closed = True
+            self._segments.put_nowait(None)
+
+    def cancel(self):
+        """Stop all synthesis in progress."""
+        self.close()
+        for task in self._tasks:
+            task.cancel()
+
+    async def _run(self, text: str, chunks: asyncio.Queue):
+        try:
+            async with self._slots:
+                stream = self.synthesize(text)
+                try:
+                    async for chunk in stream:
+                        chunks.put_nowait(chunk)
+                finally:
+                    await stream.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Speech synthesis error for segment {text[:40]!r}: {e}")
+            if not self.skip_failed:
+                chunks.put_nowait(e)
+        finally:
+            chunks.put_nowait(None)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            while True:
+                segment: Optional[tuple] = await self._segments.get()
+                if segment is None:
+                    return
+                text, chunks = segment
+                self.spoken.start(text)
+                while True:
+                    chunk = await chunks.get()
+                    if chunk is None:
+                        break
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    self.spoken.add_audio(len(chunk))
+                    yield chunk
+        finally:
+            self.cancel()
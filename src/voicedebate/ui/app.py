@@ -8,20 +8,29 @@ from typing import Optional
 from kivy.lang import Builder
 from kivy.core.window import Window
 from kivy.clock import Clock
-from kivy.core.audio import SoundLoader
 from kivy.properties import ObjectProperty, StringProperty
 from kivymd.app import MDApp
 from kivymd.uix.screen import MDScreen
-from kivymd.uix.button import MDRaisedButton
+from kivymd.uix.button import MDFlatButton, MDRaisedButton
 from kivymd.uix.dialog import MDDialog
 from kivymd.uix.list import OneLineIconListItem, MDList
 from kivymd.uix.card import MDCard
 from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.textfield import MDTextField
 from kivymd.icon_definitions import md_icons
 from voicedebate.config import config
-from voicedebate.speech import SpeechProcessor, speech_processor
-from voicedebate.assistant import AssistantManager, assistant_manager
+from voicedebate.speech import SpeechProcessor, get_speech_processor
+from voicedebate.assistant import AssistantManager, get_assistant_manager
+from voicedebate.llm_clients import llm_clients
 from voicedebate.conversation_logger import conversation_logger
+from voicedebate import metrics
+from voicedebate.metrics import TurnTimeline, turn_metrics
+from voicedebate.playback import get_audio_player
+from voicedebate.sentences import SentenceSplitter
+from voicedebate.speculation import SpeculativeResponder
+from voicedebate.tts_scheduler import SpokenText
+from voicedebate import vad
+from voicedebate.vad import VADEvent
 import uuid
 import random
 from enum import Enum
@@ -75,6 +84,13 @@ KV = """
                 icon_size: "64dp"
                 size_hint: None, None
                 size: "120dp", "120dp"
+
+            MDIconButton:
+                icon: "forum"
+                on_release: root.show_debate_dialog()
+                icon_size: "64dp"
+                size_hint: None, None
+                size: "120dp", "120dp"
             
             # Center text
             MDLabel:
@@ -154,7 +170,10 @@ class DebateScreen(MDScreen):
     current_assistant = StringProperty("")
     _recording = False
     _assistant_dialog = None
-    _current_sound = None  # Track current playing sound
+    _debate_dialog = None
+    _speculator = None  # Speculative responder for the current turn
+    _debate = None  # Running AI-vs-AI debate, if any
+    _response_task = None  # Assistant response being generated and spoken
     state = ConversationState.IDLE
 
     def __init__(self, **kwargs):
@@ -162,7 +181,11 @@ class DebateScreen(MDScreen):
         self.app = None  # Will be set by VoiceDebateApp.build()
         self._recording = False
         self._assistant_dialog = None
-        self._current_sound = None
+        self._debate_dialog = None
+        self._speculator = None
+        self._debate = None
+        self._response_task: Optional[asyncio.Task] = None
+        self._speech_end: Optional[float] = None
         self.state = ConversationState.IDLE
 
     def add_message(self, speaker: str, message: str):
@@ -197,19 +220,44 @@ class DebateScreen(MDScreen):
             logger.error(f"Error in recording toggle: {e}")
             self._recording = False
 
+    def _get_assistant(self, name: str):
+        """Get an assistant bound to this app instance's session."""
+        return self.app.assistant_manager.get_assistant(
+            name, session_id=self.app.instance_id
+        )
+
     async def start_listening(self):
         """Start listening for user input."""
         self.current_transcript_label.text = "Listening..."
+
+        finishing_callback = None
+        if config.llm.speculative and self.current_assistant:
+            assistant = self._get_assistant(self.current_assistant)
+            if assistant:
+                self._speculator = SpeculativeResponder(
+                    assistant, min_words=config.llm.speculative_min_words
+                )
+                finishing_callback = self._speculator.on_finishing
+
         await self.app.speech_processor.start_capture(
             transcript_callback=self.handle_transcript,
             vad_callback=self.handle_voice_activity,
+            finishing_callback=finishing_callback,
         )
         self._recording = True
         self.update_state(ConversationState.LISTENING)
 
     async def stop_listening(self):
         """Stop listening and process the input."""
+        timeline = TurnTimeline()
+        timeline.mark(metrics.SPEECH_END, self._speech_end)
+        self._speech_end = None
+
+        if config.audio.barge_in and self.current_assistant:
+            # Barge-in detection during the response takes over the microphone
+            self.app.speech_processor.hold_microphone()
         _, transcription = await self.app.speech_processor.stop_capture()
+        timeline.mark(metrics.FINAL_TRANSCRIPT)
         self._recording = False
         self.update_state(ConversationState.PROCESSING)
 
@@ -218,85 +266,352 @@ class DebateScreen(MDScreen):
             self.add_message("You", user_text)
 
             if self.current_assistant:
-                await self._get_and_display_ai_response(user_text)
-
-    def handle_voice_activity(self, is_speaking: bool, silence_duration: float):
-        """Handle voice activity detection."""
-        if not is_speaking and silence_duration > 2.0:  # 2 seconds of silence
-            if self._recording:
-                # Schedule the stop_listening call using Kivy's Clock
-                Clock.schedule_once(
-                    lambda dt: asyncio.create_task(self.stop_listening()), 0
+                # Run the response as its own task so barge-in can cancel it
+                self._response_task = asyncio.create_task(
+                    self._get_and_display_ai_response(user_text, timeline)
                 )
+                await asyncio.wait([self._response_task])
+        else:
+            # Only noise ended the turn; keep listening
+            self._on_audio_complete()
 
-    async def _get_and_display_ai_response(self, user_text: str):
+    def handle_voice_activity(self, event: VADEvent):
+        """End the turn when the local voice activity detector hears the
+        speaker stop."""
+        if event.kind == vad.SPEECH_END and self._recording:
+            self._speech_end = event.at
+            asyncio.create_task(self.stop_listening())
+
+    def handle_barge_in(self, event: VADEvent):
+        """The user started talking over the assistant: stop it and listen."""
+        task = self._response_task
+        if task is None or task.done():
+            return
+        logger.info("User interrupted the assistant")
+        # The user is talking; keep the microphone running into the capture
+        self.app.speech_processor.hold_microphone()
+        # Cancel first so the response cannot carry on once its audio stops
+        task.cancel()
+        self.app.audio_player.stop()
+        asyncio.create_task(self.start_listening())
+
+    async def _get_and_display_ai_response(
+        self, user_text: str, timeline: Optional[TurnTimeline] = None
+    ):
         """Get and display AI response in the background."""
+        timeline = timeline or TurnTimeline()
+        if config.audio.barge_in:
+            self.app.speech_processor.start_monitoring(self.handle_barge_in)
         try:
             # Log user's message
             conversation_logger.log_turn("User", user_text)
 
-            assistant = self.app.assistant_manager.get_assistant(self.current_assistant)
+            assistant = self._get_assistant(self.current_assistant)
+            if assistant and await self._play_scripted_response(
+                assistant, user_text, timeline
+            ):
+                assistant = None
+
             if assistant:
                 self.add_message(self.current_assistant, "Thinking...")
-
-                response_text = await assistant.generate_response(user_text)
                 last_card = self.chat_layout.children[0]
-                if isinstance(last_card, MessageCard):
-                    last_card.message = response_text
 
-                # Log assistant's response with model info
-                conversation_logger.log_turn(
-                    self.current_assistant, response_text, model=assistant.config.model
+                # Hand each finished sentence to TTS while the model is still
+                # generating the rest of the response.
+                sentences: asyncio.Queue = asyncio.Queue()
+                spoken = SpokenText()
+                speaker = asyncio.create_task(
+                    self._speak_sentences(assistant, sentences, timeline, spoken)
+                )
+                splitter = SentenceSplitter()
+                response_text = ""
+                committed = False
+                deltas = self._response_deltas(assistant, user_text, timeline)
+
+                try:
+                    try:
+                        async for delta in deltas:
+                            response_text += delta
+                            if isinstance(last_card, MessageCard):
+                                last_card.message = response_text.strip()
+                            for sentence in splitter.feed(delta):
+                                sentences.put_nowait(sentence)
+
+                        # The assistant commits the turn once the response
+                        # has been generated in full
+                        committed = True
+                        remainder = splitter.flush()
+                        if remainder:
+                            sentences.put_nowait(remainder)
+                    finally:
+                        sentences.put_nowait(None)
+                        await deltas.aclose()
+
+                    await speaker
+                except asyncio.CancelledError:
+                    speaker.cancel()
+                    await asyncio.wait([speaker])
+                    self._record_interruption(
+                        assistant,
+                        user_text,
+                        spoken,
+                        assistant.config.model,
+                        timeline,
+                        committed,
+                        last_card,
+                    )
+                    raise
+
+                # Log assistant's response with model info and turn timings
+                self._log_response(
+                    response_text.strip(), assistant.config.model, timeline
                 )
 
-                audio = await self.app.speech_processor.synthesize_speech(
-                    text=response_text,
+            self._on_audio_complete()
+
+        except Exception as e:
+            logger.error(f"Error getting AI response: {e}")
+            self._on_audio_complete()
+        finally:
+            self.app.speech_processor.stop_monitoring()
+
+    def _log_response(
+        self,
+        text: str,
+        model: str,
+        timeline: TurnTimeline,
+        interrupted: bool = False,
+    ):
+        """Log an assistant turn and add its timings to the histograms."""
+        turn_metrics.record(timeline)
+        timings = timeline.to_dict()
+        logger.info(f"Turn timings (ms): {timings['intervals']}")
+        conversation_logger.log_turn(
+            self.current_assistant,
+            text,
+            model=model,
+            timings=timings,
+            interrupted=interrupted,
+        )
+
+    def _record_interruption(
+        self,
+        assistant,
+        user_text: str,
+        spoken: SpokenText,
+        model: str,
+        timeline: TurnTimeline,
+        committed: bool,
+        card=None,
+    ):
+        """Keep only the part of a cut-off response the user actually heard.
+
+        ``committed`` says whether the full response is already in the
+        assistant's history.
+        """
+        heard = spoken.heard()
+        logger.info(f"Response interrupted after: {heard!r}")
+        assistant.record_interruption(user_text, heard, committed)
+        if isinstance(card, MessageCard):
+            card.message = f"{heard}…" if heard else "…"
+        self._log_response(heard, model, timeline, interrupted=True)
+
+    async def _play_scripted_response(
+        self, assistant, user_text: str, timeline: TurnTimeline
+    ) -> bool:
+        """Answer with a pre-synthesized scripted line, skipping the LLM.
+
+        Returns False when no scripted line is used for this turn.
+        """
+        response_text = assistant.pick_scripted_response()
+        if not response_text:
+            return False
+        audio = self.app.speech_processor.get_presynthesized(
+            response_text, assistant.config.voice_id
+        )
+        if not audio:
+            return False
+
+        if self._speculator:
+            self._speculator.cancel()
+            self._speculator = None
+
+        self.add_message(self.current_assistant, response_text)
+        card = self.chat_layout.children[0]
+        assistant.commit_turn(user_text, response_text)
+        spoken = SpokenText()
+        spoken.start(response_text)
+        spoken.add_audio(len(audio))
+        try:
+            await self._play_audio(audio, timeline, spoken)
+        except asyncio.CancelledError:
+            self._record_interruption(
+                assistant, user_text, spoken, "scripted", timeline, True, card
+            )
+            raise
+        self._log_response(response_text, "scripted", timeline)
+        return True
+
+    async def _response_deltas(self, assistant, user_text: str, timeline: TurnTimeline):
+        """Yield response text, using a matching speculative response if any."""
+        timeline.mark(metrics.LLM_REQUEST)
+        speculator, self._speculator = self._speculator, None
+        if speculator:
+            response = await speculator.resolve(user_text)
+            if response is not None:
+                timeline.mark(metrics.FIRST_TOKEN)
+                timeline.mark(metrics.LAST_TOKEN)
+                yield response
+                return
+
+        async for delta in assistant.stream_response(user_text):
+            timeline.mark(metrics.FIRST_TOKEN)
+            timeline.mark(metrics.LAST_TOKEN)
+            yield delta
+
+    async def _speak_sentences(
+        self,
+        assistant,
+        sentences: asyncio.Queue,
+        timeline: TurnTimeline,
+        spoken: SpokenText,
+    ):
+        """Synthesize queued sentences and play the audio as it streams in.
+
+        Sentences are synthesized concurrently as they arrive and played in
+        order through one playback, so speech starts with the first audio
+        chunk and continues without gaps. ``spoken`` tracks how much of the
+        text has been played.
+        """
+        if config.audio.tts_streaming_input:
+            try:
+                stream = await self.app.speech_processor.stream_input(
                     voice_id=assistant.config.voice_id,
                     stability=assistant.config.voice_stability,
                     clarity=assistant.config.voice_clarity,
                     style=assistant.config.voice_style,
                 )
+            except Exception as e:
+                logger.warning(f"TTS input streaming unavailable, using HTTP: {e}")
+            else:
+                await self._speak_streaming_input(stream, sentences, timeline, spoken)
+                return
+
+        scheduler = self.app.speech_processor.scheduler(
+            voice_id=assistant.config.voice_id,
+            stability=assistant.config.voice_stability,
+            clarity=assistant.config.voice_clarity,
+            style=assistant.config.voice_style,
+            timeline=timeline,
+            spoken=spoken,
+        )
 
-                if audio:
-                    try:
-                        temp_path = (
-                            Path(config.data_dir)
-                            / f"temp_audio_{self.app.instance_id}.wav"
-                        )
-                        temp_path.write_bytes(audio)
-
-                        sound = SoundLoader.load(str(temp_path))
-                        if sound:
-                            self._current_sound = sound
-                            sound.bind(on_stop=self._on_audio_complete)
-                            sound.play()
-                        else:
-                            logger.error("Failed to load audio file")
-                            self._on_audio_complete()
-                    except Exception as e:
-                        logger.error(f"Error playing audio: {e}")
-                        self._on_audio_complete()
-                else:
-                    self._on_audio_complete()
+        async def submit():
+            while True:
+                sentence = await sentences.get()
+                if sentence is None:
+                    break
+                scheduler.submit(sentence)
+            scheduler.close()
 
+        submitter = asyncio.create_task(submit())
+        playback = self.app.audio_player.open()
+        try:
+            async for chunk in scheduler:
+                playback.write(chunk)
+            playback.finish()
+            await playback.wait()
+        finally:
+            submitter.cancel()
+            scheduler.cancel()
+            self._end_playback(playback, timeline, spoken)
+
+    async def _speak_streaming_input(
+        self,
+        stream,
+        sentences: asyncio.Queue,
+        timeline: TurnTimeline,
+        spoken: SpokenText,
+    ):
+        """Push sentences into one websocket TTS session and play its audio."""
+
+        async def push():
+            while True:
+                sentence = await sentences.get()
+                if sentence is None:
+                    break
+                await stream.send(sentence)
+            await stream.end()
+
+        pusher = asyncio.create_task(push())
+        playback = self.app.audio_player.open()
+        try:
+            async for chunk, text in stream.aligned():
+                timeline.mark(metrics.TTS_FIRST_BYTE)
+                spoken.add_aligned(len(chunk), text)
+                playback.write(chunk)
+            timeline.mark(metrics.TTS_LAST_BYTE)
+            playback.finish()
+            await playback.wait()
+        finally:
+            pusher.cancel()
+            self._end_playback(playback, timeline, spoken)
+            await stream.aclose()
+
+    async def _play_audio(
+        self,
+        audio: bytes,
+        timeline: Optional[TurnTimeline] = None,
+        spoken: Optional[SpokenText] = None,
+    ):
+        """Play an audio clip and wait for it to finish."""
+        playback = None
+        try:
+            playback = self.app.audio_player.open()
+            playback.write(audio)
+            playback.finish()
+            await playback.wait()
         except Exception as e:
-            logger.error(f"Error getting AI response: {e}")
-            self._on_audio_complete()
+            logger.error(f"Error playing audio: {e}")
+        finally:
+            if playback:
+                self._end_playback(playback, timeline, spoken)
+
+    def _end_playback(
+        self,
+        playback,
+        timeline: Optional[TurnTimeline],
+        spoken: Optional[SpokenText] = None,
+    ):
+        """Stop a playback if it is still going and record how far it got."""
+        if not playback.done:
+            playback.stop()
+        if spoken:
+            spoken.played = playback.played_samples * 2  # 16-bit samples
+        if timeline:
+            self._mark_playback(playback, timeline)
+
+    def _mark_playback(self, playback, timeline: TurnTimeline):
+        if playback.started_at is not None:
+            timeline.mark(metrics.PLAYBACK_START, playback.started_at)
+            timeline.mark(metrics.PLAYBACK_END, playback.ended_at)
 
     def _on_audio_complete(self, *args):
         """Handle completion of audio playback."""
-        self._current_sound = None
 
-        # Add a small delay before starting to listen again
-        async def delayed_start():
-            self.current_transcript_label.text = "Starting new turn..."
-            await asyncio.sleep(1.0)  # 1 second delay
+        # The transcription connection and microphone are already open, so
+        # listening can resume straight away
+        self.app.speech_processor.hold_microphone()
+
+        async def next_turn():
             if (
                 self.state != ConversationState.IDLE
             ):  # Only restart if we haven't been interrupted
                 await self.start_listening()
+            else:
+                self.app.speech_processor.hold_microphone(False)
 
-        asyncio.create_task(delayed_start())
+        asyncio.create_task(next_turn())
 
     def show_assistant_dialog(self):
         """Show dialog to select AI assistant."""
@@ -347,6 +662,22 @@ class DebateScreen(MDScreen):
             if self._assistant_dialog:
                 self._assistant_dialog.dismiss()
 
+            # Connect to the transcription service while the dialog closes
+            self.app.schedule_async(self.app.speech_processor.open_session())
+
+            # Prepare audio for scripted responses in the background
+            assistant = self._get_assistant(name)
+            if assistant:
+                self.app.schedule_async(
+                    self.app.speech_processor.presynthesize(
+                        assistant.scripted_responses,
+                        voice_id=assistant.config.voice_id,
+                        stability=assistant.config.voice_stability,
+                        clarity=assistant.config.voice_clarity,
+                        style=assistant.config.voice_style,
+                    )
+                )
+
             # Start new conversation
             logger.info(f"Starting new conversation with {name}")
             conversation_id = conversation_logger.start_conversation(name)
@@ -361,10 +692,83 @@ class DebateScreen(MDScreen):
         """Clear chat history."""
         self.chat_layout.clear_widgets()
         if self.current_assistant:
-            assistant = self.app.assistant_manager.get_assistant(self.current_assistant)
+            assistant = self._get_assistant(self.current_assistant)
             if assistant:
                 assistant.clear_history()
 
+    def show_debate_dialog(self):
+        """Ask for a topic and let all the assistants debate it."""
+        if self._debate:
+            return
+        if not self._debate_dialog:
+            topic_field = MDTextField(hint_text="Debate topic", font_size="32sp")
+
+            def start(*args):
+                topic = topic_field.text.strip()
+                if topic:
+                    self._debate_dialog.dismiss()
+                    self.app.schedule_async(self._begin_debate(topic))
+
+            self._debate_dialog = MDDialog(
+                title="Start a Debate",
+                type="custom",
+                content_cls=topic_field,
+                buttons=[
+                    MDFlatButton(
+                        text="Cancel",
+                        on_release=lambda x: self._debate_dialog.dismiss(),
+                    ),
+                    MDFlatButton(text="Start", on_release=start),
+                ],
+                size_hint=(0.9, None),
+                md_bg_color=self.theme_cls.bg_dark,
+                radius=[20, 20, 20, 20],
+                elevation=10,
+            )
+        self._debate_dialog.open()
+
+    async def _begin_debate(self, topic: str):
+        """End any conversation in progress and start a debate."""
+        if self.state != ConversationState.IDLE:
+            await self.stop_conversation()
+        await self.start_debate(self.app.assistant_manager.list_assistants(), topic)
+
+    async def start_debate(self, names: list[str], topic: str, turns: int = 6):
+        """Let the named assistants debate a topic with each other."""
+        # The debaters get their own session so the debate does not leak
+        # into the user's conversations with the same characters
+        debate_session = f"debate-{uuid.uuid4()}"
+        try:
+            self.add_message("Topic", topic)
+            speech_processor = self.app.speech_processor
+
+            async def synthesize(assistant, text: str) -> bytes:
+                return await speech_processor.synthesize_speech(
+                    text=text,
+                    voice_id=assistant.config.voice_id,
+                    stability=assistant.config.voice_stability,
+                    clarity=assistant.config.voice_clarity,
+                    style=assistant.config.voice_style,
+                )
+
+            self._debate = self.app.assistant_manager.create_debate(
+                names,
+                synthesize,
+                self._play_audio,
+                on_turn=self.add_message,
+                session_id=debate_session,
+            )
+            self.update_state(ConversationState.RESPONDING)
+            await self._debate.run(topic, turns)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error running debate: {e}")
+        finally:
+            self._debate = None
+            self.app.assistant_manager.end_session(debate_session)
+            self.update_state(ConversationState.IDLE)
+
     def update_state(self, new_state: ConversationState):
         """Update conversation state and UI."""
         self.state = new_state
@@ -388,9 +792,15 @@ class DebateScreen(MDScreen):
         try:
             if self._recording:
                 await self.stop_listening()
-            if self._current_sound:
-                self._current_sound.stop()
-                self._current_sound = None
+            if self._speculator:
+                self._speculator.cancel()
+                self._speculator = None
+            if self._debate:
+                self._debate.stop()
+            if self._response_task and not self._response_task.done():
+                self._response_task.cancel()
+            self.app.audio_player.stop()
+            await self.app.speech_processor.close_session()
             self.update_state(ConversationState.IDLE)
             self.current_transcript_label.text = ""
 
@@ -410,8 +820,9 @@ class VoiceDebateApp(MDApp):
         Path(config.data_dir).mkdir(parents=True, exist_ok=True)
 
         # Use global instances for now
-        self.assistant_manager = assistant_manager
-        self.speech_processor = speech_processor
+        self.assistant_manager = get_assistant_manager()
+        self.speech_processor = get_speech_processor()
+        self.audio_player = get_audio_player()
 
         # Generate unique instance ID
         self.instance_id = str(uuid.uuid4())
@@ -451,7 +862,8 @@ class VoiceDebateApp(MDApp):
 
     def on_start(self):
         """Called when the application starts."""
-        pass
+        # Open the TTS connection before the first response needs it
+        self.schedule_async(self.speech_processor.warm_up())
 
     def schedule_async(self, coro):
         """Schedule an async coroutine to run in the event loop."""
@@ -465,20 +877,18 @@ class VoiceDebateApp(MDApp):
                 logger.info("Ending conversation before app close")
                 conversation_logger.end_conversation()
 
-            # Clean up instance-specific resources
-            temp_path = Path(config.data_dir) / f"temp_audio_{self.instance_id}.wav"
-            if temp_path.exists():
-                temp_path.unlink()
+            self.audio_player.close()
 
             # Clean up any ongoing recording
             if hasattr(self.root, "_recording") and self.root._recording:
                 asyncio.create_task(self.root.toggle_recording())
 
-            # Clean up speech processor resources
-            if self.speech_processor.microphone:
-                self.speech_processor.microphone.finish()
-            if self.speech_processor.dg_connection:
-                self.speech_processor.dg_connection.finish()
+            turn_metrics.log_summary()
+
+            # Close the transcription session and pooled LLM and TTS connections
+            asyncio.get_event_loop().create_task(self.speech_processor.close_session())
+            asyncio.get_event_loop().create_task(llm_clients.close())
+            asyncio.get_event_loop().create_task(self.speech_processor.close())
 
         except Exception as e:
             logger.error(f"Error during app cleanup: {e}")
@@ -0,0 +1,229 @@
+"""Local voice activity detection on raw microphone audio."""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SPEECH_START = "speech_start"
+SPEECH_END = "speech_end"
+
+
+@dataclass
+class VADEvent:
+    """A change in voice activity.
+
+    ``at`` is the ``time.monotonic()`` time the audio frame that caused it
+    was captured: the first voiced frame for a start, the last voiced frame
+    for an end. ``decided_at`` is when the detector reached the decision.
+    """
+
+    kind: str
+    at: float
+    decided_at: float
+
+
+class VoiceActivityDetector:
+    """Energy and spectral-flux VAD with hangover for 16-bit mono PCM.
+
+    Audio is cut into fixed frames. A frame is voiced when its energy is
+    above ``min_energy_db`` and ``energy_margin_db`` above an adaptive noise
+    floor, or half that margin while its spectrum changes sharply (spectral
+    flux), which catches soft consonant onsets. Speech starts after
+    ``min_speech_ms`` of voiced frames and ends after ``hangover_ms`` of
+    unvoiced ones, or after ``max_speech_ms`` of speech. The noise floor
+    also follows voiced frames, ``voiced_adapt`` times as fast, so a lasting
+    rise in background noise stops passing for speech within seconds.
+
+    While audio is being played, ``process`` can be given its level as an
+    echo reference. Frames must then also clear ``energy_margin_db`` above
+    the estimated echo: the played level plus a microphone coupling gain,
+    which starts at ``echo_gain_db`` and is learned from unvoiced frames.
+
+    Features are computed for all frames of a chunk at once; only the small
+    state machine runs per frame. Decisions are made on the audio's own
+    sample clock, so they lag the audio by at most one frame and do not
+    depend on any network round trip.
+
+        vad = VoiceActivityDetector(on_event=print)
+        capture = AudioCapture(lambda data: (vad.process(data), send(data)))
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: int = 20,
+        energy_margin_db: float = 12.0,
+        min_energy_db: float = -55.0,
+        flux_threshold: float = 2.0,
+        min_speech_ms: int = 60,
+        hangover_ms: int = 800,
+        max_speech_ms: int = 30000,
+        noise_adapt: float = 0.05,
+        voiced_adapt: float = 0.002,
+        echo_gain_db: float = 0.0,
+        echo_adapt: float = 0.01,
+        on_event: Optional[Callable[[VADEvent], None]] = None,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_size = sample_rate * frame_ms // 1000
+        self.energy_margin_db = energy_margin_db
+        self.min_energy_db = min_energy_db
+        self.flux_threshold = flux_threshold
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.hangover_frames = max(1, hangover_ms // frame_ms)
+        self.max_speech_frames = max(1, max_speech_ms // frame_ms)
+        self.noise_adapt = noise_adapt
+        self.voiced_adapt = voiced_adapt
+        self.echo_adapt = echo_adapt
+        self._echo_gain_db = echo_gain_db
+        self.on_event = on_event
+        self._window = np.hanning(self.frame_size).astype(np.float32)
+        self._noise_db: Optional[float] = None
+        self.reset()
+
+    @property
+    def speaking(self) -> bool:
+        return self._speaking
+
+    def reset(self):
+        """Start over for a new utterance; the noise floor and echo gain
+        estimates are kept."""
+        self._pending = np.zeros(0, dtype=np.int16)
+        self._odd_byte = b""
+        self._previous_spectrum: Optional[np.ndarray] = None
+        self._speaking = False
+        self._voiced_run = 0
+        self._unvoiced_run = 0
+        self._speech_frames = 0
+        self._run_start: Optional[float] = None
+        self._last_voiced: Optional[float] = None
+
+    def process(
+        self,
+        pcm: bytes,
+        captured_at: Optional[float] = None,
+        echo_db: Optional[float] = None,
+    ) -> List[VADEvent]:
+        """Analyse a chunk of PCM bytes and return the events it caused.
+
+        ``captured_at`` is the monotonic time the end of the chunk was
+        captured; it defaults to now. ``echo_db`` is the level in dBFS of
+        the audio being played while it was captured, if any.
+        """
+        now = time.monotonic()
+        captured_at = now if captured_at is None else captured_at
+
+        if self._odd_byte:
+            pcm = self._odd_byte + pcm
+        usable = len(pcm) - len(pcm) % 2
+        self._odd_byte = pcm[usable:]
+        samples = np.concatenate(
+            [self._pending, np.frombuffer(pcm, dtype=np.int16, count=usable // 2)]
+        )
+
+        count = len(samples) // self.frame_size
+        self._pending = samples[count * self.frame_size :]
+        if not count:
+            return []
+
+        frames = samples[: count * self.frame_size].reshape(count, self.frame_size)
+        energy_db, flux = self._features(frames)
+
+        # Capture time of the end of each frame
+        frame_seconds = self.frame_size / self.sample_rate
+        pending_seconds = len(self._pending) / self.sample_rate
+        ends = captured_at - pending_seconds - frame_seconds * np.arange(count)[::-1]
+
+        events = []
+        for frame_energy, frame_flux, end in zip(energy_db, flux, ends):
+            event = self._step(
+                frame_energy, frame_flux, end, frame_seconds, now, echo_db
+            )
+            if event:
+                events.append(event)
+                if self.on_event:
+                    self.on_event(event)
+        return events
+
+    def _features(self, frames: np.ndarray):
+        """Per-frame energy in dBFS and normalised spectral flux."""
+        data = frames.astype(np.float32) / 32768.0
+        energy_db = 10 * np.log10(np.mean(data * data, axis=1) + 1e-10)
+
+        spectra = np.abs(np.fft.rfft(data * self._window, axis=1))
+        previous = (
+            spectra[:1] if self._previous_spectrum is None else self._previous_spectrum
+        )
+        spectra_with_previous = np.vstack([previous, spectra])
+        rises = np.maximum(np.diff(spectra_with_previous, axis=0), 0.0).sum(axis=1)
+        flux = rises / (spectra_with_previous[:-1].sum(axis=1) + 1e-6)
+        self._previous_spectrum = spectra[-1:]
+        return energy_db, flux
+
+    def _step(
+        self,
+        energy_db: float,
+        flux: float,
+        end: float,
+        frame_seconds: float,
+        now: float,
+        echo_db: Optional[float] = None,
+    ) -> Optional[VADEvent]:
+        if self._noise_db is None:
+            self._noise_db = energy_db
+        floor = self._noise_db
+        playing = echo_db is not None and echo_db > self.min_energy_db
+        if playing:
+            floor = max(floor, echo_db + self._echo_gain_db)
+        margin = energy_db - floor
+        voiced = energy_db > self.min_energy_db and (
+            margin > self.energy_margin_db
+            or (margin > self.energy_margin_db / 2 and flux > self.flux_threshold)
+        )
+
+        # Track the noise floor; follow drops at once, rises slowly, and
+        # rises during voiced frames more slowly still
+        if energy_db < self._noise_db:
+            self._noise_db = energy_db
+        else:
+            adapt = self.voiced_adapt if voiced else self.noise_adapt
+            self._noise_db += adapt * (energy_db - self._noise_db)
+
+        # Learn how loud the played audio is in the microphone; follow rises
+        # at once so the estimate errs towards treating sound as echo
+        if playing and not voiced:
+            coupling = energy_db - echo_db
+            if coupling > self._echo_gain_db:
+                self._echo_gain_db = coupling
+            else:
+                self._echo_gain_db += self.echo_adapt * (coupling - self._echo_gain_db)
+
+        if self._speaking:
+            self._speech_frames += 1
+            if self._speech_frames >= self.max_speech_frames:
+                self._speaking = False
+                self._voiced_run = self._unvoiced_run = 0
+                logger.debug("Speech reached the maximum length")
+                return VADEvent(SPEECH_END, self._last_voiced or end, now)
+
+        if voiced:
+            self._unvoiced_run = 0
+            self._last_voiced = end
+            if self._voiced_run == 0:
+                self._run_start = end - frame_seconds
+            self._voiced_run += 1
+            if not self._speaking and self._voiced_run >= self.min_speech_frames:
+                self._speaking = True
+                self._speech_frames = 0
+                return VADEvent(SPEECH_START, self._run_start, now)
+        else:
+            self._voiced_run = 0
+            self._unvoiced_run += 1
+            if self._speaking and self._unvoiced_run >= self.hangover_frames:
+                self._speaking = False
+                return VADEvent(SPEECH_END, self._last_voiced, now)
+        return None